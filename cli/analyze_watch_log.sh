@@ -0,0 +1,3 @@
+# !/bin/bash
+
+uv run --no-sync python -m common.watch_log_analyzer /app/.logs/*.log "$@"
\ No newline at end of file
@@ -0,0 +1,3 @@
+# !/bin/bash
+
+uv run --no-sync python -m benchmarks.startup_time --enforce_budget "$@"
\ No newline at end of file
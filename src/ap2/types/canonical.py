@@ -0,0 +1,161 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Canonical JSON and SHA-256 digests of the Agent Payments Protocol types.
+
+Mandates are bound to each other, and signed, by the digest of their canonical
+JSON form, so every agent must serialize a given mandate to exactly the same
+bytes. canonical_json follows the JSON Canonicalization Scheme (RFC 8785):
+object keys are sorted by their UTF-16 code units, there is no whitespace,
+strings are minimally escaped and numbers are written as ECMAScript writes
+them, e.g. 12.0 as 12 and 1e-07 as 1e-7.
+
+A model is canonicalized from its wire form (see wire.py). Computing a digest
+is comparatively slow, so digest remembers the digest of each model instance
+until the model is mutated or garbage collected.
+
+Pydantic models, and the lists and dicts in them, can be mutated in place
+without notice, so digest detects a mutation by comparing the model's
+model_dump_json() with the one it was digested from. A remembered digest
+therefore still costs a model_dump_json() of the whole model, which is an
+eighth to a twentieth of the cost of computing the digest afresh.
+"""
+
+import base64
+import decimal
+import hashlib
+import json
+import math
+from typing import Any
+import weakref
+
+from ap2.types import wire
+from pydantic import BaseModel
+
+# Maps id(model) to the (fingerprint, digest) last computed for that model.
+_digests: dict[int, tuple[str, str]] = {}
+
+
+def canonical_json(value: BaseModel | Any) -> bytes:
+  """Returns the canonical JSON form of a model or a JSON-compatible value.
+
+  Raises:
+    ValueError: If the value holds a NaN or infinite number.
+    TypeError: If the value is not JSON-compatible.
+  """
+  if isinstance(value, BaseModel):
+    value = wire.to_wire(value)
+  parts = []
+  _write(value, parts)
+  return "".join(parts).encode("utf-8")
+
+
+def digest(model: BaseModel) -> str:
+  """Returns the base64url-encoded SHA-256 digest of the model's canonical JSON.
+
+  The digest is computed once per model instance and reused until the model,
+  or any model nested in it, is mutated. Every call, including one that
+  reuses the digest, serializes the model with model_dump_json to find out.
+
+  Args:
+    model: The model to digest, e.g. a CartMandate.
+
+  Returns:
+    The unpadded base64url encoding of the digest.
+  """
+  # model_dump_json runs in pydantic-core and is much cheaper than
+  # canonicalizing, so it is used to detect that the model has changed.
+  fingerprint = model.model_dump_json()
+  key = id(model)
+  cached = _digests.get(key)
+  if cached is not None and cached[0] == fingerprint:
+    return cached[1]
+
+  value = sha256_digest(canonical_json(model))
+  if cached is None:
+    weakref.finalize(model, _digests.pop, key, None)
+  _digests[key] = (fingerprint, value)
+  return value
+
+
+def sha256_digest(data: bytes) -> str:
+  """Returns the unpadded base64url encoding of the SHA-256 digest of data."""
+  return (
+      base64.urlsafe_b64encode(hashlib.sha256(data).digest())
+      .rstrip(b"=")
+      .decode("ascii")
+  )
+
+
+def _write(value: Any, parts: list[str]) -> None:
+  """Appends the canonical JSON form of a JSON-compatible value to parts."""
+  if value is None:
+    parts.append("null")
+  elif value is True:
+    parts.append("true")
+  elif value is False:
+    parts.append("false")
+  elif isinstance(value, str):
+    parts.append(json.dumps(value, ensure_ascii=False))
+  elif isinstance(value, int):
+    parts.append(str(value))
+  elif isinstance(value, float):
+    parts.append(_format_number(value))
+  elif isinstance(value, dict):
+    parts.append("{")
+    for i, key in enumerate(
+        sorted(value, key=lambda key: key.encode("utf-16-be"))
+    ):
+      if i:
+        parts.append(",")
+      parts.append(json.dumps(key, ensure_ascii=False))
+      parts.append(":")
+      _write(value[key], parts)
+    parts.append("}")
+  elif isinstance(value, (list, tuple)):
+    parts.append("[")
+    for i, item in enumerate(value):
+      if i:
+        parts.append(",")
+      _write(item, parts)
+    parts.append("]")
+  else:
+    raise TypeError(f"{type(value).__name__} is not JSON-compatible.")
+
+
+def _format_number(value: float) -> str:
+  """Formats a float the way ECMAScript's Number.prototype.toString does."""
+  if not math.isfinite(value):
+    raise ValueError(f"{value} has no JSON representation.")
+  if value == 0:
+    return "0"
+
+  # repr gives the shortest digits that round-trip, as ECMAScript does; only
+  # the placement of the decimal point and the exponent differ.
+  sign, digits, exponent = decimal.Decimal(repr(abs(value))).as_tuple()
+  del sign  # Always positive.
+  significand = "".join(map(str, digits)).rstrip("0")
+  k = len(significand)
+  n = exponent + len(digits)
+  prefix = "-" if value < 0 else ""
+  if k <= n <= 21:
+    return prefix + significand + "0" * (n - k)
+  if 0 < n <= 21:
+    return prefix + significand[:n] + "." + significand[n:]
+  if -6 < n <= 0:
+    return prefix + "0." + "0" * -n + significand
+  e = n - 1
+  mantissa = significand if k == 1 else significand[0] + "." + significand[1:]
+  return f"{prefix}{mantissa}e{'+' if e >= 0 else '-'}{abs(e)}"
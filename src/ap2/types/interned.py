@@ -0,0 +1,84 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Interned, immutable instances of sub-objects repeated across mandates.
+
+Every cart a merchant offers carries the same PaymentMethodData and
+PaymentOptions. intern returns a frozen instance with the values of a model,
+shared with every other interned model of the same type and value, so those
+sub-objects are allocated once rather than once per cart.
+
+pydantic does not freeze the dicts and lists nested in an interned instance,
+such as PaymentMethodData.data, so they must never be mutated either.
+"""
+
+import functools
+from typing import TypeVar
+
+from ap2.types import canonical
+from pydantic import BaseModel
+from pydantic import ConfigDict
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Maps (model type, canonical JSON) to the interned instance of that value.
+_interned: dict[tuple[type[BaseModel], bytes], BaseModel] = {}
+# The ids of the interned instances, which live as long as the process.
+_interned_ids: set[int] = set()
+
+
+def intern(model: ModelT) -> ModelT:
+  """Returns the frozen, shared instance equal to the model.
+
+  Args:
+    model: The model to intern, e.g. a PaymentMethodData.
+
+  Returns:
+    An instance of a frozen subclass of the model's type, holding the same
+    values as the model and shared with every other caller interning an equal
+    model. The model
+    itself is left unchanged and can still be mutated.
+  """
+  if is_interned(model):
+    return model
+  key = (type(model), canonical.canonical_json(model))
+  shared = _interned.get(key)
+  if shared is None:
+    copy = model.model_copy(deep=True)
+    shared = _frozen_type(type(model)).model_construct(
+        _fields_set=copy.model_fields_set, **copy.__dict__
+    )
+    _interned[key] = shared
+    _interned_ids.add(id(shared))
+  return shared
+
+
+def is_interned(model: BaseModel) -> bool:
+  """Returns whether the model is an interned instance."""
+  return id(model) in _interned_ids
+
+
+@functools.cache
+def _frozen_type(model_type: type[ModelT]) -> type[ModelT]:
+  """Returns the frozen subclass of a model type, created once."""
+  return type(
+      f"Interned{model_type.__name__}",
+      (model_type,),
+      {
+          "__module__": __name__,
+          "__doc__": f"An interned, frozen {model_type.__name__}.",
+          "model_config": ConfigDict(**model_type.model_config, frozen=True),
+      },
+  )
@@ -0,0 +1,197 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Exact money arithmetic for PaymentCurrencyAmount values.
+
+PaymentCurrencyAmount.value is a float, as in its JSON form, so summing values
+directly accumulates rounding errors and two agents can compute different
+totals for the same cart. Money holds an amount as an integer number of the
+currency's minor units (e.g. cents), in which sums and taxes are exact, and
+converts back to a PaymentCurrencyAmount whose value serializes as before,
+e.g. 12.34.
+"""
+
+from collections.abc import Callable, Hashable, Iterable
+import decimal
+from typing import NamedTuple, TypeVar
+
+from ap2.types.payment_request import PaymentCurrencyAmount
+from ap2.types.payment_request import PaymentItem
+
+K = TypeVar("K", bound=Hashable)
+
+# The ISO 4217 currencies whose minor unit is not a hundredth. Every other
+# currency has an exponent of DEFAULT_EXPONENT.
+CURRENCY_EXPONENTS = {
+    "BHD": 3,
+    "BIF": 0,
+    "CLF": 4,
+    "CLP": 0,
+    "DJF": 0,
+    "GNF": 0,
+    "IQD": 3,
+    "ISK": 0,
+    "JOD": 3,
+    "JPY": 0,
+    "KMF": 0,
+    "KRW": 0,
+    "KWD": 3,
+    "LYD": 3,
+    "OMR": 3,
+    "PYG": 0,
+    "RWF": 0,
+    "TND": 3,
+    "UGX": 0,
+    "UYI": 0,
+    "UYW": 4,
+    "VND": 0,
+    "VUV": 0,
+    "XAF": 0,
+    "XOF": 0,
+    "XPF": 0,
+}
+DEFAULT_EXPONENT = 2
+
+# How far a scaled float may be from a whole number of minor units and still
+# be taken as that number; anything further is rounded as a decimal.
+_FLOAT_TOLERANCE = 1e-6
+
+
+def currency_exponent(currency: str) -> int:
+  """Returns the number of decimal digits of the currency's minor unit."""
+  return CURRENCY_EXPONENTS.get(currency.upper(), DEFAULT_EXPONENT)
+
+
+class Money(NamedTuple):
+  """An exact amount, as an integer number of the currency's minor units."""
+
+  currency: str
+  minor_units: int
+
+  @classmethod
+  def from_amount(cls, amount: PaymentCurrencyAmount) -> "Money":
+    """Converts a PaymentCurrencyAmount, rounding half to even if needed."""
+    return cls(
+        amount.currency,
+        _to_minor_units(amount.value, 10 ** currency_exponent(amount.currency)),
+    )
+
+  def to_amount(self) -> PaymentCurrencyAmount:
+    """Converts back to a PaymentCurrencyAmount."""
+    scale = 10 ** currency_exponent(self.currency)
+    return PaymentCurrencyAmount(
+        currency=self.currency, value=self.minor_units / scale
+    )
+
+  def __add__(self, other: "Money") -> "Money":
+    _check_currency(self.currency, other.currency)
+    return Money(self.currency, self.minor_units + other.minor_units)
+
+
+def total(items: Iterable[PaymentItem], currency: str) -> Money:
+  """Returns the exact sum of the items' amounts.
+
+  Args:
+    items: The items to total.
+    currency: The currency of the total, which every item must share.
+
+  Returns:
+    The total, which is zero if there are no items.
+
+  Raises:
+    ValueError: If an item is in another currency.
+  """
+  scale = 10 ** currency_exponent(currency)
+  minor_units = 0
+  for item in items:
+    amount = item.amount
+    if amount.currency != currency:
+      _check_currency(currency, amount.currency)
+    # The common case of _to_minor_units, inlined since this loop runs once
+    # per item of a cart.
+    scaled = amount.value * scale
+    units = round(scaled)
+    if abs(scaled - units) > _FLOAT_TOLERANCE:
+      units = _to_minor_units(amount.value, scale)
+    minor_units += units
+  return Money(currency, minor_units)
+
+
+def tax(amount: Money, rate: str | decimal.Decimal) -> Money:
+  """Returns the tax on an amount, rounded half to even to a minor unit.
+
+  Args:
+    amount: The taxed amount.
+    rate: The tax rate as a decimal fraction, e.g. "0.0825". A string or
+      Decimal rather than a float, so that the rate itself is exact.
+
+  Returns:
+    The tax, in the amount's currency.
+  """
+  exact = amount.minor_units * decimal.Decimal(rate)
+  return Money(
+      amount.currency,
+      int(exact.to_integral_value(rounding=decimal.ROUND_HALF_EVEN)),
+  )
+
+
+def group_totals(
+    items: Iterable[PaymentItem],
+    currency: str,
+    key: Callable[[PaymentItem], K],
+) -> dict[K, Money]:
+  """Returns the exact sum of the items' amounts for each group.
+
+  Args:
+    items: The items to total.
+    currency: The currency of the totals, which every item must share.
+    key: Returns the group of an item, e.g. its label.
+
+  Returns:
+    The total of each group, in order of first appearance.
+
+  Raises:
+    ValueError: If an item is in another currency.
+  """
+  scale = 10 ** currency_exponent(currency)
+  minor_units = {}
+  for item in items:
+    amount = item.amount
+    if amount.currency != currency:
+      _check_currency(currency, amount.currency)
+    scaled = amount.value * scale
+    units = round(scaled)
+    if abs(scaled - units) > _FLOAT_TOLERANCE:
+      units = _to_minor_units(amount.value, scale)
+    group = key(item)
+    minor_units[group] = minor_units.get(group, 0) + units
+  return {group: Money(currency, units) for group, units in minor_units.items()}
+
+
+def _to_minor_units(value: float, scale: int) -> int:
+  """Converts a float value to a whole number of minor units."""
+  scaled = value * scale
+  minor_units = round(scaled)
+  if abs(scaled - minor_units) <= _FLOAT_TOLERANCE:
+    return minor_units
+  # The value has more decimals than the currency; round its shortest decimal
+  # representation, which is what the JSON form carries.
+  exact = decimal.Decimal(repr(value)) * scale
+  return int(exact.to_integral_value(rounding=decimal.ROUND_HALF_EVEN))
+
+
+def _check_currency(expected: str, actual: str) -> None:
+  if actual != expected:
+    raise ValueError(f"Cannot combine {actual} with {expected} amounts.")
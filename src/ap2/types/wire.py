@@ -0,0 +1,52 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""The compact wire form of the Agent Payments Protocol types.
+
+The wire form of a model leaves out every field that holds its default value,
+which for the optional fields of the W3C Payment Request objects is usually
+None. Reading it back with model_validate fills those fields in again, so for
+any model m:
+
+  from_wire(type(m), to_wire(m)) == m
+
+Fields whose default is generated, such as PaymentMandateContents.timestamp,
+are always written since a freshly generated default never equals the value
+they hold.
+"""
+
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def to_wire(model: BaseModel) -> dict[str, Any]:
+  """Returns the compact, JSON-compatible wire form of the model."""
+  return model.model_dump(mode="json", by_alias=True, exclude_defaults=True)
+
+
+def from_wire(model_type: type[ModelT], data: dict[str, Any]) -> ModelT:
+  """Reads a model of the given type back from its wire form.
+
+  Args:
+    model_type: The pydantic model of the object.
+    data: The wire form, as produced by to_wire.
+
+  Returns:
+    The validated model.
+  """
+  return model_type.model_validate(data)
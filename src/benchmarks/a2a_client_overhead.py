@@ -0,0 +1,98 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Measures the per-send overhead of preparing the A2A client.
+
+Compares the previous behavior of PaymentRemoteA2aClient, which rewrote the
+shared extension header and created a new A2A client for every message, with
+the cached client and per-request call context it uses now. No network traffic
+is involved; only the client-side preparation of each send is timed.
+
+Usage:
+  python -m benchmarks.a2a_client_overhead --iterations=10000
+"""
+
+import asyncio
+from collections.abc import Sequence
+import json
+import os
+
+from a2a.client.client import ClientConfig
+from a2a.client.client_factory import ClientFactory
+from a2a.extensions.common import HTTP_EXTENSION_HEADER
+from a2a.types import AgentCard
+from absl import app
+from absl import flags
+import httpx
+
+from benchmarks import timing
+from common import agent_card_cache
+from common.a2a_extension_utils import EXTENSION_URI
+from common.payment_remote_a2a_client import PaymentRemoteA2aClient
+
+_ITERATIONS = flags.DEFINE_integer(
+    "iterations", 10000, "The number of sends to time."
+)
+
+_AGENT_CARD_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "roles", "merchant_agent", "agent.json"
+)
+
+
+def _load_agent_card() -> AgentCard:
+  """Loads the merchant agent's card as a representative AgentCard."""
+  with open(_AGENT_CARD_PATH, "r", encoding="utf-8") as f:
+    return AgentCard.model_validate(json.load(f))
+
+
+async def _run(iterations: int) -> None:
+  agent_card = _load_agent_card()
+  extensions = {EXTENSION_URI}
+
+  httpx_client = httpx.AsyncClient()
+  factory = ClientFactory(ClientConfig(httpx_client=httpx_client))
+
+  async def legacy_send_overhead():
+    httpx_client.headers[HTTP_EXTENSION_HEADER] = ", ".join(extensions)
+    return factory.create(agent_card)
+
+  client = PaymentRemoteA2aClient(
+      name="merchant_agent",
+      base_url=agent_card.url,
+      required_extensions=extensions,
+  )
+  agent_card_cache.default_cache().put(agent_card.url, agent_card)
+
+  async def cached_send_overhead():
+    await client._get_a2a_client()  # pylint: disable=protected-access
+    return client._create_call_context()  # pylint: disable=protected-access
+
+  legacy = await timing.async_time_per_call(legacy_send_overhead, iterations)
+  cached = await timing.async_time_per_call(cached_send_overhead, iterations)
+  print(timing.format_result("new client + shared header per send", legacy))
+  print(timing.format_result("cached client + per-request header", cached))
+  print(f"{'speedup':<48}{legacy / cached:>12.1f} x")
+
+  await httpx_client.aclose()
+  await client.aclose()
+
+
+def main(argv: Sequence[str]) -> None:
+  del argv  # Unused.
+  asyncio.run(_run(_ITERATIONS.value))
+
+
+if __name__ == "__main__":
+  app.run(main)
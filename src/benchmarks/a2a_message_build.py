@@ -0,0 +1,80 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Measures the cost of building an outgoing A2A message.
+
+Builds the message the shopping agent sends to initiate a payment with
+A2aMessageBuilder, and times a single validated Part against the same Part
+assembled with model_construct. The latter is the slower of the two, which is
+why the builder has no validation-free path.
+
+Usage:
+  python -m benchmarks.a2a_message_build --iterations=20000
+"""
+
+from collections.abc import Sequence
+
+from a2a import types as a2a_types
+from absl import app
+from absl import flags
+
+from ap2.types.mandate import PAYMENT_MANDATE_DATA_KEY
+from benchmarks import payloads
+from benchmarks import timing
+from common.a2a_message_builder import A2aMessageBuilder
+
+_ITERATIONS = flags.DEFINE_integer(
+    "iterations", 20000, "The number of messages to build."
+)
+
+
+def main(argv: Sequence[str]) -> None:
+  del argv  # Unused.
+  payment_mandate = payloads.payment_mandate().model_dump()
+  risk_data = "eyJhbGciOiJSUzI1NiIsImtpZCI6IjIwMjQwOTA..."
+
+  def build() -> a2a_types.Message:
+    return (
+        A2aMessageBuilder()
+        .set_context_id("context_1")
+        .add_text("Initiate a payment")
+        .add_data(PAYMENT_MANDATE_DATA_KEY, payment_mandate)
+        .add_data("risk_data", risk_data)
+        .add_data("shopping_agent_id", "trusted_shopping_agent")
+        .add_data("debug_mode", True)
+        .build()
+    )
+
+  def validated_part() -> a2a_types.Part:
+    return a2a_types.Part(root=a2a_types.TextPart(text="Initiate a payment"))
+
+  def constructed_part() -> a2a_types.Part:
+    return a2a_types.Part.model_construct(
+        root=a2a_types.TextPart.model_construct(
+            text="Initiate a payment", kind="text"
+        )
+    )
+
+  iterations = _ITERATIONS.value
+  message = timing.time_per_call(build, iterations)
+  validated = timing.time_per_call(validated_part, iterations)
+  constructed = timing.time_per_call(constructed_part, iterations)
+  print(timing.format_result("message build", message))
+  print(timing.format_result("validated Part", validated))
+  print(timing.format_result("model_construct Part", constructed))
+
+
+if __name__ == "__main__":
+  app.run(main)
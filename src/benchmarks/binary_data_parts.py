@@ -0,0 +1,103 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Compares mandate DataParts sent as JSON and as binary blobs.
+
+For carts of increasing size, prints the size of a DataPart carrying the cart
+as JSON and as base64 MessagePack or CBOR (see common.binary_data_parts),
+before and after gzip, and the time to encode the DataPart to its JSON body
+and to decode it back to the cart's wire form. Decoding includes the DataPart
+validation that the A2A server runs on every incoming part, which walks the
+whole cart when it is sent as JSON. That every mandate survives the round trip
+unchanged is covered by tests/common/binary_data_parts_test.py.
+
+Encodings whose optional dependency is not installed are skipped.
+
+Usage:
+  python -m benchmarks.binary_data_parts --iterations=2000
+"""
+
+from collections.abc import Sequence
+import gzip
+from typing import Any
+
+from a2a import types as a2a_types
+from absl import app
+from absl import flags
+
+from ap2.types import wire
+from ap2.types.mandate import CART_MANDATE_DATA_KEY
+from benchmarks import payloads
+from benchmarks import timing
+from common import binary_data_parts
+from common import compression
+
+_ITERATIONS = flags.DEFINE_integer(
+    "iterations", 2000, "The number of encodes and decodes to time."
+)
+_ITEM_COUNTS = flags.DEFINE_list(
+    "item_counts", ["1", "10", "100"], "The cart sizes to measure."
+)
+
+
+def _encode(data: dict[str, Any], encoding: str | None) -> bytes:
+  """Returns the JSON body of a DataPart, optionally binary encoded."""
+  if encoding:
+    data = binary_data_parts.encode_data(data, encoding)
+  return a2a_types.DataPart(data=data).model_dump_json().encode("utf-8")
+
+
+def _decode(body: bytes) -> dict[str, Any]:
+  """Returns the original data of a DataPart's JSON body."""
+  return binary_data_parts.decode_data(
+      a2a_types.DataPart.model_validate_json(body).data
+  )
+
+
+def main(argv: Sequence[str]) -> None:
+  del argv  # Unused.
+  encodings = binary_data_parts.available_encodings()
+  if not encodings:
+    raise app.UsageError(
+        "No binary encoding is installed; install msgspec or cbor2."
+    )
+  iterations = _ITERATIONS.value
+  for item_count in (int(count) for count in _ITEM_COUNTS.value):
+    data = {
+        CART_MANDATE_DATA_KEY: wire.to_wire(
+            payloads.cart_mandate(item_count=item_count)
+        )
+    }
+    print(f"\n[{item_count} item cart]")
+    for encoding in [None, *encodings]:
+      label = encoding or "json"
+      body = _encode(data, encoding)
+      gzipped = gzip.compress(body, compresslevel=compression.COMPRESS_LEVEL)
+      print(f"{label + ' size':<48}{len(body):>12} bytes")
+      print(f"{label + ' gzip size':<48}{len(gzipped):>12} bytes")
+      print(timing.format_result(
+          f"{label} encode",
+          timing.time_per_call(
+              lambda encoding=encoding: _encode(data, encoding), iterations
+          ),
+      ))
+      print(timing.format_result(
+          f"{label} decode",
+          timing.time_per_call(lambda body=body: _decode(body), iterations),
+      ))
+
+
+if __name__ == "__main__":
+  app.run(main)
@@ -0,0 +1,81 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Compares validating canonical objects one at a time and in bulk.
+
+For lists of 3, 100 and 10,000 raw CartMandates, PaymentMethodData and
+PaymentItems, times a Python loop of model_validate calls against a single
+message_utils.validate_all call, which validates the list in pydantic-core
+with a cached TypeAdapter.
+
+Usage:
+  python -m benchmarks.bulk_validation --counts=3,100,10000
+"""
+
+from collections.abc import Sequence
+
+from absl import app
+from absl import flags
+
+from ap2.types import wire
+from ap2.types.mandate import CartMandate
+from ap2.types.payment_request import PaymentItem
+from ap2.types.payment_request import PaymentMethodData
+from benchmarks import payloads
+from benchmarks import timing
+from common import message_utils
+
+_COUNTS = flags.DEFINE_list(
+    "counts", ["3", "100", "10000"], "The numbers of objects to validate."
+)
+_MIN_OBJECTS = flags.DEFINE_integer(
+    "min_objects",
+    30000,
+    "Each list is validated repeatedly until about this many objects have"
+    " been validated, to steady the timings of the small lists.",
+)
+
+
+def main(argv: Sequence[str]) -> None:
+  del argv  # Unused.
+  cart = payloads.cart_mandate(item_count=3)
+  samples = [
+      (CartMandate, wire.to_wire(cart)),
+      (
+          PaymentMethodData,
+          wire.to_wire(cart.contents.payment_request.method_data[0]),
+      ),
+      (PaymentItem, wire.to_wire(payloads.payment_items(1)[0])),
+  ]
+
+  for model, sample in samples:
+    print(f"\n[{model.__name__}]")
+    for count in (int(count) for count in _COUNTS.value):
+      values = [sample] * count
+      iterations = max(1, _MIN_OBJECTS.value // count)
+      looped = timing.time_per_call(
+          lambda: [model.model_validate(value) for value in values],
+          iterations,
+      )
+      bulk = timing.time_per_call(
+          lambda: message_utils.validate_all(model, values), iterations
+      )
+      print(timing.format_result(f"{count} objects, model_validate loop", looped))
+      print(timing.format_result(f"{count} objects, validate_all", bulk))
+      print(f"{'speedup':<48}{looped / bulk:>12.2f} x")
+
+
+if __name__ == "__main__":
+  app.run(main)
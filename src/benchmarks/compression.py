@@ -0,0 +1,106 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Finds the body size from which gzip compression pays for itself.
+
+For messages of increasing size, from a short text message to a cart with
+hundreds of items, prints the size saved by compressing the JSON body, the CPU
+time spent compressing and decompressing it, and the net time gained on a link
+of --bandwidth_mbps. Compression only pays off where the time saved on the
+wire exceeds the CPU time, which sets compression.DEFAULT_MIN_SIZE.
+
+Usage:
+  python -m benchmarks.compression --bandwidth_mbps=100
+"""
+
+from collections.abc import Sequence
+import gzip
+import json
+
+from absl import app
+from absl import flags
+
+from ap2.types import wire
+from benchmarks import payloads
+from benchmarks import timing
+from common import compression
+
+_ITERATIONS = flags.DEFINE_integer(
+    "iterations", 500, "The number of compressions to time per size."
+)
+_BANDWIDTH_MBPS = flags.DEFINE_float(
+    "bandwidth_mbps", 100.0, "The link bandwidth, in megabits per second."
+)
+_ITEM_COUNTS = flags.DEFINE_list(
+    "item_counts",
+    ["0", "1", "2", "5", "10", "20", "50", "100", "500"],
+    "The cart sizes to measure; 0 is a short text message without a cart.",
+)
+
+
+def _body(item_count: int) -> bytes:
+  """Returns a JSON-RPC style body carrying a cart of the given size."""
+  if item_count:
+    data = {"cart": wire.to_wire(payloads.cart_mandate(item_count=item_count))}
+  else:
+    data = {"text": "Get the user's shipping address."}
+  return json.dumps(
+      {"jsonrpc": "2.0", "id": "1", "method": "message/send", "params": data}
+  ).encode("utf-8")
+
+
+def main(argv: Sequence[str]) -> None:
+  del argv  # Unused.
+  iterations = _ITERATIONS.value
+  bytes_per_second = _BANDWIDTH_MBPS.value * 1e6 / 8
+
+  print(
+      f"{'items':>6}{'raw B':>10}{'gzip B':>10}{'compress us':>14}"
+      f"{'decompress us':>16}{'net gain us':>14}"
+  )
+  break_even = None
+  for item_count in (int(count) for count in _ITEM_COUNTS.value):
+    body = _body(item_count)
+    compressed = gzip.compress(body, compresslevel=compression.COMPRESS_LEVEL)
+    compress_seconds = timing.time_per_call(
+        lambda: gzip.compress(body, compresslevel=compression.COMPRESS_LEVEL),
+        iterations,
+    )
+    decompress_seconds = timing.time_per_call(
+        lambda: gzip.decompress(compressed), iterations
+    )
+    saved_seconds = (len(body) - len(compressed)) / bytes_per_second
+    gain_seconds = saved_seconds - compress_seconds - decompress_seconds
+    if gain_seconds > 0 and break_even is None:
+      break_even = len(body)
+    print(
+        f"{item_count:>6}{len(body):>10}{len(compressed):>10}"
+        f"{compress_seconds * 1e6:>14.1f}{decompress_seconds * 1e6:>16.1f}"
+        f"{gain_seconds * 1e6:>14.1f}"
+    )
+
+  print()
+  if break_even is None:
+    print(f"Compression never paid off at {_BANDWIDTH_MBPS.value:g} Mbps.")
+  else:
+    print(
+        f"Compression pays off from about {break_even} bytes at"
+        f" {_BANDWIDTH_MBPS.value:g} Mbps; the default threshold is"
+        f" {compression.DEFAULT_MIN_SIZE} bytes."
+    )
+
+
+if __name__ == "__main__":
+  app.run(main)
@@ -0,0 +1,133 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Compares HTTP/1.1 and HTTP/2 transports under concurrent payments.
+
+Serves a stand-in agent with Hypercorn on a local port; it answers each
+JSON-RPC request with a payment-sized response after a fixed delay. Batches of
+1, 10 and 100 concurrent requests are then sent with an httpx client speaking
+HTTP/1.1 and one speaking HTTP/2, reporting wall-clock time per batch and the
+number of TCP connections the server saw.
+
+Requires the optional http2 dependencies: pip install -e ".[http2]"
+
+Usage:
+  python -m benchmarks.http2_concurrency --batches=5 --server_delay_ms=20
+"""
+
+import asyncio
+from collections.abc import Sequence
+import time
+
+from absl import app
+from absl import flags
+from hypercorn.asyncio import serve
+from hypercorn.config import Config
+import httpx
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from benchmarks import payloads
+
+_PORT = flags.DEFINE_integer("port", 7099, "The local port to serve on.")
+_BATCHES = flags.DEFINE_integer(
+    "batches", 5, "The number of batches timed per concurrency level."
+)
+_SERVER_DELAY_MS = flags.DEFINE_integer(
+    "server_delay_ms", 20, "Simulated processing time of each request."
+)
+
+_CONCURRENCY_LEVELS = (1, 10, 100)
+
+
+def _build_app(delay_seconds: float, peers: set) -> Starlette:
+  """Builds a stand-in agent that echoes a payment-sized JSON-RPC result."""
+  result = payloads.payment_mandate().model_dump(mode="json")
+
+  async def rpc(request: Request) -> JSONResponse:
+    peers.add(request.client)
+    body = await request.json()
+    await asyncio.sleep(delay_seconds)
+    return JSONResponse(
+        {"jsonrpc": "2.0", "id": body.get("id"), "result": result}
+    )
+
+  return Starlette(routes=[Route("/rpc", rpc, methods=["POST"])])
+
+
+async def _time_batches(
+    client: httpx.AsyncClient, url: str, concurrency: int, batches: int
+) -> float:
+  """Returns the mean wall-clock seconds of a batch of concurrent requests."""
+  request = {
+      "jsonrpc": "2.0",
+      "method": "message/send",
+      "params": payloads.payment_mandate().model_dump(mode="json"),
+  }
+  start = time.perf_counter()
+  for _ in range(batches):
+    responses = await asyncio.gather(*(
+        client.post(url, json=dict(request, id=i)) for i in range(concurrency)
+    ))
+    for response in responses:
+      response.raise_for_status()
+  return (time.perf_counter() - start) / batches
+
+
+async def _run(port: int, batches: int, delay_seconds: float) -> None:
+  peers = set()
+  config = Config()
+  config.bind = [f"127.0.0.1:{port}"]
+  config.accesslog = None
+  shutdown = asyncio.Event()
+  server = asyncio.create_task(
+      serve(
+          _build_app(delay_seconds, peers),
+          config,
+          shutdown_trigger=shutdown.wait,
+      )
+  )
+  await asyncio.sleep(0.5)
+  url = f"http://127.0.0.1:{port}/rpc"
+
+  print(f"{'transport':<12}{'concurrency':>12}{'ms/batch':>12}"
+        f"{'connections':>14}")
+  for label, http2 in (("HTTP/1.1", False), ("HTTP/2", True)):
+    for concurrency in _CONCURRENCY_LEVELS:
+      peers.clear()
+      async with httpx.AsyncClient(
+          http1=not http2,
+          http2=http2,
+          limits=httpx.Limits(max_connections=concurrency),
+      ) as client:
+        seconds = await _time_batches(client, url, concurrency, batches)
+      print(f"{label:<12}{concurrency:>12}{seconds * 1000:>12.1f}"
+            f"{len(peers):>14}")
+
+  shutdown.set()
+  await server
+
+
+def main(argv: Sequence[str]) -> None:
+  del argv  # Unused.
+  asyncio.run(
+      _run(_PORT.value, _BATCHES.value, _SERVER_DELAY_MS.value / 1000)
+  )
+
+
+if __name__ == "__main__":
+  app.run(main)
@@ -0,0 +1,128 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Compares carts built with fresh and with interned sub-objects.
+
+Builds carts shaped like the catalog agent's, once creating a new
+PaymentMethodData and PaymentOptions for every cart and once sharing interned
+instances of them (see ap2.types.interned), and prints the time to build a
+cart, to dump it to its wire form and to compute the digest of its canonical
+JSON.
+
+Usage:
+  python -m benchmarks.interned_sub_objects --iterations=2000
+"""
+
+from collections.abc import Callable, Sequence
+
+from absl import app
+from absl import flags
+
+from ap2.types import canonical
+from ap2.types import interned
+from ap2.types import wire
+from ap2.types.mandate import CartContents
+from ap2.types.mandate import CartMandate
+from ap2.types.payment_request import PaymentDetailsInit
+from ap2.types.payment_request import PaymentItem
+from ap2.types.payment_request import PaymentMethodData
+from ap2.types.payment_request import PaymentOptions
+from ap2.types.payment_request import PaymentRequest
+from benchmarks import payloads
+from benchmarks import timing
+
+_ITERATIONS = flags.DEFINE_integer(
+    "iterations", 2000, "The number of carts to time."
+)
+
+_SHARED_METHOD_DATA = interned.intern(
+    PaymentMethodData(
+        supported_methods="CARD",
+        data={"network": ["mastercard", "paypal", "amex"]},
+    )
+)
+_SHARED_OPTIONS = interned.intern(PaymentOptions(request_shipping=True))
+
+
+def _fresh_method_data() -> PaymentMethodData:
+  return PaymentMethodData(
+      supported_methods="CARD",
+      data={"network": ["mastercard", "paypal", "amex"]},
+  )
+
+
+def _fresh_options() -> PaymentOptions:
+  return PaymentOptions(request_shipping=True)
+
+
+def _cart(
+    item: PaymentItem,
+    method_data: Callable[[], PaymentMethodData],
+    options: Callable[[], PaymentOptions],
+) -> CartMandate:
+  """Returns a one item cart, as the catalog agent builds it."""
+  return CartMandate(
+      contents=CartContents(
+          id="cart_1",
+          user_cart_confirmation_required=True,
+          payment_request=PaymentRequest(
+              method_data=[method_data()],
+              details=PaymentDetailsInit(
+                  id="order_1",
+                  display_items=[item],
+                  total=PaymentItem(label="Total", amount=item.amount),
+              ),
+              options=options(),
+          ),
+          cart_expiry="2025-09-01T12:30:00+00:00",
+          merchant_name="Generic Merchant",
+      )
+  )
+
+
+def _build_and_digest(
+    item: PaymentItem,
+    method_data: Callable[[], PaymentMethodData],
+    options: Callable[[], PaymentOptions],
+) -> str:
+  cart = _cart(item, method_data, options)
+  wire.to_wire(cart)
+  return canonical.sha256_digest(canonical.canonical_json(cart.contents))
+
+
+def main(argv: Sequence[str]) -> None:
+  del argv  # Unused.
+  item = payloads.payment_items(1)[0]
+  iterations = _ITERATIONS.value
+  print(timing.format_result(
+      "fresh sub-objects",
+      timing.time_per_call(
+          lambda: _build_and_digest(item, _fresh_method_data, _fresh_options),
+          iterations,
+      ),
+  ))
+  print(timing.format_result(
+      "interned sub-objects",
+      timing.time_per_call(
+          lambda: _build_and_digest(
+              item, lambda: _SHARED_METHOD_DATA, lambda: _SHARED_OPTIONS
+          ),
+          iterations,
+      ),
+  ))
+
+
+if __name__ == "__main__":
+  app.run(main)
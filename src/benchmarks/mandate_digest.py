@@ -0,0 +1,61 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Measures the cost of mandate digests, with and without memoization.
+
+For carts of increasing size, times computing the digest of a CartMandate
+from scratch, i.e. canonicalizing and hashing it, against canonical.digest on
+an unchanged mandate, which only fingerprints it with model_dump_json.
+
+Usage:
+  python -m benchmarks.mandate_digest --iterations=2000
+"""
+
+from collections.abc import Sequence
+
+from absl import app
+from absl import flags
+
+from ap2.types import canonical
+from benchmarks import payloads
+from benchmarks import timing
+
+_ITERATIONS = flags.DEFINE_integer(
+    "iterations", 2000, "The number of digests to time."
+)
+_ITEM_COUNTS = flags.DEFINE_list(
+    "item_counts", ["1", "10", "100"], "The cart sizes to measure."
+)
+
+
+def main(argv: Sequence[str]) -> None:
+  del argv  # Unused.
+  iterations = _ITERATIONS.value
+  for item_count in (int(count) for count in _ITEM_COUNTS.value):
+    cart = payloads.cart_mandate(item_count=item_count)
+    print(f"\n[{item_count} item cart]")
+    cold = timing.time_per_call(
+        lambda: canonical.sha256_digest(canonical.canonical_json(cart)),
+        iterations,
+    )
+    canonical.digest(cart)
+    memoized = timing.time_per_call(lambda: canonical.digest(cart), iterations)
+    print(timing.format_result("canonicalize and hash", cold))
+    print(timing.format_result("memoized digest", memoized))
+    print(f"{'speedup':<48}{cold / memoized:>12.1f} x")
+
+
+if __name__ == "__main__":
+  app.run(main)
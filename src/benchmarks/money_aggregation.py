@@ -0,0 +1,107 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Compares float and exact minor-unit aggregation of PaymentItems.
+
+For carts of 10, 1,000 and 10,000 items, times the float sum the merchant used
+to total a cart against money.total, and the per-label float sums against
+money.group_totals. Also reports how far the float total drifted from the
+exact one.
+
+Usage:
+  python -m benchmarks.money_aggregation --item_counts=10,1000,10000
+"""
+
+from collections.abc import Sequence
+
+from absl import app
+from absl import flags
+
+from ap2.types import money
+from ap2.types.payment_request import PaymentCurrencyAmount
+from ap2.types.payment_request import PaymentItem
+from benchmarks import timing
+
+_ITEM_COUNTS = flags.DEFINE_list(
+    "item_counts", ["10", "1000", "10000"], "The cart sizes to measure."
+)
+_MIN_ITEMS = flags.DEFINE_integer(
+    "min_items",
+    200000,
+    "Each cart is totaled repeatedly until about this many items have been"
+    " summed, to steady the timings of the small carts.",
+)
+
+
+def _items(count: int) -> list[PaymentItem]:
+  """Returns items with typical prices, spread over a few labels."""
+  return [
+      PaymentItem(
+          label=f"Category {i % 7}",
+          amount=PaymentCurrencyAmount(currency="USD", value=0.1 + i % 100),
+      )
+      for i in range(count)
+  ]
+
+
+def _float_group_totals(items: list[PaymentItem]) -> dict[str, float]:
+  totals = {}
+  for item in items:
+    totals[item.label] = totals.get(item.label, 0.0) + item.amount.value
+  return totals
+
+
+def main(argv: Sequence[str]) -> None:
+  del argv  # Unused.
+  for count in (int(count) for count in _ITEM_COUNTS.value):
+    items = _items(count)
+    iterations = max(1, _MIN_ITEMS.value // count)
+
+    float_total = sum(item.amount.value for item in items)
+    exact_total = money.total(items, "USD")
+    print(f"\n[{count} items]")
+    print(f"{'float total':<48}{float_total!r:>24}")
+    print(f"{'exact total':<48}{exact_total.to_amount().value!r:>24}")
+    print(timing.format_result(
+        "float sum",
+        timing.time_per_call(
+            lambda: sum(item.amount.value for item in items), iterations
+        ),
+    ))
+    print(timing.format_result(
+        "money.total",
+        timing.time_per_call(lambda: money.total(items, "USD"), iterations),
+    ))
+    print(timing.format_result(
+        "money.total + money.tax",
+        timing.time_per_call(
+            lambda: money.tax(money.total(items, "USD"), "0.0825"), iterations
+        ),
+    ))
+    print(timing.format_result(
+        "float group sums",
+        timing.time_per_call(lambda: _float_group_totals(items), iterations),
+    ))
+    print(timing.format_result(
+        "money.group_totals",
+        timing.time_per_call(
+            lambda: money.group_totals(items, "USD", lambda item: item.label),
+            iterations,
+        ),
+    ))
+
+
+if __name__ == "__main__":
+  app.run(main)
@@ -0,0 +1,87 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Compares the speed of the msgspec codec and the pydantic models.
+
+Reports encode and decode throughput of both for representative objects. That
+both agree is checked by tests/ap2/types/msgspec_codec_test.py, which fuzzes
+them against each other.
+
+Requires the optional msgspec dependency.
+
+Usage:
+  python -m benchmarks.msgspec_codec --iterations=5000
+"""
+
+from collections.abc import Sequence
+
+from absl import app
+from absl import flags
+
+from ap2.types import msgspec_codec
+from benchmarks import payloads
+from benchmarks import timing
+
+_ITERATIONS = flags.DEFINE_integer(
+    "iterations", 5000, "The number of encodes and decodes to time."
+)
+
+
+def _print_rate(label: str, seconds: float) -> None:
+  print(f"{label:<48}{1 / seconds:>12.0f} /s{seconds * 1e6:>12.1f} us")
+
+
+def main(argv: Sequence[str]) -> None:
+  del argv  # Unused.
+  iterations = _ITERATIONS.value
+  cart = payloads.cart_mandate(item_count=10)
+  for model in [
+      cart,
+      cart.contents.payment_request,
+      payloads.payment_mandate(),
+      payloads.intent_mandate(),
+      payloads.shipping_address(),
+  ]:
+    model_type = type(model)
+    struct_type = msgspec_codec.STRUCTS_BY_MODEL[model_type]
+    struct = msgspec_codec.from_pydantic(model)
+    data = msgspec_codec.encode(struct)
+    print(f"\n[{model_type.__name__}, {len(data)} bytes]")
+    _print_rate(
+        "pydantic encode",
+        timing.time_per_call(
+            lambda: model.model_dump_json(exclude_defaults=True), iterations
+        ),
+    )
+    _print_rate(
+        "msgspec encode",
+        timing.time_per_call(lambda: msgspec_codec.encode(struct), iterations),
+    )
+    _print_rate(
+        "pydantic decode",
+        timing.time_per_call(
+            lambda: model_type.model_validate_json(data), iterations
+        ),
+    )
+    _print_rate(
+        "msgspec decode",
+        timing.time_per_call(
+            lambda: msgspec_codec.decode(data, struct_type), iterations
+        ),
+    )
+
+
+if __name__ == "__main__":
+  app.run(main)
@@ -0,0 +1,138 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Representative Agent Payments Protocol objects used by the benchmarks.
+
+The objects mirror what the sample agents exchange: carts built by the
+merchant's catalog agent, and the payment mandate the shopping agent creates
+for a chosen cart.
+"""
+
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+from ap2.types.contact_picker import ContactAddress
+from ap2.types.mandate import CartContents
+from ap2.types.mandate import CartMandate
+from ap2.types.mandate import IntentMandate
+from ap2.types.mandate import PaymentMandate
+from ap2.types.mandate import PaymentMandateContents
+from ap2.types.payment_request import PaymentCurrencyAmount
+from ap2.types.payment_request import PaymentDetailsInit
+from ap2.types.payment_request import PaymentItem
+from ap2.types.payment_request import PaymentMethodData
+from ap2.types.payment_request import PaymentOptions
+from ap2.types.payment_request import PaymentRequest
+from ap2.types.payment_request import PaymentResponse
+
+
+def shipping_address() -> ContactAddress:
+  """Returns a sample shipping address."""
+  return ContactAddress(
+      recipient="Bugs Bunny",
+      organization="Sample Organization",
+      address_line=["123 Main St"],
+      city="Sample City",
+      region="ST",
+      postal_code="00000",
+      country="US",
+      phone_number="+1-000-000-0000",
+  )
+
+
+def payment_items(count: int) -> list[PaymentItem]:
+  """Returns count distinct items priced in USD."""
+  return [
+      PaymentItem(
+          label=f"Item {i}",
+          amount=PaymentCurrencyAmount(currency="USD", value=10 + i * 0.37),
+      )
+      for i in range(count)
+  ]
+
+
+def intent_mandate() -> IntentMandate:
+  """Returns a sample intent mandate."""
+  return IntentMandate(
+      natural_language_description="High top, old school, red basketball shoes",
+      intent_expiry=(
+          datetime.now(timezone.utc) + timedelta(days=1)
+      ).isoformat(),
+  )
+
+
+def cart_mandate(item_count: int = 1) -> CartMandate:
+  """Returns a cart of item_count items, shaped like the catalog agent's."""
+  items = payment_items(item_count)
+  return CartMandate(
+      contents=CartContents(
+          id="cart_1",
+          user_cart_confirmation_required=True,
+          payment_request=PaymentRequest(
+              method_data=[
+                  PaymentMethodData(
+                      supported_methods="CARD",
+                      data={"network": ["mastercard", "paypal", "amex"]},
+                  )
+              ],
+              details=PaymentDetailsInit(
+                  id="order_1",
+                  display_items=items,
+                  total=PaymentItem(
+                      label="Total",
+                      amount=PaymentCurrencyAmount(
+                          currency="USD",
+                          value=sum(item.amount.value for item in items),
+                      ),
+                  ),
+              ),
+              options=PaymentOptions(request_shipping=True),
+              shipping_address=shipping_address(),
+          ),
+          cart_expiry=(
+              datetime.now(timezone.utc) + timedelta(minutes=30)
+          ).isoformat(),
+          merchant_name="Generic Merchant",
+      ),
+      merchant_authorization="eyJhbGciOiJSUzI1NiIsImtpZIwMjQwOTA...",
+  )
+
+
+def payment_mandate() -> PaymentMandate:
+  """Returns a signed payment mandate for a one item cart."""
+  cart = cart_mandate()
+  payment_request = cart.contents.payment_request
+  return PaymentMandate(
+      payment_mandate_contents=PaymentMandateContents(
+          payment_mandate_id="a1b2c3d4e5f60718293a4b5c6d7e8f90",
+          payment_details_id=payment_request.details.id,
+          payment_details_total=payment_request.details.total,
+          payment_response=PaymentResponse(
+              request_id=payment_request.details.id,
+              method_name="CARD",
+              details={
+                  "token": {
+                      "value": "fake_payment_credential_token_0",
+                      "url": "http://localhost:7002/a2a/credentials_provider",
+                  }
+              },
+              shipping_address=shipping_address(),
+              payer_email="bugsbunny@gmail.com",
+          ),
+          merchant_agent=cart.contents.merchant_name,
+      ),
+      user_authorization="fake_cart_mandate_hash_cart_1_fake_payment_hash",
+  )
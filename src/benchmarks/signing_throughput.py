@@ -0,0 +1,133 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Measures the throughput of signing and verifying mandate authorizations.
+
+Runs on a single thread, so the rates are per core. Reports the raw Ed25519
+sign and verify rates, and the end-to-end rates of the mandate helpers, which
+add canonicalization, hashing and the JWS encoding on top. Keys are created in
+a temporary directory, leaving the agents' keys untouched.
+
+Usage:
+  python -m benchmarks.signing_throughput --iterations=5000
+"""
+
+from collections.abc import Sequence
+import os
+import tempfile
+
+from absl import app
+from absl import flags
+
+from ap2.types import canonical
+from benchmarks import payloads
+from benchmarks import timing
+from common import jws
+from common import mandate_signing
+
+_ITERATIONS = flags.DEFINE_integer(
+    "iterations", 5000, "The number of signatures and verifications to time."
+)
+_BATCH_SIZE = flags.DEFINE_integer(
+    "batch_size", 100, "The number of tokens per verify_batch call."
+)
+
+
+def _print_rate(label: str, seconds: float) -> None:
+  print(f"{label:<48}{1 / seconds:>12.0f} /s{seconds * 1e6:>12.1f} us")
+
+
+def main(argv: Sequence[str]) -> None:
+  del argv  # Unused.
+  iterations = _ITERATIONS.value
+  with tempfile.TemporaryDirectory() as keys_dir:
+    os.environ[jws.KEYS_DIR_ENV_VAR] = keys_dir
+    merchant_key = jws.signing_key("benchmark_merchant")
+    user_key = jws.signing_key("benchmark_user_device")
+
+    message = b"x" * 200
+    signature = merchant_key.private_key.sign(message)
+    public_key = merchant_key.private_key.public_key()
+    _print_rate(
+        "raw Ed25519 sign",
+        timing.time_per_call(
+            lambda: merchant_key.private_key.sign(message), iterations
+        ),
+    )
+    _print_rate(
+        "raw Ed25519 verify",
+        timing.time_per_call(
+            lambda: public_key.verify(signature, message), iterations
+        ),
+    )
+
+    cart = payloads.cart_mandate(item_count=3)
+    _print_rate(
+        "sign_cart_mandate",
+        timing.time_per_call(
+            lambda: mandate_signing.sign_cart_mandate(cart, merchant_key),
+            iterations,
+        ),
+    )
+    cart.merchant_authorization = mandate_signing.sign_cart_mandate(
+        cart, merchant_key
+    )
+    _print_rate(
+        "verify_cart_mandate",
+        timing.time_per_call(
+            lambda: mandate_signing.verify_cart_mandate(
+                cart, "benchmark_merchant"
+            ),
+            iterations,
+        ),
+    )
+
+    payment_mandate = payloads.payment_mandate()
+    transaction_data = [
+        canonical.digest(cart),
+        canonical.digest(payment_mandate.payment_mandate_contents),
+    ]
+    _print_rate(
+        "sign_user_authorization",
+        timing.time_per_call(
+            lambda: mandate_signing.sign_user_authorization(
+                transaction_data, user_key
+            ),
+            iterations,
+        ),
+    )
+    payment_mandate.user_authorization = (
+        mandate_signing.sign_user_authorization(transaction_data, user_key)
+    )
+    _print_rate(
+        "verify_payment_mandate",
+        timing.time_per_call(
+            lambda: mandate_signing.verify_payment_mandate(
+                payment_mandate, "benchmark_user_device"
+            ),
+            iterations,
+        ),
+    )
+
+    tokens = [payment_mandate.user_authorization] * _BATCH_SIZE.value
+    batch_seconds = timing.time_per_call(
+        lambda: jws.verify_batch(tokens, "benchmark_user_device"),
+        max(1, iterations // _BATCH_SIZE.value),
+    )
+    _print_rate("verify_batch, per token", batch_seconds / len(tokens))
+
+
+if __name__ == "__main__":
+  app.run(main)
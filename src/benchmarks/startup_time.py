@@ -0,0 +1,192 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Measures how long each agent entry point takes to import.
+
+Runs `python -X importtime -c "import <module>"` in a fresh interpreter for each
+agent entry point, keeps the fastest of --runs runs and prints the total import
+time together with the heaviest imports made directly by the entry point. This
+is the cold start cost paid by every agent start, and by every reload of
+`adk web --reload_agents`.
+
+With --enforce_budget, exits with a non-zero status if any entry point takes
+longer than its budget in startup_budget.json; cli/check_startup_budget.sh runs
+this check. Entry points without a budget are reported but not checked.
+--write_budget records the measured times, plus --headroom, as the budget of
+the measured entry points.
+
+Usage:
+  python -m benchmarks.startup_time --enforce_budget
+"""
+
+from collections.abc import Sequence
+import json
+import os
+import subprocess
+import sys
+
+from absl import app
+from absl import flags
+
+_RUNS = flags.DEFINE_integer(
+    "runs", 5, "The number of runs per entry point; the fastest is kept."
+)
+_TOP = flags.DEFINE_integer(
+    "top", 5, "The number of heaviest imports to print per entry point."
+)
+_ENFORCE_BUDGET = flags.DEFINE_bool(
+    "enforce_budget",
+    False,
+    "Whether to exit with a non-zero status if a budget is exceeded.",
+)
+_WRITE_BUDGET = flags.DEFINE_bool(
+    "write_budget", False, "Whether to record the measured times as budget."
+)
+_HEADROOM = flags.DEFINE_float(
+    "headroom",
+    1.5,
+    "The factor applied to the measured times by --write_budget.",
+)
+
+ENTRY_POINTS = (
+    "roles.merchant_agent.__main__",
+    "roles.merchant_payment_processor_agent.__main__",
+    "roles.credentials_provider_agent.__main__",
+    "roles.shopping_agent.agent",
+)
+
+_ENTRY_POINTS = flags.DEFINE_list(
+    "entry_points", list(ENTRY_POINTS), "The entry point modules to measure."
+)
+
+_SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_BUDGET_PATH = os.path.join(os.path.dirname(__file__), "startup_budget.json")
+_IMPORT_TIME_PREFIX = "import time:"
+
+
+def _parse_import_times(
+    stderr: str, module: str
+) -> tuple[int, list[tuple[str, int]]]:
+  """Parses the output of `python -X importtime`.
+
+  Each import is printed once it completes, after the imports it made, which
+  are indented one level deeper. The cumulative times of the unindented imports
+  add up to the total, and the imports made directly by the module are those
+  one level deep printed between the previous unindented import and the
+  module's own line.
+
+  Args:
+    stderr: The output of `python -X importtime -c "import <module>"`.
+    module: The imported module.
+
+  Returns:
+    The total import time, and the cumulative time of each import made directly
+    by the module, in microseconds.
+  """
+  total_us = 0
+  children = []
+  pending = []
+  for line in stderr.splitlines():
+    if not line.startswith(_IMPORT_TIME_PREFIX):
+      continue
+    fields = line[len(_IMPORT_TIME_PREFIX):].split("|")
+    if len(fields) != 3 or not fields[1].strip().isdigit():
+      continue  # The header line.
+    name = fields[2][1:]
+    depth = (len(name) - len(name.lstrip(" "))) // 2
+    cumulative_us = int(fields[1])
+    if depth == 0:
+      total_us += cumulative_us
+      if name == module:
+        children = pending
+      pending = []
+    elif depth == 1:
+      pending.append((name.strip(), cumulative_us))
+  return total_us, children
+
+
+def measure(module: str) -> tuple[int, list[tuple[str, int]]]:
+  """Returns the import times of a module in a fresh interpreter.
+
+  Args:
+    module: The module to import.
+
+  Returns:
+    The total import time, and the cumulative time of each import made directly
+    by the module, in microseconds.
+  """
+  result = subprocess.run(
+      [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+      cwd=_SRC_DIR,
+      capture_output=True,
+      text=True,
+      check=False,
+  )
+  if result.returncode:
+    raise RuntimeError(f"Failed to import {module}:\n{result.stderr}")
+  return _parse_import_times(result.stderr, module)
+
+
+def _load_budget() -> dict[str, float]:
+  """Returns the import time budget of each entry point, in milliseconds."""
+  if not os.path.exists(_BUDGET_PATH):
+    return {}
+  with open(_BUDGET_PATH, "r", encoding="utf-8") as f:
+    return json.load(f)
+
+
+def main(argv: Sequence[str]) -> None:
+  del argv  # Unused.
+  budget = _load_budget()
+  measured = {}
+  over_budget = []
+
+  for module in _ENTRY_POINTS.value:
+    total_us, imports = min(
+        (measure(module) for _ in range(_RUNS.value)), key=lambda run: run[0]
+    )
+    total_ms = total_us / 1000
+    measured[module] = total_ms
+
+    limit_ms = budget.get(module)
+    status = ""
+    if limit_ms is not None:
+      status = f"  (budget {limit_ms:.0f} ms)"
+      if total_ms > limit_ms:
+        status += "  OVER BUDGET"
+        over_budget.append(module)
+    print(f"{module:<52}{total_ms:>10.1f} ms{status}")
+    for name, us in sorted(imports, key=lambda i: i[1], reverse=True)[
+        : _TOP.value
+    ]:
+      print(f"  {name:<50}{us / 1000:>10.1f} ms")
+
+  if _WRITE_BUDGET.value:
+    # Entry points not measured in this run keep their budget.
+    budget.update(
+        (module, round(total_ms * _HEADROOM.value))
+        for module, total_ms in measured.items()
+    )
+    with open(_BUDGET_PATH, "w", encoding="utf-8") as f:
+      json.dump(budget, f, indent=2)
+      f.write("\n")
+    print(f"Wrote the budget to {_BUDGET_PATH}")
+
+  if _ENFORCE_BUDGET.value and over_budget:
+    sys.exit(f"Import time over budget: {', '.join(over_budget)}")
+
+
+if __name__ == "__main__":
+  app.run(main)
@@ -0,0 +1,43 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Timing helpers shared by the benchmarks."""
+
+from collections.abc import Awaitable, Callable
+import time
+from typing import Any
+
+
+def time_per_call(fn: Callable[[], Any], iterations: int) -> float:
+  """Returns the mean wall-clock seconds of a call to fn."""
+  start = time.perf_counter()
+  for _ in range(iterations):
+    fn()
+  return (time.perf_counter() - start) / iterations
+
+
+async def async_time_per_call(
+    fn: Callable[[], Awaitable[Any]], iterations: int
+) -> float:
+  """Returns the mean wall-clock seconds of an awaited call to fn."""
+  start = time.perf_counter()
+  for _ in range(iterations):
+    await fn()
+  return (time.perf_counter() - start) / iterations
+
+
+def format_result(label: str, seconds: float) -> str:
+  """Formats a per-call time as a fixed-width line in microseconds."""
+  return f"{label:<48}{seconds * 1e6:>12.2f} us"
@@ -0,0 +1,99 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Measures the validation saved by handing validated mandates to the tools.
+
+BaseServerExecutor validates an incoming PaymentMandate once, and replaces the
+raw value in the data parts with the validated model. Each tool that parses
+the mandate with message_utils.parse_canonical_object then gets that model
+back instead of validating the raw value again. For a request whose tool
+parses the mandate --tool_parses times, prints the validation time per request
+with and without the replacement, and the saving. That a validated mandate is
+returned as is, and a raw value still validated, is covered by
+tests/common/message_utils_test.py.
+
+Usage:
+  python -m benchmarks.trusted_mandates --tool_parses=2
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+from absl import app
+from absl import flags
+
+from ap2.types import wire
+from ap2.types.mandate import PAYMENT_MANDATE_DATA_KEY
+from ap2.types.mandate import PaymentMandate
+from benchmarks import payloads
+from benchmarks import timing
+from common import message_utils
+
+_ITERATIONS = flags.DEFINE_integer(
+    "iterations", 2000, "The number of requests to time."
+)
+_TOOL_PARSES = flags.DEFINE_integer(
+    "tool_parses",
+    1,
+    "How many times the tool parses the PaymentMandate; the credentials"
+    " provider parses it twice.",
+)
+
+
+def _revalidating_request(data_parts: list[dict[str, Any]]) -> None:
+  """Validates the mandate as the executor and tools did before."""
+  PaymentMandate.model_validate(
+      message_utils.find_data_part(PAYMENT_MANDATE_DATA_KEY, data_parts)
+  )
+  for _ in range(_TOOL_PARSES.value):
+    message_utils.parse_canonical_object(
+        PAYMENT_MANDATE_DATA_KEY, data_parts, PaymentMandate
+    )
+
+
+def _trusted_request(data_parts: list[dict[str, Any]]) -> None:
+  """Validates the mandate once and hands the model to the tools."""
+  payment_mandate = PaymentMandate.model_validate(
+      message_utils.find_data_part(PAYMENT_MANDATE_DATA_KEY, data_parts)
+  )
+  data_parts = message_utils.replace_data_part(
+      PAYMENT_MANDATE_DATA_KEY, data_parts, payment_mandate
+  )
+  for _ in range(_TOOL_PARSES.value):
+    message_utils.parse_canonical_object(
+        PAYMENT_MANDATE_DATA_KEY, data_parts, PaymentMandate
+    )
+
+
+def main(argv: Sequence[str]) -> None:
+  del argv  # Unused.
+  data_parts = [
+      {PAYMENT_MANDATE_DATA_KEY: wire.to_wire(payloads.payment_mandate())},
+      {"risk_data": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...fake_risk_data"},
+  ]
+  iterations = _ITERATIONS.value
+  revalidating = timing.time_per_call(
+      lambda: _revalidating_request(data_parts), iterations
+  )
+  trusted = timing.time_per_call(
+      lambda: _trusted_request(data_parts), iterations
+  )
+  print(timing.format_result("revalidating tools", revalidating))
+  print(timing.format_result("validated once", trusted))
+  print(timing.format_result("saved per request", revalidating - trusted))
+
+
+if __name__ == "__main__":
+  app.run(main)
@@ -0,0 +1,81 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Compares the full and the compact wire form of the AP2 mandates.
+
+For carts of increasing size, prints the JSON size of model_dump() and of
+ap2.types.wire.to_wire, and the time to encode and decode each. The round trip
+guarantee itself is covered by tests/ap2/types/wire_test.py.
+
+Usage:
+  python -m benchmarks.wire_size --iterations=2000
+"""
+
+from collections.abc import Sequence
+import json
+
+from absl import app
+from absl import flags
+
+from ap2.types import wire
+from ap2.types.mandate import CartMandate
+from benchmarks import payloads
+from benchmarks import timing
+
+_ITERATIONS = flags.DEFINE_integer(
+    "iterations", 2000, "The number of encodes and decodes to time."
+)
+_ITEM_COUNTS = flags.DEFINE_list(
+    "item_counts", ["1", "10", "100"], "The cart sizes to measure."
+)
+
+
+def main(argv: Sequence[str]) -> None:
+  del argv  # Unused.
+  iterations = _ITERATIONS.value
+  for item_count in (int(count) for count in _ITEM_COUNTS.value):
+    cart = payloads.cart_mandate(item_count=item_count)
+    full = json.dumps(cart.model_dump())
+    compact = json.dumps(wire.to_wire(cart))
+    print(f"\n[{item_count} item cart]")
+    print(f"{'full size':<48}{len(full):>12} bytes")
+    print(f"{'compact size':<48}{len(compact):>12} bytes")
+    print(timing.format_result(
+        "full encode",
+        timing.time_per_call(lambda: json.dumps(cart.model_dump()), iterations),
+    ))
+    print(timing.format_result(
+        "compact encode",
+        timing.time_per_call(
+            lambda: json.dumps(wire.to_wire(cart)), iterations
+        ),
+    ))
+    print(timing.format_result(
+        "full decode",
+        timing.time_per_call(
+            lambda: CartMandate.model_validate(json.loads(full)), iterations
+        ),
+    ))
+    print(timing.format_result(
+        "compact decode",
+        timing.time_per_call(
+            lambda: wire.from_wire(CartMandate, json.loads(compact)),
+            iterations,
+        ),
+    ))
+
+
+if __name__ == "__main__":
+  app.run(main)
@@ -0,0 +1,161 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A process-wide registry of PaymentRemoteA2aClient objects.
+
+Each PaymentRemoteA2aClient owns a pool of HTTP connections and caches the
+remote agent's AgentCard. Creating one per payment leaks sockets and repeats
+the TCP/TLS handshakes and the AgentCard fetch on every payment, so agents
+should obtain their clients from this registry instead. Clients are keyed by
+base URL and required extensions, and are shared until the process ends.
+
+Some base URLs come from peer data, such as the payment processor a mandate
+names, so the registry holds at most MAX_CLIENTS clients. The least recently
+used client is evicted beyond that, and closed once its in-flight messages
+have completed.
+
+Clients speak HTTP/2 when enabled through system_utils.HTTP2_ENV_VAR, so that
+concurrent messages to one remote agent share a single multiplexed connection.
+"""
+
+import asyncio
+import collections
+import logging
+from typing import Any
+
+import httpx
+
+from common import system_utils
+from common.payment_remote_a2a_client import PaymentRemoteA2aClient
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 60.0
+
+# The maximum number of clients kept in the registry.
+MAX_CLIENTS = 64
+
+# How often an evicted client is checked for in-flight messages before closing.
+_CLOSE_POLL_SECONDS = 1.0
+
+_limits = httpx.Limits(
+    max_connections=DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+)
+
+_clients: collections.OrderedDict[
+    tuple[str, frozenset[str]], PaymentRemoteA2aClient
+] = collections.OrderedDict()
+# Keeps the tasks closing evicted clients alive until they are done.
+_closing: set[asyncio.Task] = set()
+
+
+def configure_pool_limits(
+    max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+) -> None:
+  """Sets the connection pool limits of clients created from now on.
+
+  Args:
+    max_connections: The maximum number of connections to a remote agent.
+    max_keepalive_connections: The maximum number of idle connections kept
+      open to a remote agent.
+    keepalive_expiry: Seconds after which an idle connection is closed.
+  """
+  global _limits
+  _limits = httpx.Limits(
+      max_connections=max_connections,
+      max_keepalive_connections=max_keepalive_connections,
+      keepalive_expiry=keepalive_expiry,
+  )
+
+
+def get_client(
+    name: str,
+    base_url: str,
+    required_extensions: set[str] | None = None,
+) -> PaymentRemoteA2aClient:
+  """Returns the shared client for a remote agent, creating it if needed.
+
+  Args:
+    name: The name of the agent, used when first creating the client.
+    base_url: The base URL where the remote agent is hosted.
+    required_extensions: A set of extension URIs that the client requires.
+
+  Returns:
+    The PaymentRemoteA2aClient for the given base URL and extensions.
+  """
+  key = (base_url, frozenset(required_extensions or ()))
+  client = _clients.get(key)
+  if client is not None:
+    _clients.move_to_end(key)
+    return client
+
+  client = PaymentRemoteA2aClient(
+      name=name,
+      base_url=base_url,
+      required_extensions=set(key[1]),
+      limits=_limits,
+      http2=system_utils.http2_enabled(),
+  )
+  _clients[key] = client
+  while len(_clients) > MAX_CLIENTS:
+    _, evicted = _clients.popitem(last=False)
+    _close_when_idle(evicted)
+  return client
+
+
+async def close_all() -> None:
+  """Closes all registered clients and empties the registry."""
+  logging.info("A2A connection pool utilization: %s", pool_utilization())
+  clients = list(_clients.values())
+  _clients.clear()
+  for client in clients:
+    await client.aclose()
+  if _closing:
+    await asyncio.gather(*_closing, return_exceptions=True)
+
+
+def _close_when_idle(client: PaymentRemoteA2aClient) -> None:
+  """Closes an evicted client in the background, once it has no messages."""
+  try:
+    loop = asyncio.get_running_loop()
+  except RuntimeError:
+    # Without an event loop the client cannot be in use; its connections are
+    # released when it is garbage collected.
+    return
+  task = loop.create_task(_aclose_when_idle(client))
+  _closing.add(task)
+  task.add_done_callback(_closing.discard)
+
+
+async def _aclose_when_idle(client: PaymentRemoteA2aClient) -> None:
+  """Waits for the client's in-flight messages to complete, then closes it."""
+  while client.in_flight:
+    await asyncio.sleep(_CLOSE_POLL_SECONDS)
+  await client.aclose()
+
+
+def pool_utilization() -> dict[str, dict[str, Any]]:
+  """Returns the connection pool utilization of each registered client.
+
+  Returns:
+    A map of "<base_url> [<extensions>]" to the client's pool statistics.
+  """
+  return {
+      f"{base_url} [{', '.join(sorted(extensions))}]": client.pool_stats()
+      for (base_url, extensions), client in _clients.items()
+  }
@@ -0,0 +1,118 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Concurrent fan-out of independent A2A messages.
+
+Orchestration code often sends several messages that do not depend on each
+other, e.g. to two different remote agents. Sending them one after another
+costs the sum of their latencies; gather_a2a sends them concurrently, so the
+fan-out costs roughly the slowest of them.
+"""
+
+import asyncio
+from collections.abc import Sequence
+import time
+
+from a2a import types as a2a_types
+
+from common.payment_remote_a2a_client import PaymentRemoteA2aClient
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+class A2aCall:
+  """A message to send to a remote agent as part of a fan-out."""
+
+  def __init__(
+      self,
+      client: PaymentRemoteA2aClient,
+      message: a2a_types.Message,
+      timeout_seconds: float | None = None,
+      idempotent: bool = False,
+  ):
+    """Initialization.
+
+    Args:
+      client: The client of the remote agent to send the message to.
+      message: The message to send.
+      timeout_seconds: The deadline of the call, counted from the start of the
+        fan-out, so it includes any wait for a concurrency slot. None means no
+        deadline beyond the client's own timeouts. A call cut off by its
+        deadline releases its circuit breaker probe, if it was one.
+      idempotent: Whether the message can safely be processed more than once.
+    """
+    self.client = client
+    self.message = message
+    self.timeout_seconds = timeout_seconds
+    self.idempotent = idempotent
+
+
+class A2aCallResult:
+  """The outcome of one A2aCall: either a Task or the error that occurred."""
+
+  def __init__(
+      self,
+      call: A2aCall,
+      task: a2a_types.Task | None = None,
+      error: Exception | None = None,
+  ):
+    self.call = call
+    self.task = task
+    self.error = error
+
+  @property
+  def ok(self) -> bool:
+    """Whether the call returned a Task."""
+    return self.error is None
+
+
+async def gather_a2a(
+    calls: Sequence[A2aCall],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> list[A2aCallResult]:
+  """Sends the messages concurrently and returns all their outcomes.
+
+  A failing or timed out call does not cancel the other calls; its error is
+  reported in its result instead, so callers can act on partial results.
+
+  Args:
+    calls: The messages to send, with their clients and deadlines.
+    max_concurrency: The maximum number of messages in flight at once.
+
+  Returns:
+    One A2aCallResult per call, in the order of the calls.
+  """
+  semaphore = asyncio.Semaphore(max_concurrency)
+  start = time.monotonic()
+
+  async def _send(call: A2aCall) -> A2aCallResult:
+    try:
+      async with semaphore:
+        send = call.client.send_a2a_message(
+            call.message, idempotent=call.idempotent
+        )
+        if call.timeout_seconds is None:
+          task = await send
+        else:
+          remaining = call.timeout_seconds - (time.monotonic() - start)
+          if remaining <= 0:
+            send.close()
+            raise asyncio.TimeoutError()
+          task = await asyncio.wait_for(send, remaining)
+      return A2aCallResult(call, task=task)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+      return A2aCallResult(call, error=e)
+
+  return list(await asyncio.gather(*(_send(call) for call in calls)))
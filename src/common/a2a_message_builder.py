@@ -18,12 +18,37 @@ from typing import Any, Self
 import uuid
 
 from a2a import types as a2a_types
+from ap2.types import wire
+from common import binary_data_parts
+from pydantic import BaseModel
+
+
+def _to_json_data(data: Any) -> Any:
+  """Converts a pydantic model, or a list of them, to its wire form."""
+  if isinstance(data, BaseModel):
+    return wire.to_wire(data)
+  if isinstance(data, list) and data and isinstance(data[0], BaseModel):
+    return [wire.to_wire(item) for item in data]
+  return data
 
 
 class A2aMessageBuilder:
-  """A builder class for building an A2A Message object."""
+  """A builder class for building an A2A Message object.
+
+  A builder created with a binary_encoding adds the DataParts carrying mandates
+  as binary blobs (see binary_data_parts.py). Only use it for a message to an
+  agent known to accept that encoding; PaymentRemoteA2aClient negotiates the
+  encoding itself, from the remote agent's AgentCard, when sending a message.
+  """
+
+  def __init__(self, binary_encoding: str | None = None):
+    """Initialization.
 
-  def __init__(self):
+    Args:
+      binary_encoding: The encoding of the DataParts carrying mandates, e.g.
+        binary_data_parts.MSGPACK, or None to add them as JSON.
+    """
+    self._binary_encoding = binary_encoding
     self._message = self._create_base_message()
 
   def add_text(self, text: str) -> Self:
@@ -39,7 +64,11 @@ class A2aMessageBuilder:
     self._message.parts.append(part)
     return self
 
-  def add_data(self, key: str, data: str | dict[str, Any]) -> Self:
+  def add_data(
+      self,
+      key: str,
+      data: str | dict[str, Any] | BaseModel | list[BaseModel],
+  ) -> Self:
     """Adds a new DataPart to the Message.
 
     If a key is provided, then the data part must be a string.  The DataPart's
@@ -48,6 +77,10 @@ class A2aMessageBuilder:
     If no key is provided, then the data part must be a dictionary.  The
     DataPart's data dictionary will be set to data.
 
+    Pydantic models, and lists of them, are serialized here, once and straight
+    to their compact wire form (see ap2.types.wire), so callers should pass the
+    model itself rather than a model_dump() of it.
+
     Args:
       key: The key to use for the data part.
       data: The data to accompany the key, if provided.  Otherwise, the data to
@@ -59,9 +92,13 @@ class A2aMessageBuilder:
     if not data:
       return self
 
-    nested_data = data
+    nested_data = _to_json_data(data)
     if key:
-      nested_data = {key: data}
+      nested_data = {key: nested_data}
+    if self._binary_encoding and binary_data_parts.should_encode(nested_data):
+      nested_data = binary_data_parts.encode_data(
+          nested_data, self._binary_encoding
+      )
 
     part = a2a_types.Part(root=a2a_types.DataPart(data=nested_data))
     self._message.parts.append(part)
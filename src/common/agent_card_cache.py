@@ -0,0 +1,220 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""A process-wide cache of remote AgentCards.
+
+Fetching an AgentCard costs an HTTP round trip before the first message to a
+remote agent. This cache shares the cards between all PaymentRemoteA2aClient
+objects and:
+1. Serves a cached card for ttl_seconds, then keeps serving it while a
+   background task refreshes it.
+2. Replaces the card when the refreshed card differs, so clients rebuild their
+   A2A client against the new card.
+3. Optionally persists the cards to an on-disk snapshot, set through the
+   AP2_AGENT_CARD_SNAPSHOT environment variable, so a freshly started agent can
+   send its first message without a discovery round trip. Agents sharing a
+   snapshot merge their cards into it.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import Any
+
+from a2a import types as a2a_types
+from a2a.client.card_resolver import A2ACardResolver
+import httpx
+import pydantic
+
+DEFAULT_TTL_SECONDS = 300.0
+
+# Environment variable holding the path of the on-disk snapshot.
+SNAPSHOT_PATH_ENV_VAR = "AP2_AGENT_CARD_SNAPSHOT"
+
+
+class _Entry:
+  """A cached AgentCard and the monotonic time it was last fetched."""
+
+  def __init__(self, card: a2a_types.AgentCard, fetched_at: float):
+    self.card = card
+    self.fetched_at = fetched_at
+
+
+class AgentCardCache:
+  """A cache of AgentCards keyed by the base URL of the remote agent."""
+
+  def __init__(
+      self,
+      ttl_seconds: float = DEFAULT_TTL_SECONDS,
+      snapshot_path: str | None = None,
+  ):
+    """Initialization.
+
+    Args:
+      ttl_seconds: How long a card is served before it is refreshed.
+      snapshot_path: The path of the on-disk snapshot, if any. Cards in an
+        existing snapshot are loaded immediately, and are refreshed in the
+        background on first use.
+    """
+    self._ttl_seconds = ttl_seconds
+    self._snapshot_path = snapshot_path
+    self._entries: dict[str, _Entry] = {}
+    self._fetches: dict[str, asyncio.Task] = {}
+    if snapshot_path:
+      self._load_snapshot()
+
+  async def get(
+      self, base_url: str, httpx_client: httpx.AsyncClient
+  ) -> a2a_types.AgentCard:
+    """Returns the AgentCard of the remote agent at the base URL.
+
+    Only the first request for a base URL waits for the card to be fetched.
+    Afterwards the cached card is returned immediately, and a stale card is
+    refreshed in the background.
+
+    Args:
+      base_url: The base URL where the remote agent is hosted.
+      httpx_client: The client used to fetch the card.
+
+    Returns:
+      The remote agent's AgentCard.
+    """
+    entry = self._entries.get(base_url)
+    if entry is None:
+      # Concurrent callers share the fetch, so cancelling one of them must not
+      # cancel it for the others.
+      return await asyncio.shield(self._fetch(base_url, httpx_client))
+    if time.monotonic() - entry.fetched_at >= self._ttl_seconds:
+      self._fetch(base_url, httpx_client)
+    return entry.card
+
+  def put(self, base_url: str, card: a2a_types.AgentCard) -> None:
+    """Stores a freshly fetched card, replacing the cached card if changed."""
+    entry = self._entries.get(base_url)
+    if entry is not None and entry.card == card:
+      # Keep the cached object, so clients keep their A2A client.
+      entry.fetched_at = time.monotonic()
+      return
+    if entry is not None:
+      logging.info("AgentCard at %s changed, replacing it.", base_url)
+    self._entries[base_url] = _Entry(card, time.monotonic())
+    self._save_snapshot()
+
+  def invalidate(self, base_url: str) -> None:
+    """Drops the cached card, so the next request fetches it again."""
+    if self._entries.pop(base_url, None) is not None:
+      self._save_snapshot(removed=base_url)
+
+  def _fetch(
+      self, base_url: str, httpx_client: httpx.AsyncClient
+  ) -> asyncio.Task:
+    """Starts fetching the card, unless a fetch is already in progress."""
+    fetch = self._fetches.get(base_url)
+    if fetch is None:
+      fetch = asyncio.ensure_future(self._resolve(base_url, httpx_client))
+      self._fetches[base_url] = fetch
+      fetch.add_done_callback(lambda _: self._fetches.pop(base_url, None))
+    return fetch
+
+  async def _resolve(
+      self, base_url: str, httpx_client: httpx.AsyncClient
+  ) -> a2a_types.AgentCard:
+    """Fetches the card from the remote agent and caches it."""
+    try:
+      resolver = A2ACardResolver(httpx_client=httpx_client, base_url=base_url)
+      self.put(base_url, await resolver.get_agent_card())
+    except Exception:  # pylint: disable=broad-exception-caught
+      entry = self._entries.get(base_url)
+      if entry is None:
+        raise
+      # A failed background refresh keeps serving the cached card.
+      logging.warning("Failed to refresh AgentCard at %s.", base_url)
+      return entry.card
+    return self._entries[base_url].card
+
+  def _load_snapshot(self) -> None:
+    """Loads the valid cards of the on-disk snapshot, if it exists."""
+    for base_url, card in self._read_snapshot().items():
+      try:
+        card = a2a_types.AgentCard.model_validate(card)
+      except pydantic.ValidationError:
+        logging.warning("Ignoring invalid AgentCard snapshot of %s.", base_url)
+        continue
+      # Loaded cards are treated as stale, so they are refreshed on first use.
+      self._entries[base_url] = _Entry(card, -self._ttl_seconds)
+
+  def _read_snapshot(self) -> dict[str, Any]:
+    """Returns the raw cards of the on-disk snapshot, keyed by base URL."""
+    try:
+      with open(self._snapshot_path, "r", encoding="utf-8") as f:
+        snapshot = json.load(f)
+    except FileNotFoundError:
+      return {}
+    except (OSError, ValueError):
+      logging.warning("Ignoring unreadable AgentCard snapshot.", exc_info=True)
+      return {}
+    if not isinstance(snapshot, dict):
+      logging.warning("Ignoring malformed AgentCard snapshot.")
+      return {}
+    return snapshot
+
+  def _save_snapshot(self, removed: str | None = None) -> None:
+    """Writes the cached cards to the on-disk snapshot, if configured.
+
+    Several agents may share a snapshot, so the cards are merged into the
+    snapshot on disk rather than replacing it: cards cached by other agents
+    are kept.
+
+    Args:
+      removed: The base URL of a card just invalidated, to drop from the
+        snapshot.
+    """
+    if not self._snapshot_path:
+      return
+    snapshot = self._read_snapshot()
+    snapshot.pop(removed, None)
+    snapshot.update(
+        (
+            base_url,
+            entry.card.model_dump(
+                mode="json", by_alias=True, exclude_none=True
+            ),
+        )
+        for base_url, entry in self._entries.items()
+    )
+    # Each process writes its own temporary file, so concurrent writers never
+    # interleave their writes; the last os.replace wins.
+    temp_path = f"{self._snapshot_path}.{os.getpid()}.tmp"
+    try:
+      with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(snapshot, f)
+      os.replace(temp_path, self._snapshot_path)
+    except OSError:
+      logging.warning("Failed to write AgentCard snapshot.", exc_info=True)
+
+
+_default_cache: AgentCardCache | None = None
+
+
+def default_cache() -> AgentCardCache:
+  """Returns the process-wide AgentCardCache, creating it on first use."""
+  global _default_cache
+  if _default_cache is None:
+    _default_cache = AgentCardCache(
+        snapshot_path=os.environ.get(SNAPSHOT_PATH_ENV_VAR)
+    )
+  return _default_cache
@@ -14,18 +14,95 @@
 
 """Helper functions for working with A2A Artifact objects."""
 
+from collections.abc import Iterable
 from typing import Any, TypeVar
 
 from a2a.types import Artifact
-from a2a.utils import message as message_utils
+from a2a.types import DataPart
 from pydantic import BaseModel
 
+from common import binary_data_parts
+from common import message_utils
+
 T = TypeVar("T")
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class ArtifactIndex:
+  """An index of the DataParts within a list of artifacts.
+
+  Build one index per Task and reuse it for every key read from that Task.
+  The artifacts are walked once, when the index is created. DataParts are
+  only decoded, and the key map only built, when first needed. Canonical
+  objects are validated when first requested, all at once, and then cached,
+  so asking for the same objects again is free.
+  """
+
+  def __init__(self, artifacts: Iterable[Artifact] | None):
+    """Initialization.
+
+    Args:
+      artifacts: The artifacts to index, e.g. a Task's artifacts.
+    """
+    self._raw_data_parts = [
+        part.root.data
+        for artifact in artifacts or ()
+        for part in artifact.parts
+        if isinstance(part.root, DataPart)
+    ]
+    self._data_parts = None
+    self._values = None
+    self._canonical_objects = {}
+
+  @property
+  def data_parts(self) -> list[dict[str, Any]]:
+    """The data of every DataPart, in artifact order."""
+    if self._data_parts is None:
+      self._data_parts = [
+          binary_data_parts.decode_data(data) for data in self._raw_data_parts
+      ]
+    return self._data_parts
+
+  def first_data_part(self) -> dict[str, Any]:
+    """Returns the data of the first DataPart, or an empty dict if none."""
+    if not self._raw_data_parts:
+      return {}
+    if self._data_parts is not None:
+      return self._data_parts[0]
+    return binary_data_parts.decode_data(self._raw_data_parts[0])
+
+  def values(self, data_key: str) -> list[Any]:
+    """Returns the raw values for the data key, in artifact order."""
+    if self._values is None:
+      self._values = {}
+      for data in self.data_parts:
+        for key, value in data.items():
+          self._values.setdefault(key, []).append(value)
+    return self._values.get(data_key, [])
+
+  def canonical_objects(
+      self, data_key: str, model: type[ModelT]
+  ) -> list[ModelT]:
+    """Returns the canonical objects stored under the data key.
+
+    Args:
+      data_key: The key of the DataParts holding the objects.
+      model: The model of the canonical object.
+
+    Returns:
+      The validated objects, in artifact order.
+    """
+    cache_key = (data_key, model)
+    objects = self._canonical_objects.get(cache_key)
+    if objects is None:
+      objects = message_utils.validate_all(model, self.values(data_key))
+      self._canonical_objects[cache_key] = objects
+    return objects
 
 
 def find_canonical_objects(
-    artifacts: list[Artifact], data_key: str, model: BaseModel
-) -> list[BaseModel]:
+    artifacts: list[Artifact], data_key: str, model: type[ModelT]
+) -> list[ModelT]:
   """Finds all canonical objects of the given type in the artifacts.
 
   Args:
@@ -36,12 +113,9 @@ def find_canonical_objects(
   Returns:
     A list of canonical objects of the given type in the artifacts.
   """
-  canonical_objects = []
-  for artifact in artifacts:
-    for part in artifact.parts:
-      if hasattr(part.root, "data") and data_key in part.root.data:
-        canonical_objects.append(model.model_validate(part.root.data[data_key]))
-  return canonical_objects
+  # Callers reading several keys from one Task should hold an ArtifactIndex
+  # instead, so the artifacts are only decoded once.
+  return ArtifactIndex(artifacts).canonical_objects(data_key, model)
 
 
 def get_first_data_part(artifacts: list[Artifact]) -> dict[str, Any]:
@@ -51,14 +125,13 @@ def get_first_data_part(artifacts: list[Artifact]) -> dict[str, Any]:
     artifacts: The artifacts to be searched for a DataPart.
 
   Returns:
-    The data contents within the first found DataPart.
+    The data contents within the first found DataPart, or an empty dict if
+    there is none.
   """
-  data_parts = [
-      message_utils.get_data_parts(artifact.parts) for artifact in artifacts
-  ]
-  for data_part in data_parts:
-    for item in data_part:
-      return item
+  for artifact in artifacts:
+    for part in artifact.parts:
+      if isinstance(part.root, DataPart):
+        return binary_data_parts.decode_data(part.root.data)
   return {}
 
 
@@ -25,6 +25,7 @@ watch_log.py for more details.
 
 import abc
 import logging
+import time
 from typing import Any, Callable, Tuple
 import uuid
 
@@ -37,7 +38,6 @@ from a2a.types import Task
 from a2a.types import TextPart
 from a2a.utils import message
 from ap2.types.mandate import PAYMENT_MANDATE_DATA_KEY
-from google import genai
 from ap2.types.mandate import PaymentMandate
 from common import message_utils
 from common import watch_log
@@ -68,13 +68,26 @@ class BaseServerExecutor(AgentExecutor, abc.ABC):
       self._supported_extension_uris = {ext.uri for ext in supported_extensions}
     else:
       self._supported_extension_uris = set()
-    self._client = genai.Client()
     self._tools = tools
-    self._tool_resolver = FunctionCallResolver(
-        self._client, self._tools, system_prompt
-    )
+    self._tool_instructions = system_prompt
+    self._resolver = None
     super().__init__()
 
+  @property
+  def _tool_resolver(self) -> FunctionCallResolver:
+    """The FunctionCallResolver, created on the first request.
+
+    google.genai takes long to import, so it is only imported once a request
+    needs a tool resolved, rather than when the agent starts or reloads.
+    """
+    if self._resolver is None:
+      from google import genai  # pylint: disable=g-import-not-at-top
+
+      self._resolver = FunctionCallResolver(
+          genai.Client(), self._tools, self._tool_instructions
+      )
+    return self._resolver
+
   async def execute(
       self, context: RequestContext, event_queue: EventQueue
   ) -> None:
@@ -96,8 +109,12 @@ class BaseServerExecutor(AgentExecutor, abc.ABC):
           PAYMENT_MANDATE_DATA_KEY, data_parts
       )
       if payment_mandate is not None:
-        validate_payment_mandate_signature(
-            PaymentMandate.model_validate(payment_mandate)
+        payment_mandate = PaymentMandate.model_validate(payment_mandate)
+        validate_payment_mandate_signature(payment_mandate)
+        # The tools get the validated mandate, rather than validating the raw
+        # value again.
+        data_parts = message_utils.replace_data_part(
+            PAYMENT_MANDATE_DATA_KEY, data_parts, payment_mandate
         )
     else:
       raise ValueError(
@@ -142,6 +159,10 @@ class BaseServerExecutor(AgentExecutor, abc.ABC):
       updater: The TaskUpdater instance for updating the task.
       current_task: The current Task, if available.
     """
+    start = time.perf_counter()
+    tool_name = None
+    tool_start = None
+    status = "ok"
     try:
       prompt = (text_parts[0] if text_parts else "").strip()
       tool_name = self._tool_resolver.determine_tool_to_use(prompt)
@@ -155,14 +176,30 @@ class BaseServerExecutor(AgentExecutor, abc.ABC):
             f"Expected 1 tool matching {tool_name}, got {len(matching_tools)}"
         )
       callable_tool = matching_tools[0]
+      tool_start = time.perf_counter()
       await callable_tool(data_parts, updater, current_task)
 
     except Exception as e:  # pylint: disable=broad-exception-caught
+      status = "error"
       error_message = updater.new_agent_message(
           parts=[Part(root=TextPart(text=f"An error occurred: {e}"))]
       )
       await updater.failed(message=error_message)
 
+    finally:
+      end = time.perf_counter()
+      resolve_end = tool_start if tool_start is not None else end
+      watch_log.log_event(
+          watch_log.TOOL_CALL_EVENT,
+          context_id=updater.context_id,
+          task_id=updater.task_id,
+          tool=tool_name,
+          status=status,
+          resolve_ms=(resolve_end - start) * 1000,
+          tool_ms=(end - resolve_end) * 1000,
+          duration_ms=(end - start) * 1000,
+      )
+
   def _parse_request(
       self, context: RequestContext
   ) -> Tuple[list[str], list[dict[str, Any]]]:
@@ -176,7 +213,7 @@ class BaseServerExecutor(AgentExecutor, abc.ABC):
     """
     parts = context.message.parts if context.message else []
     text_parts = message.get_text_parts(parts)
-    data_parts = message.get_data_parts(parts)
+    data_parts = message_utils.decode_data_parts(message.get_data_parts(parts))
     return text_parts, data_parts
 
   def _handle_extensions(self, context: RequestContext) -> None:
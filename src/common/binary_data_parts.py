@@ -0,0 +1,228 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Negotiated binary encoding of the mandate DataParts exchanged by agents.
+
+An agent that accepts binary DataParts advertises the BINARY_DATA_EXTENSION_URI
+extension in its agent.json, listing the encodings it can decode in the
+extension's params, e.g. {"encodings": ["msgpack", "cbor"]}. A client that
+sees the extension on the remote agent's card encodes the DataParts carrying
+mandates with the first encoding both sides support, and requests the
+extension on the message.
+
+An encoded DataPart holds a single BINARY_DATA_KEY entry:
+
+  {"ap2.extensions.BinaryData": {"encoding": "msgpack", "data": "<base64>"}}
+
+where data is the base64 encoding of the original DataPart data. The receiver
+restores the original data before any tool sees it (see
+message_utils.decode_data_parts), so tools are unaware of the encoding.
+
+Decoding a binary blob is much cheaper than parsing and validating the same
+mandate as nested JSON, but base64 makes the blob about a third larger than
+the binary encoding itself, and it compresses worse than JSON. See
+benchmarks.binary_data_parts for the trade-off on mandates of various sizes.
+
+MessagePack requires the optional msgspec dependency and CBOR the optional
+cbor2 dependency (pip install google_ap2[msgspec,cbor]). Encodings whose
+dependency is missing are neither advertised nor used.
+"""
+
+import base64
+from collections.abc import Callable, Sequence
+import functools
+from typing import Any
+
+from a2a import types as a2a_types
+from ap2.types.mandate import CART_MANDATE_DATA_KEY
+from ap2.types.mandate import INTENT_MANDATE_DATA_KEY
+from ap2.types.mandate import PAYMENT_MANDATE_DATA_KEY
+
+BINARY_DATA_EXTENSION_URI = (
+    "https://github.com/google-agentic-commerce/ap2/extensions/binary-data/v1"
+)
+BINARY_DATA_KEY = "ap2.extensions.BinaryData"
+
+MSGPACK = "msgpack"
+CBOR = "cbor"
+
+# The encodings a client uses, in order of preference, if both sides support
+# them. msgspec decodes MessagePack several times faster than cbor2 does CBOR.
+DEFAULT_ENCODINGS = (MSGPACK, CBOR)
+
+# Only the DataParts carrying one of these are encoded; the small ones, such as
+# risk_data or debug_mode, cost more to encode than they save.
+ENCODED_DATA_KEYS = frozenset({
+    CART_MANDATE_DATA_KEY,
+    INTENT_MANDATE_DATA_KEY,
+    PAYMENT_MANDATE_DATA_KEY,
+})
+
+_Codec = tuple[Callable[[Any], bytes], Callable[[bytes], Any]]
+
+
+@functools.cache
+def _codec(encoding: str) -> _Codec | None:
+  """Returns the encode and decode functions of an encoding, if installed."""
+  # The codecs are optional dependencies, so they are imported on demand.
+  # pylint: disable=g-import-not-at-top
+  if encoding == MSGPACK:
+    try:
+      import msgspec
+    except ImportError:
+      return None
+    return msgspec.msgpack.encode, msgspec.msgpack.decode
+  if encoding == CBOR:
+    try:
+      import cbor2
+    except ImportError:
+      return None
+    return cbor2.dumps, cbor2.loads
+  # pylint: enable=g-import-not-at-top
+  return None
+
+
+def available_encodings() -> list[str]:
+  """Returns the encodings whose dependency is installed."""
+  return [encoding for encoding in DEFAULT_ENCODINGS if _codec(encoding)]
+
+
+def advertised_encodings(agent_card: a2a_types.AgentCard) -> list[str]:
+  """Returns the encodings the agent accepts, or none without the extension."""
+  for extension in agent_card.capabilities.extensions or []:
+    if extension.uri == BINARY_DATA_EXTENSION_URI:
+      return list((extension.params or {}).get("encodings", []))
+  return []
+
+
+def negotiate(
+    agent_card: a2a_types.AgentCard,
+    preferred: Sequence[str] = DEFAULT_ENCODINGS,
+) -> str | None:
+  """Returns the preferred encoding that both sides support, if any.
+
+  Args:
+    agent_card: The AgentCard of the remote agent.
+    preferred: The encodings this agent is willing to send, best first.
+
+  Returns:
+    The encoding to use, or None to send the DataParts as JSON.
+  """
+  accepted = advertised_encodings(agent_card)
+  for encoding in preferred:
+    if encoding in accepted and _codec(encoding):
+      return encoding
+  return None
+
+
+def restrict_to_available(agent_card: a2a_types.AgentCard) -> None:
+  """Removes the encodings this agent cannot decode from its own AgentCard.
+
+  The extension itself is removed if none of its encodings is installed, so
+  an agent never advertises an encoding it would fail to decode.
+  """
+  extensions = agent_card.capabilities.extensions
+  if not extensions:
+    return
+  available = available_encodings()
+  for extension in list(extensions):
+    if extension.uri != BINARY_DATA_EXTENSION_URI:
+      continue
+    encodings = [
+        encoding
+        for encoding in advertised_encodings(agent_card)
+        if encoding in available
+    ]
+    if encodings:
+      extension.params = {**(extension.params or {}), "encodings": encodings}
+    else:
+      extensions.remove(extension)
+
+
+def should_encode(data: dict[str, Any]) -> bool:
+  """Returns whether the DataPart data carries a mandate worth encoding."""
+  return not ENCODED_DATA_KEYS.isdisjoint(data)
+
+
+def is_encoded(data: dict[str, Any]) -> bool:
+  """Returns whether the DataPart data is a binary blob."""
+  return BINARY_DATA_KEY in data
+
+
+def encode_data(data: dict[str, Any], encoding: str) -> dict[str, Any]:
+  """Encodes DataPart data, which must be in its JSON wire form.
+
+  Args:
+    data: The data of the DataPart.
+    encoding: The encoding to use, e.g. MSGPACK.
+
+  Returns:
+    The data of the encoded DataPart.
+
+  Raises:
+    ValueError: If the encoding is unknown or its dependency is missing.
+  """
+  codec = _codec(encoding)
+  if codec is None:
+    raise ValueError(f"Unsupported DataPart encoding: {encoding}")
+  blob = base64.b64encode(codec[0](data)).decode("ascii")
+  return {BINARY_DATA_KEY: {"encoding": encoding, "data": blob}}
+
+
+def decode_data(data: dict[str, Any]) -> dict[str, Any]:
+  """Restores the original data of a DataPart encoded by encode_data.
+
+  Data that is not encoded is returned unchanged.
+
+  Raises:
+    ValueError: If the blob is malformed, or its encoding is unknown or its
+      dependency is missing.
+  """
+  if not is_encoded(data):
+    return data
+  blob = data[BINARY_DATA_KEY]
+  encoding = blob.get("encoding") if isinstance(blob, dict) else None
+  codec = _codec(encoding)
+  if codec is None:
+    raise ValueError(f"Unsupported DataPart encoding: {encoding}")
+  try:
+    decoded = codec[1](base64.b64decode(blob.get("data", ""), validate=True))
+  except Exception as e:  # pylint: disable=broad-exception-caught
+    raise ValueError(f"Malformed {encoding} DataPart: {e}") from e
+  if not isinstance(decoded, dict):
+    raise ValueError(f"Malformed {encoding} DataPart: not an object.")
+  return decoded
+
+
+def encode_message(
+    message: a2a_types.Message, encoding: str
+) -> a2a_types.Message:
+  """Returns a copy of the message with its mandate DataParts encoded.
+
+  The message itself is left unchanged, so that it can be sent again, e.g. to
+  an agent that does not support the encoding.
+  """
+  parts = []
+  for part in message.parts:
+    root = part.root
+    if (
+        isinstance(root, a2a_types.DataPart)
+        and should_encode(root.data)
+        and not is_encoded(root.data)
+    ):
+      root = root.model_copy(update={"data": encode_data(root.data, encoding)})
+      part = a2a_types.Part.model_construct(root=root)
+    parts.append(part)
+  return message.model_copy(update={"parts": parts})
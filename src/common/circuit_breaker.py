@@ -0,0 +1,193 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Per remote agent circuit breakers.
+
+When a remote agent is down, every request to it would otherwise wait for a
+connection or response timeout. A CircuitBreaker tracks consecutive failures
+to one remote agent and, once they reach a threshold, opens: requests then fail
+immediately with CircuitOpenError. After a cool-down the breaker lets a single
+probe request through (half-open), and closes again if the probe succeeds.
+
+Breakers are kept per base URL, for at most MAX_BREAKERS remote agents, the
+least recently used being evicted first. Their state is logged to watch.log on
+every state transition. metrics returns a snapshot of every breaker's counters,
+which servers serve at their metrics path (see server.py) and log to watch.log
+when they shut down.
+"""
+
+import collections
+import time
+from typing import Any
+
+from common import watch_log
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT_SECONDS = 30.0
+
+# The maximum number of breakers kept. Some base URLs come from peer data, so,
+# like a2a_client_registry.MAX_CLIENTS, this bounds what peers can allocate.
+MAX_BREAKERS = 64
+
+# Event logged to watch.log when a breaker changes state.
+CIRCUIT_BREAKER_EVENT = "circuit_breaker"
+
+# Event logged to watch.log with the counters of every breaker.
+CIRCUIT_BREAKER_METRICS_EVENT = "circuit_breaker_metrics"
+
+
+class CircuitOpenError(RuntimeError):
+  """Raised instead of calling a remote agent whose circuit is open."""
+
+
+class CircuitBreaker:
+  """A circuit breaker guarding the requests to one remote agent."""
+
+  def __init__(
+      self,
+      name: str,
+      failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+      reset_timeout_seconds: float = DEFAULT_RESET_TIMEOUT_SECONDS,
+  ):
+    """Initialization.
+
+    Args:
+      name: Identifies the guarded remote agent, e.g. its base URL.
+      failure_threshold: Consecutive failures after which the breaker opens.
+      reset_timeout_seconds: How long the breaker stays open before letting a
+        probe request through.
+    """
+    self._name = name
+    self._failure_threshold = failure_threshold
+    self._reset_timeout_seconds = reset_timeout_seconds
+    self._state = CLOSED
+    self._consecutive_failures = 0
+    self._opened_at = 0.0
+    self._probe_in_flight = False
+    self._opened_total = 0
+    self._rejected_total = 0
+
+  @property
+  def state(self) -> str:
+    """The current state: CLOSED, OPEN or HALF_OPEN."""
+    return self._state
+
+  def before_call(self) -> None:
+    """Checks whether a request may be sent.
+
+    Raises:
+      CircuitOpenError: If the breaker is open, or half-open with its probe
+        request still in flight.
+    """
+    if self._state == OPEN:
+      if time.monotonic() - self._opened_at < self._reset_timeout_seconds:
+        self._reject()
+      self._transition(HALF_OPEN)
+    if self._state == HALF_OPEN:
+      if self._probe_in_flight:
+        self._reject()
+      self._probe_in_flight = True
+
+  def record_success(self) -> None:
+    """Records that the remote agent responded."""
+    self._consecutive_failures = 0
+    self._probe_in_flight = False
+    if self._state != CLOSED:
+      self._transition(CLOSED)
+
+  def release_probe(self) -> None:
+    """Records that a request ended without an outcome, e.g. was cancelled.
+
+    Must be called for every request let through by before_call that neither
+    succeeded nor failed. Otherwise a cancelled probe would keep the breaker
+    half-open, rejecting every later request.
+    """
+    self._probe_in_flight = False
+
+  def record_failure(self) -> None:
+    """Records that the remote agent could not be reached or failed."""
+    self._consecutive_failures += 1
+    self._probe_in_flight = False
+    if (
+        self._state == HALF_OPEN
+        or self._consecutive_failures >= self._failure_threshold
+    ):
+      self._opened_at = time.monotonic()
+      self._opened_total += 1
+      if self._state != OPEN:
+        self._transition(OPEN)
+
+  def metrics(self) -> dict[str, Any]:
+    """Returns the breaker's state and counters."""
+    return {
+        "state": self._state,
+        "consecutive_failures": self._consecutive_failures,
+        "opened_total": self._opened_total,
+        "rejected_total": self._rejected_total,
+    }
+
+  def _reject(self) -> None:
+    """Counts and raises a rejected request."""
+    self._rejected_total += 1
+    raise CircuitOpenError(f"Circuit to {self._name} is {self._state}.")
+
+  def _transition(self, state: str) -> None:
+    """Moves to a new state and logs the transition."""
+    watch_log.log_event(
+        CIRCUIT_BREAKER_EVENT,
+        target=self._name,
+        previous_state=self._state,
+        state=state,
+        consecutive_failures=self._consecutive_failures,
+    )
+    self._state = state
+
+
+_breakers: collections.OrderedDict[str, CircuitBreaker] = (
+    collections.OrderedDict()
+)
+
+
+def get_breaker(base_url: str) -> CircuitBreaker:
+  """Returns the process-wide breaker for a remote agent's base URL."""
+  breaker = _breakers.get(base_url)
+  if breaker is not None:
+    _breakers.move_to_end(base_url)
+    return breaker
+
+  breaker = CircuitBreaker(base_url)
+  _breakers[base_url] = breaker
+  while len(_breakers) > MAX_BREAKERS:
+    # A client still holding the evicted breaker keeps using it; only the
+    # registry and its metrics forget it.
+    _breakers.popitem(last=False)
+  return breaker
+
+
+def metrics() -> dict[str, dict[str, Any]]:
+  """Returns the state and counters of every breaker, keyed by base URL."""
+  return {
+      base_url: breaker.metrics() for base_url, breaker in _breakers.items()
+  }
+
+
+def log_metrics() -> None:
+  """Logs the state and counters of every breaker to watch.log."""
+  if _breakers:
+    watch_log.log_event(CIRCUIT_BREAKER_METRICS_EVENT, breakers=metrics())
@@ -0,0 +1,198 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Negotiated gzip compression of the HTTP bodies exchanged between agents.
+
+An agent that accepts gzip-compressed request bodies advertises the
+COMPRESSION_EXTENSION_URI extension in its agent.json. Clients only compress a
+request body once the remote agent's card advertises the extension, and only
+if the body is at least min_size bytes, since compressing a small body costs
+more CPU time than it saves on the wire (see benchmarks.compression).
+
+Responses use standard HTTP content negotiation: httpx sends an
+Accept-Encoding header with every request and transparently decompresses the
+response, and the server compresses responses of at least DEFAULT_MIN_SIZE
+bytes with Starlette's GZipMiddleware.
+"""
+
+import gzip
+import zlib
+
+from a2a import types as a2a_types
+import httpx
+from starlette.responses import PlainTextResponse
+from starlette.types import ASGIApp
+from starlette.types import Message
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+COMPRESSION_EXTENSION_URI = (
+    "https://github.com/google-agentic-commerce/ap2/extensions/gzip/v1"
+)
+
+# Bodies smaller than this are sent uncompressed. Below roughly 1 KiB, gzip
+# saves too few bytes to pay for itself on a local or datacenter link.
+DEFAULT_MIN_SIZE = 1024
+
+# A moderate level; the higher levels are much slower for a few percent less.
+COMPRESS_LEVEL = 6
+
+# Guards the server against request bodies that decompress to huge sizes.
+MAX_DECOMPRESSED_SIZE = 32 * 1024 * 1024
+
+
+def supports_compression(agent_card: a2a_types.AgentCard) -> bool:
+  """Returns whether the agent accepts gzip-compressed request bodies."""
+  extensions = agent_card.capabilities.extensions or []
+  return any(
+      extension.uri == COMPRESSION_EXTENSION_URI for extension in extensions
+  )
+
+
+class CompressingTransport(httpx.AsyncBaseTransport):
+  """An httpx transport that gzip-compresses large request bodies.
+
+  Compression is off until enabled, which the client does once it has seen
+  that the remote agent supports it.
+  """
+
+  def __init__(
+      self,
+      transport: httpx.AsyncBaseTransport,
+      min_size: int = DEFAULT_MIN_SIZE,
+  ):
+    """Initialization.
+
+    Args:
+      transport: The transport that sends the, possibly compressed, requests.
+      min_size: The size in bytes from which request bodies are compressed.
+    """
+    self.enabled = False
+    self._transport = transport
+    self._min_size = min_size
+
+  async def handle_async_request(
+      self, request: httpx.Request
+  ) -> httpx.Response:
+    if self.enabled and "content-encoding" not in request.headers:
+      body = await request.aread()
+      if len(body) >= self._min_size:
+        headers = request.headers.copy()
+        headers["Content-Encoding"] = "gzip"
+        request = httpx.Request(
+            request.method,
+            request.url,
+            headers=headers,
+            content=gzip.compress(body, compresslevel=COMPRESS_LEVEL),
+            extensions=request.extensions,
+        )
+    return await self._transport.handle_async_request(request)
+
+  async def aclose(self) -> None:
+    await self._transport.aclose()
+
+
+class RequestDecompressionMiddleware:
+  """ASGI middleware that decompresses gzip-encoded request bodies.
+
+  Must wrap every other middleware that reads the request body.
+  """
+
+  def __init__(self, app: ASGIApp):
+    self._app = app
+
+  async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+    if scope["type"] != "http":
+      await self._app(scope, receive, send)
+      return
+
+    headers = [
+        (name, value)
+        for name, value in scope["headers"]
+        if name not in (b"content-encoding", b"content-length")
+    ]
+    encodings = [
+        value.strip().lower()
+        for name, value in scope["headers"]
+        if name == b"content-encoding"
+    ]
+    if not encodings:
+      await self._app(scope, receive, send)
+      return
+    if encodings != [b"gzip"]:
+      response = PlainTextResponse("Unsupported Content-Encoding", 415)
+      await response(scope, receive, send)
+      return
+
+    try:
+      body = _gunzip(await _read_body(receive, MAX_DECOMPRESSED_SIZE))
+    except (OSError, EOFError, zlib.error):
+      response = PlainTextResponse("Malformed gzip request body", 400)
+      await response(scope, receive, send)
+      return
+    except ValueError:
+      response = PlainTextResponse("Request body too large", 413)
+      await response(scope, receive, send)
+      return
+
+    headers.append((b"content-length", str(len(body)).encode("latin-1")))
+    sent = False
+
+    async def receive_decompressed() -> Message:
+      nonlocal sent
+      if sent:
+        return await receive()
+      sent = True
+      return {"type": "http.request", "body": body, "more_body": False}
+
+    await self._app(
+        dict(scope, headers=headers), receive_decompressed, send
+    )
+
+
+async def _read_body(receive: Receive, max_size: int) -> bytes:
+  """Reads the whole request body from the ASGI receive channel.
+
+  Raises:
+    ValueError: If the body is larger than max_size bytes.
+  """
+  chunks = []
+  size = 0
+  more_body = True
+  while more_body:
+    message = await receive()
+    chunk = message.get("body", b"")
+    size += len(chunk)
+    if size > max_size:
+      raise ValueError("Request body exceeds MAX_DECOMPRESSED_SIZE.")
+    chunks.append(chunk)
+    more_body = message.get("more_body", False)
+  return b"".join(chunks)
+
+
+def _gunzip(body: bytes) -> bytes:
+  """Decompresses a gzip body, refusing to exceed MAX_DECOMPRESSED_SIZE.
+
+  Raises:
+    ValueError: If the decompressed body would be too large.
+  """
+  decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+  decompressed = decompressor.decompress(body, MAX_DECOMPRESSED_SIZE + 1)
+  if len(decompressed) > MAX_DECOMPRESSED_SIZE:
+    raise ValueError("Decompressed body exceeds MAX_DECOMPRESSED_SIZE.")
+  if not decompressor.eof:
+    raise EOFError("Truncated gzip body.")
+  return decompressed
@@ -0,0 +1,53 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Parses the expiry timestamps of the AP2 mandates.
+
+CartContents.cart_expiry and IntentMandate.intent_expiry are ISO 8601 strings.
+Parse them once, with parse_expiry, and compare the resulting epoch seconds
+from then on, which is much cheaper than parsing the string on every check.
+"""
+
+from datetime import datetime
+from datetime import timezone
+import time
+
+
+def parse_expiry(value: str) -> float:
+  """Returns an ISO 8601 expiry as seconds since the epoch.
+
+  Args:
+    value: The expiry, e.g. "2025-09-01T12:00:00+00:00". A trailing "Z" is
+      accepted, and a timestamp without a timezone is taken to be in UTC.
+
+  Returns:
+    The expiry, in seconds since the epoch.
+
+  Raises:
+    ValueError: If the value is not an ISO 8601 timestamp.
+  """
+  if not isinstance(value, str):
+    raise ValueError(f"Invalid expiry: {value!r}")
+  if value.endswith(("Z", "z")):
+    value = value[:-1] + "+00:00"
+  expires_at = datetime.fromisoformat(value)
+  if expires_at.tzinfo is None:
+    expires_at = expires_at.replace(tzinfo=timezone.utc)
+  return expires_at.timestamp()
+
+
+def is_expired(expires_at: float, now: float | None = None) -> bool:
+  """Returns whether an expiry parsed by parse_expiry has passed."""
+  return expires_at <= (time.time() if now is None else now)
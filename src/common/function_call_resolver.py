@@ -19,12 +19,13 @@ use based on the instructions provided.
 """
 
 import logging
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable
 
 from a2a.server.tasks.task_updater import TaskUpdater
 from a2a.types import Task
-from google import genai
-from google.genai import types
+
+if TYPE_CHECKING:
+  from google import genai  # pylint: disable=g-import-not-at-top
 
 
 DataPartContent = dict[str, Any]
@@ -36,7 +37,7 @@ class FunctionCallResolver:
 
   def __init__(
       self,
-      llm_client: genai.Client,
+      llm_client: "genai.Client",
       tools: list[Tool],
       instructions: str = "You are a helpful assistant.",
   ):
@@ -47,6 +48,9 @@ class FunctionCallResolver:
       tools: The list of tools that a request can be resolved to.
       instructions: The instructions to guide the LLM.
     """
+    # google.genai takes long to import, so it is only imported once needed.
+    from google.genai import types  # pylint: disable=g-import-not-at-top
+
     self._client = llm_client
     function_declarations = [
         types.FunctionDeclaration(
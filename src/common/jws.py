@@ -0,0 +1,391 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Compact JSON Web Signatures (RFC 7515) over Ed25519 keys.
+
+Each signer, e.g. the merchant agent or the user's device, owns an Ed25519
+private key stored in the keys directory (AP2_KEYS_DIR, .keys by default). The
+key is created on first use, and its public key is published to the
+public/<owner>/ subdirectory under its key ID (kid), the RFC 7638 thumbprint of
+the key. As all the sample agents run side by side, they share this directory,
+which stands in for the key discovery a real deployment would use.
+
+A token is only verified against the keys of the signer the verifier expects,
+e.g. the user's device for a user authorization, so a token signed by any other
+party's key is rejected even though that key is published too.
+
+Tokens are signed with EdDSA, whose signatures are fast to create and verify.
+Parsed public keys are cached, so verifying only reads a key from disk the
+first time it is seen. Every verification still checks that the key is
+published, which costs a stat of its file, so a key revoked by another agent
+stops verifying at once rather than when this process restarts. A key can be
+rotated, after which new tokens are signed with the new key while tokens signed
+with the old one stay valid until the old key is revoked.
+"""
+
+import base64
+from collections.abc import Callable, Iterable
+import json
+import logging
+import os
+import re
+import time
+from typing import Any, NamedTuple
+
+from ap2.types import canonical
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519
+
+ALGORITHM = "EdDSA"
+
+KEYS_DIR_ENV_VAR = "AP2_KEYS_DIR"
+DEFAULT_KEYS_DIR = ".keys"
+
+_KID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{43}$")
+_OWNER_PATTERN = re.compile(r"^[A-Za-z0-9_-]+$")
+
+_signing_keys: dict[str, "SigningKey"] = {}
+# Maps (owner, kid) to the parsed public key.
+_public_keys: dict[tuple[str, str], ed25519.Ed25519PublicKey] = {}
+_key_change_listeners: list[Callable[[str], None]] = []
+
+
+class InvalidTokenError(ValueError):
+  """Raised when a token is malformed, expired or not validly signed."""
+
+
+class SigningKey(NamedTuple):
+  """A private key and the ID under which its public key is published."""
+
+  kid: str
+  private_key: ed25519.Ed25519PrivateKey
+
+
+def keys_dir() -> str:
+  """Returns the directory holding the signing and public keys."""
+  return os.environ.get(KEYS_DIR_ENV_VAR, DEFAULT_KEYS_DIR)
+
+
+def signing_key(owner: str) -> SigningKey:
+  """Returns the owner's current signing key, creating it if needed.
+
+  Args:
+    owner: The name of the signer, e.g. "merchant_agent".
+
+  Returns:
+    The owner's SigningKey.
+  """
+  key = _signing_keys.get(owner)
+  if key is None:
+    path = _private_key_path(owner)
+    if os.path.exists(path):
+      with open(path, "rb") as f:
+        private_key = serialization.load_pem_private_key(f.read(), None)
+      key = _publish(owner, private_key)
+    else:
+      key = _create_signing_key(owner)
+    _signing_keys[owner] = key
+  return key
+
+
+def rotate_signing_key(owner: str) -> SigningKey:
+  """Replaces the owner's signing key with a new one.
+
+  The previous key's public key stays published, so tokens it signed can
+  still be verified until it is revoked with revoke_key.
+
+  Args:
+    owner: The name of the signer.
+
+  Returns:
+    The owner's new SigningKey.
+  """
+  previous_key = _signing_keys.get(owner)
+  key = _create_signing_key(owner)
+  _signing_keys[owner] = key
+  logging.info("Rotated the signing key of %s to %s", owner, key.kid)
+  if previous_key is not None:
+    for listener in _key_change_listeners:
+      listener(previous_key.kid)
+  return key
+
+
+def revoke_key(kid: str) -> None:
+  """Withdraws a public key, so that tokens signed with it no longer verify.
+
+  If the key is the current signing key of an owner in this process, its
+  private key is discarded too, and the owner's next key is a new one.
+
+  Args:
+    kid: The ID of the key to revoke.
+  """
+  _check_kid(kid)
+  public_dir = os.path.join(keys_dir(), "public")
+  owners = os.listdir(public_dir) if os.path.isdir(public_dir) else []
+  for owner in owners:
+    try:
+      os.remove(_public_key_path(owner, kid))
+    except FileNotFoundError:
+      pass
+  for key in [key for key in _public_keys if key[1] == kid]:
+    del _public_keys[key]
+  for owner, key in list(_signing_keys.items()):
+    if key.kid == kid:
+      del _signing_keys[owner]
+      try:
+        os.remove(_private_key_path(owner))
+      except FileNotFoundError:
+        pass
+  for listener in _key_change_listeners:
+    listener(kid)
+  logging.info("Revoked key %s", kid)
+
+
+def add_key_change_listener(listener: Callable[[str], None]) -> None:
+  """Registers a function called with the kid of every key rotated or revoked.
+
+  Caches of verification results use this to forget what a key verified.
+
+  Args:
+    listener: The function to call with the kid.
+  """
+  _key_change_listeners.append(listener)
+
+
+def sign(claims: dict[str, Any], key: SigningKey) -> str:
+  """Returns a compact JWS of the claims, signed with the key.
+
+  Args:
+    claims: The JSON-compatible claims to sign.
+    key: The key to sign with.
+
+  Returns:
+    The token, as header.payload.signature in base64url.
+  """
+  header = {"alg": ALGORITHM, "kid": key.kid, "typ": "JWT"}
+  signing_input = (
+      f"{_b64encode(canonical.canonical_json(header))}."
+      f"{_b64encode(canonical.canonical_json(claims))}"
+  ).encode("ascii")
+  signature = key.private_key.sign(signing_input)
+  return f"{signing_input.decode('ascii')}.{_b64encode(signature)}"
+
+
+def verify(
+    token: str, signer: str, now: float | None = None
+) -> dict[str, Any]:
+  """Verifies a token from the given signer and returns its claims.
+
+  Args:
+    token: The compact JWS to verify.
+    signer: The owner whose key must have signed the token, e.g.
+      "user_device".
+    now: The current time in seconds since the epoch. Defaults to time.time().
+
+  Returns:
+    The verified claims.
+
+  Raises:
+    InvalidTokenError: If the token is malformed, signed with a key that is
+      not a published key of the signer, not validly signed or expired.
+  """
+  header, claims, signing_input, signature = _parse(token)
+  try:
+    _public_key(signer, header.get("kid")).verify(signature, signing_input)
+  except InvalidSignature as e:
+    raise InvalidTokenError("The token signature is not valid.") from e
+  expiry = claims.get("exp")
+  if expiry is not None:
+    if not isinstance(expiry, (int, float)):
+      raise InvalidTokenError("The token has an invalid expiry.")
+    if expiry <= (time.time() if now is None else now):
+      raise InvalidTokenError("The token has expired.")
+  return claims
+
+
+def verify_batch(
+    tokens: Iterable[str], signer: str
+) -> list[dict[str, Any] | InvalidTokenError]:
+  """Verifies several tokens from the same signer at once.
+
+  A failing token does not stop the others from being verified, and the
+  current time is only looked up once for the batch.
+
+  Args:
+    tokens: The compact JWSs to verify.
+    signer: The owner whose key must have signed the tokens.
+
+  Returns:
+    For each token, in order, its claims or the InvalidTokenError raised for
+    it.
+  """
+  now = time.time()
+  results = []
+  for token in tokens:
+    try:
+      results.append(verify(token, signer, now))
+    except InvalidTokenError as e:
+      results.append(e)
+  return results
+
+
+def is_published(signer: str, kid: str) -> bool:
+  """Returns whether the key is a published, i.e. not revoked, key of signer.
+
+  Unlike the parsed public keys, this is never cached, so it reflects keys
+  revoked by other agents as well.
+  """
+  return (
+      bool(_OWNER_PATTERN.match(signer))
+      and bool(_KID_PATTERN.match(kid))
+      and os.path.exists(_public_key_path(signer, kid))
+  )
+
+
+def key_id(token: str) -> str:
+  """Returns the ID of the key a token claims to be signed with.
+
+  The signature is not verified.
+
+  Raises:
+    InvalidTokenError: If the token is malformed.
+  """
+  header, _, _, _ = _parse(token)
+  kid = header.get("kid")
+  if not isinstance(kid, str):
+    raise InvalidTokenError("The token has an invalid key ID.")
+  return kid
+
+
+def _create_signing_key(owner: str) -> SigningKey:
+  """Creates, stores and publishes a new signing key for the owner."""
+  private_key = ed25519.Ed25519PrivateKey.generate()
+  pem = private_key.private_bytes(
+      encoding=serialization.Encoding.PEM,
+      format=serialization.PrivateFormat.PKCS8,
+      encryption_algorithm=serialization.NoEncryption(),
+  )
+  _write_atomically(_private_key_path(owner), pem, mode=0o600)
+  return _publish(owner, private_key)
+
+
+def _publish(
+    owner: str, private_key: ed25519.Ed25519PrivateKey
+) -> SigningKey:
+  """Publishes the public key of the owner's private key under its kid."""
+  public_key = private_key.public_key()
+  raw = public_key.public_bytes(
+      encoding=serialization.Encoding.Raw,
+      format=serialization.PublicFormat.Raw,
+  )
+  # The RFC 7638 thumbprint of the key's JWK.
+  kid = canonical.sha256_digest(
+      canonical.canonical_json(
+          {"crv": "Ed25519", "kty": "OKP", "x": _b64encode(raw)}
+      )
+  )
+  path = _public_key_path(owner, kid)
+  if not os.path.exists(path):
+    pem = public_key.public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    _write_atomically(path, pem, mode=0o644)
+  _public_keys[(owner, kid)] = public_key
+  return SigningKey(kid, private_key)
+
+
+def _public_key(signer: str, kid: Any) -> ed25519.Ed25519PublicKey:
+  """Returns the signer's published public key for the kid, parsed once."""
+  if not isinstance(kid, str) or not _KID_PATTERN.match(kid):
+    raise InvalidTokenError("The token has an invalid key ID.")
+  _check_owner(signer)
+  public_key = _public_keys.get((signer, kid))
+  if public_key is not None:
+    # Another agent may have revoked the key by removing its file.
+    if is_published(signer, kid):
+      return public_key
+    del _public_keys[(signer, kid)]
+    raise InvalidTokenError(f"Unknown or revoked key ID {kid} of {signer}.")
+  try:
+    with open(_public_key_path(signer, kid), "rb") as f:
+      public_key = serialization.load_pem_public_key(f.read())
+  except FileNotFoundError as e:
+    raise InvalidTokenError(
+        f"Unknown or revoked key ID {kid} of {signer}."
+    ) from e
+  if not isinstance(public_key, ed25519.Ed25519PublicKey):
+    raise InvalidTokenError(f"Key {kid} is not an Ed25519 key.")
+  _public_keys[(signer, kid)] = public_key
+  return public_key
+
+
+def _parse(token: str) -> tuple[dict[str, Any], dict[str, Any], bytes, bytes]:
+  """Splits a compact JWS into its header, claims, signing input and signature.
+
+  Raises:
+    InvalidTokenError: If the token is malformed or uses another algorithm.
+  """
+  try:
+    encoded_header, encoded_claims, encoded_signature = token.split(".")
+    header = json.loads(_b64decode(encoded_header))
+    claims = json.loads(_b64decode(encoded_claims))
+    signature = _b64decode(encoded_signature)
+  except (AttributeError, ValueError) as e:
+    raise InvalidTokenError("The token is malformed.") from e
+  if not isinstance(header, dict) or not isinstance(claims, dict):
+    raise InvalidTokenError("The token is malformed.")
+  if header.get("alg") != ALGORITHM:
+    raise InvalidTokenError(f"Unsupported algorithm {header.get('alg')}.")
+  signing_input = f"{encoded_header}.{encoded_claims}".encode("ascii")
+  return header, claims, signing_input, signature
+
+
+def _check_kid(kid: str) -> None:
+  if not _KID_PATTERN.match(kid):
+    raise ValueError(f"Invalid key ID {kid}.")
+
+
+def _check_owner(owner: str) -> None:
+  if not _OWNER_PATTERN.match(owner):
+    raise ValueError(f"Invalid key owner {owner}.")
+
+
+def _private_key_path(owner: str) -> str:
+  _check_owner(owner)
+  return os.path.join(keys_dir(), f"{owner}.pem")
+
+
+def _public_key_path(owner: str, kid: str) -> str:
+  return os.path.join(keys_dir(), "public", owner, f"{kid}.pem")
+
+
+def _write_atomically(path: str, data: bytes, mode: int) -> None:
+  """Writes a file so that readers never see it partially written."""
+  os.makedirs(os.path.dirname(path), exist_ok=True)
+  temp_path = f"{path}.{os.getpid()}.tmp"
+  fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+  with os.fdopen(fd, "wb") as f:
+    f.write(data)
+  os.replace(temp_path, path)
+
+
+def _b64encode(data: bytes) -> str:
+  return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+  return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
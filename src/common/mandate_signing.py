@@ -0,0 +1,151 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Signs and verifies the authorizations carried by the AP2 mandates.
+
+A CartMandate's merchant_authorization is a JWS by the merchant whose cart_hash
+claim binds it to the canonical JSON of the CartContents. A PaymentMandate's
+user_authorization is a JWS from the user's device whose transaction_data
+claim holds the hashes of the CartMandate and PaymentMandateContents the user
+approved. Both are signed with jws.py, and each is only accepted from the key
+of the party expected to sign it: MERCHANT_SIGNER for merchant authorizations
+and USER_DEVICE_SIGNER for user authorizations.
+"""
+
+import time
+from typing import Any
+import uuid
+
+from ap2.types import canonical
+from ap2.types.mandate import CartMandate
+from ap2.types.mandate import PaymentMandate
+
+from common import expiry
+from common import jws
+
+# How long an authorization is valid for, at most.
+AUTHORIZATION_LIFETIME_SECONDS = 15 * 60
+
+# The owners of the signing keys (see jws.signing_key) of the merchant and of
+# the user's device.
+MERCHANT_SIGNER = "merchant_agent"
+USER_DEVICE_SIGNER = "user_device"
+
+
+def sign_cart_mandate(cart_mandate: CartMandate, key: jws.SigningKey) -> str:
+  """Returns the merchant_authorization for a CartMandate.
+
+  The authorization expires with the cart, or after
+  AUTHORIZATION_LIFETIME_SECONDS if that is sooner.
+
+  Args:
+    cart_mandate: The CartMandate to authorize.
+    key: The merchant's signing key.
+
+  Returns:
+    The merchant's JWS over the cart contents.
+  """
+  contents = cart_mandate.contents
+  now = int(time.time())
+  cart_expiry = int(expiry.parse_expiry(contents.cart_expiry))
+  return jws.sign(
+      {
+          "iss": contents.merchant_name,
+          "iat": now,
+          "exp": min(cart_expiry, now + AUTHORIZATION_LIFETIME_SECONDS),
+          "jti": uuid.uuid4().hex,
+          "cart_hash": canonical.digest(contents),
+      },
+      key,
+  )
+
+
+def verify_cart_mandate(
+    cart_mandate: CartMandate, signer: str = MERCHANT_SIGNER
+) -> dict[str, Any]:
+  """Verifies a CartMandate's merchant_authorization.
+
+  Args:
+    cart_mandate: The CartMandate to verify.
+    signer: The owner of the merchant's signing key.
+
+  Returns:
+    The verified claims.
+
+  Raises:
+    jws.InvalidTokenError: If the authorization is missing, invalid or does
+      not match the cart contents.
+  """
+  if cart_mandate.merchant_authorization is None:
+    raise jws.InvalidTokenError("Merchant authorization not found.")
+  claims = jws.verify(cart_mandate.merchant_authorization, signer)
+  if claims.get("cart_hash") != canonical.digest(cart_mandate.contents):
+    raise jws.InvalidTokenError("The cart contents do not match the hash.")
+  return claims
+
+
+def sign_user_authorization(
+    transaction_data: list[str], key: jws.SigningKey
+) -> str:
+  """Returns the user_authorization for a PaymentMandate.
+
+  Args:
+    transaction_data: The hashes of the CartMandate and of the
+      PaymentMandateContents that the user approved.
+    key: The signing key of the user's device.
+
+  Returns:
+    The user's JWS over the transaction data.
+  """
+  now = int(time.time())
+  return jws.sign(
+      {
+          "iat": now,
+          "exp": now + AUTHORIZATION_LIFETIME_SECONDS,
+          "nonce": uuid.uuid4().hex,
+          "transaction_data": transaction_data,
+      },
+      key,
+  )
+
+
+def verify_payment_mandate(
+    payment_mandate: PaymentMandate, signer: str = USER_DEVICE_SIGNER
+) -> dict[str, Any]:
+  """Verifies a PaymentMandate's user_authorization.
+
+  Args:
+    payment_mandate: The PaymentMandate to verify.
+    signer: The owner of the signing key of the user's device.
+
+  Returns:
+    The verified claims.
+
+  Raises:
+    jws.InvalidTokenError: If the authorization is missing, invalid or was
+      not given for these payment mandate contents.
+  """
+  if payment_mandate.user_authorization is None:
+    raise jws.InvalidTokenError("User authorization not found.")
+  claims = jws.verify(payment_mandate.user_authorization, signer)
+  transaction_data = claims.get("transaction_data")
+  if not isinstance(transaction_data, list) or (
+      canonical.digest(payment_mandate.payment_mandate_contents)
+      not in transaction_data
+  ):
+    raise jws.InvalidTokenError(
+        "The payment mandate contents do not match the authorization."
+    )
+  return claims
@@ -12,11 +12,48 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""Helper functions for working with A2A Message objects."""
+"""Helper functions for working with A2A Message objects.
+
+Data parts usually hold the JSON values received over the network, which must
+always be validated. Once an agent has validated a canonical object, it may
+put the validated model back in place of the raw value with
+replace_data_part; parse_canonical_object then returns that model as is,
+rather than validating the same value again. A model instance can only have
+been created in-process, since values decoded from the network are plain JSON
+types, so the type of a value is its provenance marker.
+"""
+
+import functools
+from typing import Any, TypeVar
+
+from ap2.types import wire
+from common import binary_data_parts
+from pydantic import BaseModel
+from pydantic import TypeAdapter
 
-from typing import Any
+ModelT = TypeVar('ModelT', bound=BaseModel)
 
-from pydantic import BaseModel
+
+def decode_data_parts(
+    data_parts: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Restores the data parts that were sent as binary blobs.
+
+    See binary_data_parts.py. Data parts sent as JSON are returned as is, so
+    this is cheap for messages without binary data parts.
+
+    Args:
+      data_parts: The data parts of a message or artifact.
+
+    Returns:
+      The data parts, with every binary blob decoded to its original data.
+
+    Raises:
+      ValueError: If a binary data part cannot be decoded.
+    """
+    if not any(map(binary_data_parts.is_encoded, data_parts)):
+        return data_parts
+    return [binary_data_parts.decode_data(data) for data in data_parts]
 
 
 def find_data_part(
@@ -76,4 +113,80 @@ def parse_canonical_object(
     canonical_object_data = find_data_part(data_key, data_parts)
     if canonical_object_data is None:
         raise ValueError(f'{type(canonical_object_model)} not found.')
-    return canonical_object_model.model_validate(canonical_object_data)
+    if isinstance(canonical_object_data, canonical_object_model):
+        # Validated in-process already, see replace_data_part.
+        return canonical_object_data
+    return wire.from_wire(canonical_object_model, canonical_object_data)
+
+
+def replace_data_part(
+    data_key: str, data_parts: list[dict[str, Any]], value: Any
+) -> list[dict[str, Any]]:
+    """Replaces the value for the first occurrence of the key in the data parts.
+
+    Use it to put a validated canonical object in place of the raw value it was
+    validated from, so that parse_canonical_object does not validate it again.
+    The data parts themselves are left unchanged.
+
+    Args:
+      data_key: The key to search for.
+      data_parts: The data parts to be searched.
+      value: The new value for the key.
+
+    Returns:
+      A copy of the data parts with the value replaced, or the data parts
+      themselves if the key was not found.
+    """
+    for i, data_part in enumerate(data_parts):
+        if data_key in data_part:
+            replaced = list(data_parts)
+            replaced[i] = {**data_part, data_key: value}
+            return replaced
+
+    return data_parts
+
+
+def parse_canonical_objects(
+    data_key: str,
+    data_parts: list[dict[str, Any]],
+    canonical_object_model: type[ModelT],
+) -> list[ModelT]:
+    """Converts all data part values for the given key to canonical objects.
+
+    Args:
+      data_key: The key to search for.
+      data_parts: The data parts to be searched.
+      canonical_object_model: The pydantic model of the canonical objects.
+
+    Returns:
+      The canonical objects created from the data part values, in order.
+    """
+    return validate_all(
+        canonical_object_model, find_data_parts(data_key, data_parts)
+    )
+
+
+def validate_all(
+    canonical_object_model: type[ModelT], values: list[Any]
+) -> list[ModelT]:
+    """Validates a list of raw values as canonical objects in a single call.
+
+    The loop over the values runs inside pydantic-core rather than in Python,
+    which is considerably faster than calling model_validate for each value.
+
+    Args:
+      canonical_object_model: The pydantic model of the canonical objects.
+      values: The raw values, e.g. in their wire form.
+
+    Returns:
+      The validated canonical objects, in order.
+    """
+    if not values:
+        return []
+    return _list_adapter(canonical_object_model).validate_python(values)
+
+
+@functools.cache
+def _list_adapter(canonical_object_model: type[ModelT]) -> TypeAdapter:
+    """Returns the TypeAdapter for a list of the model, built only once."""
+    return TypeAdapter(list[canonical_object_model])
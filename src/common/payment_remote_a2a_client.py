@@ -14,25 +14,49 @@
 
 """Wrapper for the A2A client."""
 
+import asyncio
+from collections.abc import Sequence
 import httpx
 import logging
+import time
+from typing import Any, AsyncIterator
 import uuid
 
 from a2a import types as a2a_types
-from a2a.client.card_resolver import A2ACardResolver
 from a2a.client.client import Client
 from a2a.client.client import ClientConfig
+from a2a.client.client import ClientEvent
 from a2a.client.client_factory import ClientFactory
 from a2a.client.client_task_manager import ClientTaskManager
+from a2a.client.middleware import ClientCallContext
 from a2a.extensions.common import HTTP_EXTENSION_HEADER
 
+from common import agent_card_cache
+from common import binary_data_parts
+from common import circuit_breaker
+from common import compression
+from common import retry_policy as retry_policy_lib
+from common import watch_log
+
 DEFAULT_TIMEOUT = 600.0
 
+# Bounds how long a request waits for a connection to an unreachable agent.
+DEFAULT_CONNECT_TIMEOUT = 10.0
+
 
 class PaymentRemoteA2aClient():
   """Wrapper for the A2A client.
 
   Always assumes the AgentCard is at base_url + {AGENT_CARD_WELL_KNOWN_PATH}.
+  AgentCards are shared between clients through the agent_card_cache.
+
+  Failed requests are retried according to a RetryPolicy, and each remote agent
+  is guarded by a CircuitBreaker that fails requests fast while it is down.
+
+  Large request bodies are gzip-compressed if the remote agent's AgentCard
+  advertises support for it (see compression.py), and DataParts carrying
+  mandates are sent as binary blobs if it advertises a binary encoding the
+  client also supports (see binary_data_parts.py).
 
   Provides convenience for establishing connection and for sending messages.
   """
@@ -42,6 +66,11 @@ class PaymentRemoteA2aClient():
       name: str,
       base_url: str,
       required_extensions: set[str] | None = None,
+      limits: httpx.Limits | None = None,
+      retry_policy: retry_policy_lib.RetryPolicy | None = None,
+      http2: bool = False,
+      compress_min_size: int | None = compression.DEFAULT_MIN_SIZE,
+      binary_encodings: Sequence[str] = binary_data_parts.DEFAULT_ENCODINGS,
   ):
     """Initializes the PaymentRemoteA2aClient.
 
@@ -49,10 +78,41 @@ class PaymentRemoteA2aClient():
       name: The name of the agent.
       base_url: The base URL where the remote agent is hosted.
       required_extensions: A set of extension URIs that the client requires.
+      limits: The connection pool limits. Defaults to the httpx defaults.
+      retry_policy: The policy for retrying failed requests. Defaults to a
+        RetryPolicy with default settings.
+      http2: Whether to speak HTTP/2 to the remote agent. Concurrent messages
+        then share one multiplexed connection. Requires the h2 package, and a
+        remote agent served over HTTP/2 (see server.run_agent_blocking).
+      compress_min_size: The size in bytes from which request bodies are
+        compressed, if the remote agent supports it. None never compresses.
+      binary_encodings: The encodings the client may send mandate DataParts
+        in, best first, if the remote agent supports them. Empty always sends
+        JSON.
     """
 
+    self._limits = limits or httpx.Limits()
+    self._retry_policy = retry_policy or retry_policy_lib.RetryPolicy()
+    self._breaker = circuit_breaker.get_breaker(base_url)
+    self._http_transport = httpx.AsyncHTTPTransport(
+        limits=self._limits,
+        # Plain http:// URLs cannot negotiate HTTP/2, so HTTP/2 is used with
+        # prior knowledge, without falling back to HTTP/1.1.
+        http1=not http2,
+        http2=http2,
+    )
+    self._compressing_transport = None
+    transport = self._http_transport
+    if compress_min_size is not None:
+      self._compressing_transport = compression.CompressingTransport(
+          self._http_transport, min_size=compress_min_size
+      )
+      transport = self._compressing_transport
     self._httpx_client = httpx.AsyncClient(
-        timeout=httpx.Timeout(timeout=DEFAULT_TIMEOUT)
+        timeout=httpx.Timeout(
+            timeout=DEFAULT_TIMEOUT, connect=DEFAULT_CONNECT_TIMEOUT
+        ),
+        transport=transport,
     )
     self._a2a_client_factory = ClientFactory(
         ClientConfig(
@@ -61,28 +121,42 @@ class PaymentRemoteA2aClient():
     )
     self._name = name
     self._base_url = base_url
-    self._agent_card = None
+    self._a2a_client = None
+    self._a2a_client_card = None
+    self._binary_encodings = tuple(binary_encodings)
+    self._binary_encoding = None
     self._client_required_extensions = required_extensions or set()
+    self._in_flight = 0
 
   async def get_agent_card(self) -> a2a_types.AgentCard:
     """Get agent card."""
-    if self._agent_card is None:
-      resolver = A2ACardResolver(
-          httpx_client=self._httpx_client,
-          base_url=self._base_url,
-      )
-      self._agent_card = await resolver.get_agent_card()
-    return self._agent_card
+    return await agent_card_cache.default_cache().get(
+        self._base_url, self._httpx_client
+    )
 
   async def send_a2a_message(
-      self, message: a2a_types.Message
+      self,
+      message: a2a_types.Message,
+      extensions: set[str] | None = None,
+      idempotent: bool = False,
   ) -> a2a_types.Task:
-    """Retrieves the A2A client, sends the message, and returns the event."""
-    my_a2a_client: Client = await self._get_a2a_client()
+    """Retrieves the A2A client, sends the message, and returns the event.
 
+    Args:
+      message: The message to send.
+      extensions: The extension URIs to request for this message only.
+        Defaults to the client's required extensions.
+      idempotent: Whether the message can safely be processed more than once.
+        See stream_a2a_message.
+
+    Returns:
+      The Task returned by the remote agent.
+    """
     task_manager = ClientTaskManager()
 
-    async for event in my_a2a_client.send_message(message):
+    async for event in self.stream_a2a_message(
+        message, extensions, idempotent
+    ):
       # Tasks are returned in tuples (aka ClientEvent). The first element is the
       # Task, the second element is the UpdateEvent.
       if isinstance(event, tuple):
@@ -92,21 +166,203 @@ class PaymentRemoteA2aClient():
     task = task_manager.get_task()
     if task is None:
       raise RuntimeError(f"No response from {self._name}")
+    return task
+
+  async def stream_a2a_message(
+      self,
+      message: a2a_types.Message,
+      extensions: set[str] | None = None,
+      idempotent: bool = False,
+  ) -> AsyncIterator[ClientEvent | a2a_types.Message]:
+    """Sends the message and yields the remote agent's events as they arrive.
+
+    If the remote agent supports streaming, each status update and artifact is
+    yielded as soon as it is received, rather than after the remote agent has
+    finished the task.
+
+    A failed attempt is retried only before any event has been received. A
+    message that may have reached the remote agent is only retried if it is
+    idempotent, e.g. a read-only lookup.
+
+    Args:
+      message: The message to send.
+      extensions: The extension URIs to request for this message only.
+        Defaults to the client's required extensions.
+      idempotent: Whether the message can safely be processed more than once.
+
+    Yields:
+      (Task, UpdateEvent) tuples, where the Task reflects all events received
+      so far and the UpdateEvent is the event just received, or None if the
+      event was the Task itself. A remote agent replying without a task yields
+      its Message instead.
+
+    Raises:
+      CircuitOpenError: If the remote agent's circuit breaker is open.
+    """
+    start = time.perf_counter()
+    task = None
+    self._in_flight += 1
+    try:
+      attempt = 0
+      while True:
+        attempt += 1
+        self._breaker.before_call()
+        received = False
+        try:
+          my_a2a_client: Client = await self._get_a2a_client()
+
+          outgoing_message, outgoing_extensions = self._encode_message(
+              message, extensions
+          )
+          async for event in my_a2a_client.send_message(
+              outgoing_message,
+              context=self._create_call_context(outgoing_extensions),
+          ):
+            if not received:
+              received = True
+              self._breaker.record_success()
+            if isinstance(event, tuple):
+              task = event[0]
+            yield event
+          break
+        except Exception as e:  # pylint: disable=broad-exception-caught
+          if not received:
+            if retry_policy_lib.is_server_failure(e):
+              self._breaker.record_failure()
+            else:
+              # Caused by the request itself, which says nothing about the
+              # remote agent's health.
+              self._breaker.release_probe()
+          if received or not self._retry_policy.should_retry(
+              e, attempt, idempotent
+          ):
+            raise
+          logging.warning(
+              "Attempt %d to reach %s failed, retrying: %s",
+              attempt,
+              self._name,
+              e,
+          )
+          await asyncio.sleep(self._retry_policy.delay_seconds(attempt))
+        except BaseException:
+          # Cancelled, e.g. by a deadline, before the remote agent answered.
+          # The outcome is unknown, but a half-open probe must be released.
+          if not received:
+            self._breaker.release_probe()
+          raise
+
+      if task is None:
+        raise RuntimeError(f"No response from {self._name}")
+    finally:
+      self._in_flight -= 1
+      if task is None and self._breaker.state == circuit_breaker.CLOSED:
+        # The remote agent is up but may have moved or changed; rediscover it
+        # next time.
+        agent_card_cache.default_cache().invalidate(self._base_url)
+      watch_log.log_event(
+          watch_log.A2A_CALL_EVENT,
+          target=self._name,
+          context_id=task.context_id if task else message.context_id,
+          task_id=task.id if task else message.task_id,
+          status="ok" if task else "error",
+          duration_ms=(time.perf_counter() - start) * 1000,
+      )
     logging.info(
         "Response received from %s for (context_id, task_id): (%s, %s)",
         self._name,
         task.context_id,
         task.id,
     )
-    return task
+
+  @property
+  def in_flight(self) -> int:
+    """The number of messages currently being sent or streamed."""
+    return self._in_flight
+
+  async def aclose(self) -> None:
+    """Closes the pooled connections to the remote agent."""
+    await self._httpx_client.aclose()
+
+  def pool_stats(self) -> dict[str, Any]:
+    """Returns the utilization of the connection pool to the remote agent."""
+    stats = {
+        "in_flight_messages": self._in_flight,
+        "max_connections": self._limits.max_connections,
+        "max_keepalive_connections": self._limits.max_keepalive_connections,
+    }
+    # httpx does not expose its pool publicly, so the connection counts are
+    # best effort and omitted if the transport does not have the usual pool.
+    pool = getattr(self._http_transport, "_pool", None)
+    connections = getattr(pool, "connections", None)
+    if connections is not None:
+      stats["open_connections"] = len(connections)
+      stats["idle_connections"] = sum(
+          1 for connection in connections if connection.is_idle()
+      )
+    return stats
 
   async def _get_a2a_client(self) -> Client:
-    """Get A2A client."""
+    """Get A2A client.
+
+    The client is created once per AgentCard and reused for every message.
+    Request compression and the binary encoding of DataParts are negotiated
+    according to the same AgentCard.
+    """
     agent_card = await self.get_agent_card()
-    self._httpx_client.headers[HTTP_EXTENSION_HEADER] = ", ".join(
-        self._client_required_extensions
+    if self._a2a_client is None or self._a2a_client_card is not agent_card:
+      self._a2a_client = self._a2a_client_factory.create(agent_card)
+      self._a2a_client_card = agent_card
+      if self._compressing_transport is not None:
+        self._compressing_transport.enabled = (
+            compression.supports_compression(agent_card)
+        )
+      self._binary_encoding = binary_data_parts.negotiate(
+          agent_card, self._binary_encodings
+      )
+    return self._a2a_client
+
+  def _encode_message(
+      self, message: a2a_types.Message, extensions: set[str] | None
+  ) -> tuple[a2a_types.Message, set[str] | None]:
+    """Encodes the message's mandate DataParts, if an encoding was negotiated.
+
+    Args:
+      message: The message to send.
+      extensions: The extension URIs requested for the message.
+
+    Returns:
+      The message to send and the extension URIs to request with it, which
+      then include the binary data extension.
+    """
+    if self._binary_encoding is None:
+      return message, extensions
+    if extensions is None:
+      extensions = self._client_required_extensions
+    return (
+        binary_data_parts.encode_message(message, self._binary_encoding),
+        extensions | {binary_data_parts.BINARY_DATA_EXTENSION_URI},
     )
-    return self._a2a_client_factory.create(agent_card)
+
+  def _create_call_context(
+      self, extensions: set[str] | None = None
+  ) -> ClientCallContext:
+    """Creates the call context carrying the extension header of a request.
+
+    The header is passed per request rather than set on the shared httpx
+    client, so concurrent messages requesting different extensions do not
+    overwrite each other's header.
+
+    Args:
+      extensions: The extension URIs to request. Defaults to the client's
+        required extensions.
+
+    Returns:
+      The ClientCallContext to send the request with.
+    """
+    if extensions is None:
+      extensions = self._client_required_extensions
+    headers = {HTTP_EXTENSION_HEADER: ", ".join(sorted(extensions))}
+    return ClientCallContext(state={"http_kwargs": {"headers": headers}})
 
   def _create_agent_message(
       self,
@@ -0,0 +1,142 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Retry policy for requests to remote agents.
+
+Retries use exponential backoff with full jitter, so that many clients retrying
+against a recovering agent spread out instead of arriving in waves. Only
+transient failures are retried, and a request that may have reached the remote
+agent is only retried if the operation is idempotent.
+"""
+
+from collections.abc import Iterator
+import random
+
+from a2a.client.errors import A2AClientHTTPError
+from a2a.client.errors import A2AClientJSONError
+from a2a.client.errors import A2AClientJSONRPCError
+from a2a.client.errors import A2AClientTimeoutError
+import httpx
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BASE_DELAY_SECONDS = 0.2
+DEFAULT_MAX_DELAY_SECONDS = 5.0
+
+# HTTP statuses signalling that the remote agent is temporarily unavailable.
+_RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
+
+# JSON-RPC errors signalling that the remote agent itself failed: an internal
+# error (-32603), or an invalid response from the agent (-32006).
+_SERVER_ERROR_CODES = frozenset({-32603, -32006})
+
+
+class RetryPolicy:
+  """Decides whether and when a failed request is retried."""
+
+  def __init__(
+      self,
+      max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+      base_delay_seconds: float = DEFAULT_BASE_DELAY_SECONDS,
+      max_delay_seconds: float = DEFAULT_MAX_DELAY_SECONDS,
+  ):
+    """Initialization.
+
+    Args:
+      max_attempts: The maximum number of attempts, including the first.
+      base_delay_seconds: The backoff ceiling after the first failed attempt.
+      max_delay_seconds: The upper bound of the backoff ceiling.
+    """
+    self._max_attempts = max_attempts
+    self._base_delay_seconds = base_delay_seconds
+    self._max_delay_seconds = max_delay_seconds
+
+  def should_retry(
+      self, error: Exception, attempt: int, idempotent: bool
+  ) -> bool:
+    """Returns whether to retry after the given failed attempt.
+
+    Args:
+      error: The error raised by the attempt.
+      attempt: The number of the failed attempt, starting at 1.
+      idempotent: Whether the operation can safely be repeated.
+    """
+    if attempt >= self._max_attempts:
+      return False
+    if not_sent(error):
+      return True
+    return idempotent and is_transient(error)
+
+  def delay_seconds(self, attempt: int) -> float:
+    """Returns the backoff before the attempt after the given failed one."""
+    ceiling = min(
+        self._max_delay_seconds,
+        self._base_delay_seconds * 2 ** (attempt - 1),
+    )
+    return random.uniform(0, ceiling)
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+def _causes(error: BaseException) -> Iterator[BaseException]:
+  """Yields the error and the chain of errors that caused it."""
+  seen = set()
+  while error is not None and id(error) not in seen:
+    seen.add(id(error))
+    yield error
+    error = error.__cause__ or error.__context__
+
+
+def not_sent(error: Exception) -> bool:
+  """Returns whether the request failed before reaching the remote agent."""
+  return any(
+      isinstance(cause, (httpx.ConnectError, httpx.ConnectTimeout))
+      for cause in _causes(error)
+  )
+
+
+def is_transient(error: Exception) -> bool:
+  """Returns whether the error signals a transport or availability failure."""
+  for cause in _causes(error):
+    if isinstance(cause, (A2AClientTimeoutError, httpx.TransportError)):
+      return True
+    if (
+        isinstance(cause, A2AClientHTTPError)
+        and cause.status_code in _RETRYABLE_STATUS_CODES
+    ):
+      return True
+  return False
+
+
+def is_server_failure(error: Exception) -> bool:
+  """Returns whether the error signals that the remote agent failed.
+
+  Besides transient failures, these are 5xx responses, JSON-RPC internal
+  errors and responses that could not be parsed. Errors caused by the request
+  itself, such as 4xx responses or invalid params, are not.
+  """
+  if is_transient(error):
+    return True
+  for cause in _causes(error):
+    if isinstance(cause, A2AClientHTTPError) and cause.status_code >= 500:
+      return True
+    if isinstance(cause, A2AClientJSONError):
+      return True
+    if (
+        isinstance(cause, A2AClientJSONRPCError)
+        and cause.error.code in _SERVER_ERROR_CODES
+    ):
+      return True
+  return False
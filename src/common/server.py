@@ -17,8 +17,13 @@
 To provide a clear demonstration of the Agent Payments Protocol A2A extension,
 this server operates without the Google ADK. Instead, it directly uses an
 AgentCard and AgentExecutor to launch a Uvicorn server.
+
+Uvicorn only speaks HTTP/1.1. When HTTP/2 is enabled (see
+system_utils.http2_enabled), the agent is served by Hypercorn instead, which
+accepts both HTTP/1.1 and HTTP/2 connections.
 """
 
+import asyncio
 import json
 import logging
 import os
@@ -31,16 +36,29 @@ from a2a.types import AgentCard
 from a2a.utils.constants import AGENT_CARD_WELL_KNOWN_PATH
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.requests import Request
+from starlette.responses import JSONResponse
 from starlette.responses import Response
+from starlette.responses import StreamingResponse
 import uvicorn
 
+from . import a2a_client_registry
+from . import agent_card_cache
+from . import binary_data_parts
+from . import circuit_breaker
+from . import compression
+from . import system_utils
 from . import watch_log
 from .base_server_executor import BaseServerExecutor
 
 # Constant for the A2A extensions header
 A2A_EXTENSIONS_HEADER = "X-A2A-Extensions"
 
+# Path, under the agent's rpc_url, serving a JSON snapshot of the metrics of
+# the agent's connections to other agents.
+METRICS_PATH = "/metrics"
+
 
 def load_local_agent_card(file_path: str) -> AgentCard:
   """Loads the AgentCard from the specified file path.
@@ -54,7 +72,9 @@ def load_local_agent_card(file_path: str) -> AgentCard:
   card_path = os.path.join(os.path.dirname(file_path), "agent.json")
   with open(card_path, "r", encoding="utf-8") as f:
     data = json.load(f)
-  return AgentCard.model_validate(data)
+  agent_card = AgentCard.model_validate(data)
+  binary_data_parts.restrict_to_available(agent_card)
+  return agent_card
 
 
 def run_agent_blocking(
@@ -76,18 +96,47 @@ def run_agent_blocking(
   # Add a file handler to the logger for watch.log.
   logger = logging.getLogger(__name__)
   logger.addHandler(watch_log.create_file_handler())
+  watch_log.set_agent_name(agent_card.name)
+  watch_log.set_sampling_policy(watch_log.sampling_policy_from_env())
+
+  # Load any AgentCard snapshot now, so the first message skips discovery.
+  agent_card_cache.default_cache()
 
   # Build the Starlette app and add middlewares.
   app = _build_starlette_app(agent_card, executor=executor, rpc_url=rpc_url)
   _add_middlewares(app, logger)
 
+  # Close the pooled connections to other agents on shutdown.
+  app.add_event_handler("shutdown", a2a_client_registry.close_all)
+  app.add_event_handler("shutdown", circuit_breaker.log_metrics)
+
   # Start the server.
   logger.info("%s listening on http://localhost:%d", agent_card.name, port)
+  if system_utils.http2_enabled():
+    _run_http2_server(app, port)
+    return
   uvicorn.run(
       app, host="0.0.0.0", port=port, log_level="info", timeout_keep_alive=120
   )
 
 
+def _run_http2_server(app, port: int) -> None:
+  """Serves the app over HTTP/1.1 and HTTP/2 with Hypercorn.
+
+  Args:
+      app: The ASGI application to serve.
+      port: TCP port to bind to.
+  """
+  # Hypercorn is an optional dependency, only needed for HTTP/2.
+  from hypercorn.asyncio import serve  # pylint: disable=g-import-not-at-top
+  from hypercorn.config import Config  # pylint: disable=g-import-not-at-top
+
+  config = Config()
+  config.bind = [f"0.0.0.0:{port}"]
+  config.keep_alive_timeout = 120
+  asyncio.run(serve(app, config))
+
+
 def _create_watch_log_handler() -> logging.FileHandler:
   """Create a file handler for watch.log logger.
 
@@ -119,16 +168,13 @@ class _LoggingMiddleware(BaseHTTPMiddleware):
     # Log the request method and URL.
     self._logger.info("%s %s", request.method, request.url)
 
-    # Log the request body if it's present.
-    content_length = request.headers.get("content-length")
-    if content_length and int(content_length) > 0:
-      request_body = await request.json()
-    else:
-      request_body = "<empty>"
-
-    self._logger.info("\n")
-    self._logger.info("[Request Body]")
-    self._logger.info("%s", request_body)
+    # Log the request body, under the watch.log SamplingPolicy, which redacts
+    # the sensitive fields and bounds the size of what is written.
+    policy = watch_log.sampling_policy()
+    if policy.should_log(watch_log.REQUEST_BODY_KEY):
+      self._logger.info("\n")
+      self._logger.info("[Request Body]")
+      self._logger.info("%s", policy.format_body(await request.body()))
 
     # If the extension header is present, log a notice.
     extension_header = request.headers.get(A2A_EXTENSIONS_HEADER)
@@ -139,24 +185,34 @@ class _LoggingMiddleware(BaseHTTPMiddleware):
 
     response = await call_next(request)
 
+    # Log streamed events as they pass, rather than buffering the whole stream.
+    if response.headers.get("content-type", "").startswith(
+        "text/event-stream"
+    ):
+      if not policy.should_log(watch_log.RESPONSE_STREAM_KEY):
+        return response
+      self._logger.info("\n")
+      self._logger.info("[Response Stream]")
+      return StreamingResponse(
+          self._log_chunks(response.body_iterator),
+          status_code=response.status_code,
+          headers=response.headers,
+      )
+
+    if not policy.should_log(watch_log.RESPONSE_BODY_KEY):
+      return response
+
     # Ensure the response has a body to read.
     if response.body_iterator:
       body = b""
 
       # Read the entire response body.
-      # All responses are UTF-8 encoded JSON, so this should always succeed.
       async for chunk in response.body_iterator:
         body += chunk
 
-      try:
-        response_body_json = body.decode("utf-8")
-      except UnicodeDecodeError:
-        self._logger.warning("Failed to decode response body as UTF-8.")
-        response_body_json = body
-
       self._logger.info("\n")
       self._logger.info("[Response Body]")
-      self._logger.info("%s", response_body_json)
+      self._logger.info("%s", policy.format_body(body))
 
       return Response(
           content=body,
@@ -170,6 +226,13 @@ class _LoggingMiddleware(BaseHTTPMiddleware):
       self._logger.info("<empty>")
       return response
 
+  async def _log_chunks(self, body_iterator):
+    """Logs each chunk of a streamed response body as it is passed on."""
+    policy = watch_log.sampling_policy()
+    async for chunk in body_iterator:
+      self._logger.info("%s", policy.format_body(chunk))
+      yield chunk
+
 
 def _build_starlette_app(
     agent_card: AgentCard, *, executor, rpc_url
@@ -201,9 +264,19 @@ def _build_starlette_app(
   ).build(
       rpc_url=rpc_url, agent_card_url=f"{rpc_url}{AGENT_CARD_WELL_KNOWN_PATH}"
   )
+  app.add_route(f"{rpc_url}{METRICS_PATH}", _metrics, methods=["GET"])
   return app
 
 
+async def _metrics(request: Request) -> JSONResponse:
+  """Serves the circuit breakers' and connection pools' current metrics."""
+  del request  # Unused.
+  return JSONResponse({
+      "circuit_breakers": circuit_breaker.metrics(),
+      "connection_pools": a2a_client_registry.pool_utilization(),
+  })
+
+
 def _add_middlewares(app, logger: logging.Logger) -> None:
   """Add middlewares to the Starlette app."""
   app.add_middleware(
@@ -230,4 +303,13 @@ def _add_middlewares(app, logger: logging.Logger) -> None:
       allow_headers=["*"],
   )
   app.add_middleware(_LoggingMiddleware, logger=logger)
+  # Middlewares added last run first. The compression middlewares wrap the
+  # logging middleware so that it logs the uncompressed bodies. Streamed
+  # (text/event-stream) responses are never compressed by GZipMiddleware.
+  app.add_middleware(
+      GZipMiddleware,
+      minimum_size=compression.DEFAULT_MIN_SIZE,
+      compresslevel=compression.COMPRESS_LEVEL,
+  )
+  app.add_middleware(compression.RequestDecompressionMiddleware)
   return app
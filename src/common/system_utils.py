@@ -14,6 +14,18 @@
 
 """Helper functions related to the system."""
 
+import os
+
+# Set to "1" to use HTTP/2 between the agents. All agents must agree, since
+# clients then speak HTTP/2 without first negotiating it with the server.
+HTTP2_ENV_VAR = "AP2_HTTP2"
+
+
+def http2_enabled() -> bool:
+  """Returns whether the agents communicate over HTTP/2."""
+  return os.environ.get(HTTP2_ENV_VAR) == "1"
+
+
 DEBUG_MODE_INSTRUCTIONS = """
     This is really important! If the agent or user asks you to be verbose or if debug_mode is True, do the following:
       1. If this is the the start of a new task, explain who you are, what you are going to do, what tools you use, and what agents you delegate to.
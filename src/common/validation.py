@@ -18,6 +18,8 @@ import logging
 
 from ap2.types.mandate import PaymentMandate
 
+from common import verified_mandate_cache
+
 
 def validate_payment_mandate_signature(payment_mandate: PaymentMandate) -> None:
   """Validates the PaymentMandate signature.
@@ -28,10 +30,10 @@ def validate_payment_mandate_signature(payment_mandate: PaymentMandate) -> None:
   Raises:
     ValueError: If the PaymentMandate signature is not valid.
   """
-  # In a real implementation, full validation logic would reside here. For
-  # demonstration purposes, we simply log that the authorization field is
-  # populated.
   if payment_mandate.user_authorization is None:
     raise ValueError("User authorization not found in PaymentMandate.")
+  # A mandate already verified by this agent, e.g. on an earlier hop or before
+  # a retry, is not verified again. InvalidTokenError is a ValueError.
+  verified_mandate_cache.default_cache().verify(payment_mandate)
 
   logging.info("Valid PaymentMandate found.")
@@ -0,0 +1,136 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""A process-wide cache of the PaymentMandates this agent has verified.
+
+A PaymentMandate is verified by every agent it passes through, and again by
+the same agent whenever a request is retried, e.g. after an OTP challenge.
+Once an agent has verified a mandate's user_authorization, this cache lets it
+accept the same mandate again without verifying the signature again.
+
+Entries are keyed by a fingerprint of the PaymentMandateContents together with
+the user_authorization and the signer it was verified against, so any change
+to either is verified afresh and a mandate verified for one signer is never
+accepted for another. Only mandates that verified are cached. An entry is kept
+until the authorization expires, or for at most max_ttl_seconds, and is
+dropped as soon as the key that signed it is rotated or revoked in this
+process. A key revoked by another agent is caught too, as every hit checks
+that the key is still published by the signer (see jws.is_published). The
+least recently used entries are evicted beyond max_entries.
+"""
+
+import collections
+import hashlib
+import time
+
+from ap2.types.mandate import PaymentMandate
+
+from common import jws
+from common import mandate_signing
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_TTL_SECONDS = 300.0
+
+
+class VerifiedMandateCache:
+  """A bounded cache of verified PaymentMandate authorizations."""
+
+  def __init__(
+      self,
+      max_entries: int = DEFAULT_MAX_ENTRIES,
+      max_ttl_seconds: float = DEFAULT_MAX_TTL_SECONDS,
+  ):
+    """Initialization.
+
+    Args:
+      max_entries: The maximum number of mandates remembered.
+      max_ttl_seconds: The longest a verification is trusted for, even if the
+        authorization expires later.
+    """
+    self._max_entries = max_entries
+    self._max_ttl_seconds = max_ttl_seconds
+    # Maps (fingerprint, authorization, signer) to (expiry time, kid).
+    self._entries = collections.OrderedDict()
+    self.hits = 0
+    self.misses = 0
+    jws.add_key_change_listener(self.forget_key)
+
+  def verify(
+      self,
+      payment_mandate: PaymentMandate,
+      signer: str = mandate_signing.USER_DEVICE_SIGNER,
+  ) -> None:
+    """Verifies the mandate's user_authorization, unless already verified.
+
+    Args:
+      payment_mandate: The PaymentMandate to verify.
+      signer: The owner of the signing key of the user's device.
+
+    Raises:
+      jws.InvalidTokenError: If the authorization is missing or invalid.
+    """
+    authorization = payment_mandate.user_authorization
+    if authorization is None:
+      raise jws.InvalidTokenError("User authorization not found.")
+    key = (_fingerprint(payment_mandate), authorization, signer)
+    now = time.time()
+    entry = self._entries.get(key)
+    if entry is not None:
+      if entry[0] > now and jws.is_published(signer, entry[1]):
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return
+      del self._entries[key]
+
+    self.misses += 1
+    claims = mandate_signing.verify_payment_mandate(payment_mandate, signer)
+    expires_at = now + self._max_ttl_seconds
+    if claims.get("exp") is not None:
+      expires_at = min(expires_at, claims["exp"])
+    self._entries[key] = (expires_at, jws.key_id(authorization))
+    if len(self._entries) > self._max_entries:
+      self._entries.popitem(last=False)
+
+  def forget_key(self, kid: str) -> None:
+    """Forgets every mandate verified with the given key."""
+    for key in [key for key, entry in self._entries.items() if entry[1] == kid]:
+      del self._entries[key]
+
+  def clear(self) -> None:
+    """Forgets every verified mandate."""
+    self._entries.clear()
+
+
+def _fingerprint(payment_mandate: PaymentMandate) -> bytes:
+  """Returns a digest of the contents that is cheap to compute.
+
+  model_dump_json runs in pydantic-core, unlike the canonical JSON the
+  authorization is bound to, and is stable within a process, which is all the
+  cache needs.
+  """
+  return hashlib.sha256(
+      payment_mandate.payment_mandate_contents.model_dump_json().encode("utf-8")
+  ).digest()
+
+
+_default_cache: VerifiedMandateCache | None = None
+
+
+def default_cache() -> VerifiedMandateCache:
+  """Returns the process-wide VerifiedMandateCache."""
+  global _default_cache
+  if _default_cache is None:
+    _default_cache = VerifiedMandateCache()
+  return _default_cache
@@ -18,10 +18,18 @@ The watch.log file is a log file meant to be watched in parallel with running a
 scenario.  It will contain all the requests and responses to/from the agent
 that are sent to/from the client, so engineers can see what is happening
 between the servers in real time.
+
+Alongside the human readable entries, timing events are written as single JSON
+lines prefixed with EVENT_PREFIX. watch_log_analyzer.py joins these events
+across the agents' logs to report per-hop latency.
 """
 
+import json
 import logging
-from typing import Any
+import os
+import random
+import time
+from typing import Any, Iterable, Mapping
 
 from a2a.server.agent_execution.context import RequestContext
 
@@ -31,6 +39,216 @@ from ap2.types.mandate import PAYMENT_MANDATE_DATA_KEY
 
 _logger = logging.getLogger(__name__)
 
+# Fields whose values are never written to watch.log.
+DEFAULT_REDACTED_FIELDS = frozenset({
+    "token",
+    "cryptogram",
+    "user_authorization",
+})
+
+_REDACTED = "<redacted>"
+
+# Prefix of the single-line JSON timing events.
+EVENT_PREFIX = "[AP2 Event] "
+
+# Event emitted by a server once a tool has handled a request.
+TOOL_CALL_EVENT = "tool_call"
+
+# Event emitted by a client once a remote agent has answered a message.
+A2A_CALL_EVENT = "a2a_call"
+
+# Environment variables configuring the SamplingPolicy of a server, read by
+# sampling_policy_from_env when the server starts:
+# - The probability of logging a DataPart value, e.g. "0.1".
+SAMPLE_RATE_ENV_VAR = "AP2_WATCH_LOG_SAMPLE_RATE"
+# - Per DataPart key probabilities, e.g. "risk_data=0,ap2.mandates.CartMandate=1".
+SAMPLE_RATES_ENV_VAR = "AP2_WATCH_LOG_SAMPLE_RATES"
+# - The maximum serialized size of a logged value, e.g. "2000".
+MAX_VALUE_CHARS_ENV_VAR = "AP2_WATCH_LOG_MAX_VALUE_CHARS"
+
+# The keys under which the HTTP bodies logged by the server middleware are
+# sampled, like DataPart keys, e.g. "request_body=0.1" in SAMPLE_RATES_ENV_VAR.
+REQUEST_BODY_KEY = "request_body"
+RESPONSE_BODY_KEY = "response_body"
+RESPONSE_STREAM_KEY = "response_stream"
+
+_agent_name = "unknown"
+
+
+class SamplingPolicy:
+  """Controls which DataPart values are written to watch.log, and how much.
+
+  Under load, logging every byte of every mandate dominates the watch.log I/O.
+  A SamplingPolicy bounds that cost while still capturing representative
+  traffic:
+  1. Each DataPart key is logged with a configurable probability.
+  2. Each logged value is truncated to a maximum serialized size.
+  3. Sensitive fields are redacted wherever they appear in a value.
+
+  The raw HTTP bodies logged by the server middleware are sampled under
+  REQUEST_BODY_KEY, RESPONSE_BODY_KEY and RESPONSE_STREAM_KEY, and redacted and
+  truncated in the same way.
+  """
+
+  def __init__(
+      self,
+      sample_rates: Mapping[str, float] | None = None,
+      default_sample_rate: float = 1.0,
+      max_value_chars: int | None = None,
+      redacted_fields: Iterable[str] = DEFAULT_REDACTED_FIELDS,
+  ):
+    """Initialization.
+
+    Args:
+      sample_rates: Per DataPart key probability, in [0, 1], of logging a value.
+      default_sample_rate: The probability used for keys not in sample_rates.
+      max_value_chars: The maximum serialized size of a logged value. Longer
+        values are truncated and suffixed with a truncation marker. None
+        disables truncation.
+      redacted_fields: Field names whose values are replaced by a redaction
+        marker, at any depth of a logged value.
+    """
+    self._sample_rates = dict(sample_rates or {})
+    self._default_sample_rate = default_sample_rate
+    self._max_value_chars = max_value_chars
+    self._redacted_fields = frozenset(redacted_fields)
+
+  def should_log(self, key: str) -> bool:
+    """Returns whether a value for the given DataPart key should be logged."""
+    rate = self._sample_rates.get(key, self._default_sample_rate)
+    if rate >= 1.0:
+      return True
+    if rate <= 0.0:
+      return False
+    return random.random() < rate
+
+  def format_value(self, value: Any) -> str:
+    """Redacts, serializes and truncates a value for logging."""
+    text = json.dumps(self._redact(value), default=str)
+    if self._max_value_chars is None or len(text) <= self._max_value_chars:
+      return text
+    omitted = len(text) - self._max_value_chars
+    return f"{text[:self._max_value_chars]}...<truncated {omitted} chars>"
+
+  def format_body(self, body: bytes | str) -> str:
+    """Redacts and truncates an HTTP body, or a chunk of an event stream.
+
+    A JSON body, or the data of each server-sent event in the chunk, is
+    formatted as by format_value. Anything else cannot be redacted, so only
+    its size is logged.
+    """
+    if isinstance(body, bytes):
+      body = body.decode("utf-8", errors="replace")
+    if not body.strip():
+      return "<empty>"
+    lines = body.splitlines()
+    if not any(line.startswith("data:") for line in lines):
+      return self._format_json(body)
+    return "\n".join(
+        f"data: {self._format_json(line[len('data:'):])}"
+        if line.startswith("data:")
+        else line
+        for line in lines
+        if line
+    )
+
+  def _format_json(self, text: str) -> str:
+    """Formats JSON text as by format_value, or summarizes it if not JSON."""
+    try:
+      value = json.loads(text)
+    except ValueError:
+      return f"<{len(text)} chars of non-JSON data>"
+    return self.format_value(value)
+
+  def _redact(self, value: Any) -> Any:
+    """Returns a copy of the value with the sensitive fields redacted."""
+    if isinstance(value, dict):
+      return {
+          key: _REDACTED if key in self._redacted_fields else self._redact(item)
+          for key, item in value.items()
+      }
+    if isinstance(value, (list, tuple)):
+      return [self._redact(item) for item in value]
+    return value
+
+
+_policy = SamplingPolicy()
+
+
+def set_sampling_policy(policy: SamplingPolicy) -> None:
+  """Sets the SamplingPolicy applied to DataPart values in watch.log."""
+  global _policy
+  _policy = policy
+
+
+def sampling_policy() -> SamplingPolicy:
+  """Returns the SamplingPolicy applied to the values written to watch.log."""
+  return _policy
+
+
+def sampling_policy_from_env(
+    environ: Mapping[str, str] | None = None,
+) -> SamplingPolicy:
+  """Returns the SamplingPolicy configured by the environment variables.
+
+  Variables that are not set keep the defaults of SamplingPolicy, which logs
+  every value in full.
+
+  Args:
+    environ: The environment to read. Defaults to os.environ.
+
+  Raises:
+    ValueError: If a variable is set to an invalid value.
+  """
+  if environ is None:
+    environ = os.environ
+
+  default_sample_rate = 1.0
+  if environ.get(SAMPLE_RATE_ENV_VAR):
+    default_sample_rate = _parse_rate(
+        SAMPLE_RATE_ENV_VAR, environ[SAMPLE_RATE_ENV_VAR]
+    )
+
+  sample_rates = {}
+  for entry in environ.get(SAMPLE_RATES_ENV_VAR, "").split(","):
+    if not entry.strip():
+      continue
+    key, separator, rate = entry.rpartition("=")
+    if not separator or not key.strip():
+      raise ValueError(
+          f"Invalid {SAMPLE_RATES_ENV_VAR} entry {entry!r}, expected key=rate."
+      )
+    sample_rates[key.strip()] = _parse_rate(SAMPLE_RATES_ENV_VAR, rate)
+
+  max_value_chars = None
+  if environ.get(MAX_VALUE_CHARS_ENV_VAR):
+    try:
+      max_value_chars = int(environ[MAX_VALUE_CHARS_ENV_VAR])
+    except ValueError:
+      max_value_chars = -1
+    if max_value_chars < 0:
+      raise ValueError(
+          f"Invalid {MAX_VALUE_CHARS_ENV_VAR}"
+          f" {environ[MAX_VALUE_CHARS_ENV_VAR]!r}, expected a size >= 0."
+      )
+
+  return SamplingPolicy(
+      sample_rates=sample_rates,
+      default_sample_rate=default_sample_rate,
+      max_value_chars=max_value_chars,
+  )
+
+
+def _parse_rate(env_var: str, value: str) -> float:
+  """Parses a sample rate, which must be in [0, 1]."""
+  try:
+    rate = float(value)
+  except ValueError:
+    rate = -1.0
+  if not 0.0 <= rate <= 1.0:
+    raise ValueError(f"Invalid {env_var} rate {value!r}, expected 0 to 1.")
+  return rate
+
 
 def create_file_handler() -> logging.FileHandler:
   """Creates a file handler to the logger for watch.log.
@@ -47,14 +265,33 @@ def create_file_handler() -> logging.FileHandler:
 def log_a2a_message_parts(
     text_parts: list[str], data_parts: list[dict[str, Any]]
 ):
+  """Logs the A2A message parts to the watch.log file."""
   _load_logger()
 
-  """Logs the A2A message parts to the watch.log file."""
   _log_request_instructions(text_parts)
   _log_mandates(data_parts)
   _log_extra_data(data_parts)
 
 
+def set_agent_name(name: str) -> None:
+  """Sets the name of this agent, as recorded in timing events."""
+  global _agent_name
+  _agent_name = name
+
+
+def log_event(event: str, **fields: Any) -> None:
+  """Logs a timing event as a single JSON line to the watch.log file.
+
+  Args:
+    event: The type of the event, e.g. TOOL_CALL_EVENT.
+    **fields: Additional fields of the event, e.g. context_id and duration_ms.
+  """
+  _load_logger()
+  record = {"ts": time.time(), "agent": _agent_name, "event": event}
+  record.update(fields)
+  _logger.info("%s%s", EVENT_PREFIX, json.dumps(record, default=str))
+
+
 def log_a2a_request_extensions(context: RequestContext) -> None:
   """Logs the A2A extensions activated to the watch.log file."""
 
@@ -86,17 +323,11 @@ def _log_mandates(data_parts: list[dict[str, Any]]) -> None:
   for data_part in data_parts:
     for key, value in data_part.items():
       if key == CART_MANDATE_DATA_KEY:
-        _logger.info("\n")
-        _logger.info("[A Cart Mandate was in the request Data]")
-        _logger.info(value)
+        _log_value("[A Cart Mandate was in the request Data]", key, value)
       elif key == INTENT_MANDATE_DATA_KEY:
-        _logger.info("\n")
-        _logger.info("[An Intent Mandate was in the request Data]")
-        _logger.info(value)
+        _log_value("[An Intent Mandate was in the request Data]", key, value)
       elif key == PAYMENT_MANDATE_DATA_KEY:
-        _logger.info("\n")
-        _logger.info("[A Payment Mandate was in the request Data]")
-        _logger.info(value)
+        _log_value("[A Payment Mandate was in the request Data]", key, value)
 
 
 def _log_extra_data(data_parts: list[dict[str, Any]]) -> None:
@@ -110,6 +341,13 @@ def _log_extra_data(data_parts: list[dict[str, Any]]) -> None:
       ):
         continue
 
-      _logger.info("\n")
-      _logger.info("[Data Part: %s] ", key)
-      _logger.info(value)
+      _log_value(f"[Data Part: {key}] ", key, value)
+
+
+def _log_value(heading: str, key: str, value: Any) -> None:
+  """Logs a DataPart value under a heading, subject to the SamplingPolicy."""
+  if not _policy.should_log(key):
+    return
+  _logger.info("\n")
+  _logger.info(heading)
+  _logger.info(_policy.format_value(value))
@@ -0,0 +1,252 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Reports where time goes across the agents, based on their watch logs.
+
+Each agent writes timing events to its watch.log (see watch_log.py):
+1. A server writes a tool_call event once a tool has handled a request.
+2. A client writes an a2a_call event once a remote agent has answered.
+
+This tool streams over any number of watch logs, merges their events by
+timestamp and joins the a2a_call of a caller with the tool_call of the callee
+on (context_id, task_id). It then prints latency percentiles for each tool and
+a per-hop breakdown into tool resolution, tool execution and the remaining
+transport overhead.
+
+Memory use is constant in the size of the logs: latencies are accumulated in
+fixed-size log-scale histograms, and at most --max_pending unmatched events are
+held while waiting for their counterpart.
+
+Usage:
+  python -m common.watch_log_analyzer .logs/watch.log [more watch logs...]
+"""
+
+import collections
+from collections.abc import Iterator, Sequence
+import heapq
+import json
+import math
+from typing import Any
+
+from absl import app
+from absl import flags
+
+from common import watch_log
+
+_PERCENTILES = flags.DEFINE_list(
+    "percentiles", ["50", "90", "99"], "The latency percentiles to report."
+)
+_MAX_PENDING = flags.DEFINE_integer(
+    "max_pending",
+    10000,
+    "The maximum number of unmatched events held while joining.",
+)
+
+# Relative width of a histogram bucket; percentiles are accurate to within it.
+_BUCKET_GROWTH = 1.02
+_MIN_LATENCY_MS = 0.001
+
+
+class LatencyHistogram:
+  """A log-scale histogram of latencies, using constant memory."""
+
+  def __init__(self):
+    self._buckets = collections.Counter()
+    self.count = 0
+    self.total_ms = 0.0
+    self.max_ms = 0.0
+
+  def add(self, latency_ms: float) -> None:
+    """Records a latency, in milliseconds."""
+    latency_ms = max(latency_ms, _MIN_LATENCY_MS)
+    self._buckets[math.floor(math.log(latency_ms, _BUCKET_GROWTH))] += 1
+    self.count += 1
+    self.total_ms += latency_ms
+    self.max_ms = max(self.max_ms, latency_ms)
+
+  def percentile(self, percentile: float) -> float:
+    """Returns the approximate latency at the given percentile."""
+    if not self.count:
+      return 0.0
+    rank = percentile / 100 * self.count
+    seen = 0
+    for bucket in sorted(self._buckets):
+      seen += self._buckets[bucket]
+      if seen >= rank:
+        return min(_BUCKET_GROWTH ** (bucket + 1), self.max_ms)
+    return self.max_ms
+
+  def mean(self) -> float:
+    """Returns the mean latency."""
+    return self.total_ms / self.count if self.count else 0.0
+
+
+class _Hop:
+  """Latency breakdown of the calls from one agent to another agent's tool."""
+
+  def __init__(self):
+    self.client = LatencyHistogram()
+    self.resolve = LatencyHistogram()
+    self.tool = LatencyHistogram()
+    self.overhead = LatencyHistogram()
+
+
+class WatchLogAnalyzer:
+  """Accumulates latency statistics from a stream of timing events."""
+
+  def __init__(self, max_pending: int = 10000):
+    """Initialization.
+
+    Args:
+      max_pending: The maximum number of unmatched events held while waiting
+        for their counterpart. The oldest are dropped beyond this limit.
+    """
+    self._max_pending = max_pending
+    self._pending_tool_calls = collections.OrderedDict()
+    self._pending_a2a_calls = collections.OrderedDict()
+    self.tools = collections.defaultdict(LatencyHistogram)
+    self.hops = collections.defaultdict(_Hop)
+    self.unmatched = 0
+
+  def add_event(self, event: dict[str, Any]) -> None:
+    """Adds a timing event, joining it with its counterpart if available."""
+    key = (event.get("context_id"), event.get("task_id"))
+    if event["event"] == watch_log.TOOL_CALL_EVENT:
+      self.tools[event.get("tool")].add(event["duration_ms"])
+      a2a_call = self._pop_pending(self._pending_a2a_calls, key)
+      if a2a_call is None:
+        self._push_pending(self._pending_tool_calls, key, event)
+      else:
+        self._add_hop(a2a_call, event)
+    elif event["event"] == watch_log.A2A_CALL_EVENT:
+      tool_call = self._pop_pending(self._pending_tool_calls, key)
+      if tool_call is None:
+        self._push_pending(self._pending_a2a_calls, key, event)
+      else:
+        self._add_hop(event, tool_call)
+
+  def _add_hop(
+      self, a2a_call: dict[str, Any], tool_call: dict[str, Any]
+  ) -> None:
+    """Records the latency breakdown of a joined client and server event."""
+    hop = self.hops[(a2a_call["agent"], tool_call["agent"], tool_call["tool"])]
+    hop.client.add(a2a_call["duration_ms"])
+    hop.resolve.add(tool_call["resolve_ms"])
+    hop.tool.add(tool_call["tool_ms"])
+    hop.overhead.add(a2a_call["duration_ms"] - tool_call["duration_ms"])
+
+  def _push_pending(
+      self,
+      pending: collections.OrderedDict,
+      key: tuple[str, str],
+      event: dict[str, Any],
+  ) -> None:
+    """Holds an event until its counterpart arrives."""
+    pending.setdefault(key, collections.deque()).append(event)
+    pending.move_to_end(key)
+    if len(pending) > self._max_pending:
+      _, dropped = pending.popitem(last=False)
+      self.unmatched += len(dropped)
+
+  def _pop_pending(
+      self, pending: collections.OrderedDict, key: tuple[str, str]
+  ) -> dict[str, Any] | None:
+    """Returns the oldest held event for the key, if any."""
+    events = pending.get(key)
+    if not events:
+      return None
+    event = events.popleft()
+    if not events:
+      del pending[key]
+    return event
+
+  def unmatched_count(self) -> int:
+    """Returns the number of events that were never joined."""
+    pending = sum(map(len, self._pending_tool_calls.values())) + sum(
+        map(len, self._pending_a2a_calls.values())
+    )
+    return self.unmatched + pending
+
+
+def read_events(path: str) -> Iterator[dict[str, Any]]:
+  """Yields the timing events of a watch log, one line at a time."""
+  with open(path, "r", encoding="utf-8", errors="replace") as f:
+    for line in f:
+      index = line.find(watch_log.EVENT_PREFIX)
+      if index < 0:
+        continue
+      try:
+        yield json.loads(line[index + len(watch_log.EVENT_PREFIX):])
+      except json.JSONDecodeError:
+        continue
+
+
+def merge_events(paths: Sequence[str]) -> Iterator[dict[str, Any]]:
+  """Yields the timing events of several watch logs in timestamp order."""
+  return heapq.merge(
+      *(read_events(path) for path in paths), key=lambda event: event["ts"]
+  )
+
+
+def format_report(
+    analyzer: WatchLogAnalyzer, percentiles: Sequence[float]
+) -> str:
+  """Formats the accumulated statistics as plain text tables."""
+  percentile_headers = "".join(f"{f'p{p:g}':>10}" for p in percentiles)
+
+  def _row(label: str, histogram: LatencyHistogram) -> str:
+    values = "".join(
+        f"{histogram.percentile(p):>10.1f}" for p in percentiles
+    )
+    return (
+        f"{label:<48}{histogram.count:>8}{values}"
+        f"{histogram.mean():>10.1f}{histogram.max_ms:>10.1f}"
+    )
+
+  lines = ["[Tool Latency (ms)]"]
+  lines.append(f"{'tool':<48}{'count':>8}{percentile_headers}"
+               f"{'mean':>10}{'max':>10}")
+  for tool in sorted(analyzer.tools, key=str):
+    lines.append(_row(str(tool), analyzer.tools[tool]))
+
+  lines.append("")
+  lines.append("[Per-Hop Latency Breakdown (ms)]")
+  for (caller, callee, tool) in sorted(analyzer.hops, key=str):
+    hop = analyzer.hops[(caller, callee, tool)]
+    lines.append(f"{caller} -> {callee}: {tool}")
+    lines.append(f"  {'':<46}{'count':>8}{percentile_headers}"
+                 f"{'mean':>10}{'max':>10}")
+    lines.append(_row("  end to end", hop.client))
+    lines.append(_row("  tool resolution", hop.resolve))
+    lines.append(_row("  tool execution", hop.tool))
+    lines.append(_row("  transport and queueing", hop.overhead))
+
+  lines.append("")
+  lines.append(f"Unmatched events: {analyzer.unmatched_count()}")
+  return "\n".join(lines)
+
+
+def main(argv: Sequence[str]) -> None:
+  paths = argv[1:]
+  if not paths:
+    raise app.UsageError("At least one watch log path is required.")
+
+  analyzer = WatchLogAnalyzer(max_pending=_MAX_PENDING.value)
+  for event in merge_events(paths):
+    analyzer.add_event(event)
+  print(format_report(analyzer, [float(p) for p in _PERCENTILES.value]))
+
+
+if __name__ == "__main__":
+  app.run(main)
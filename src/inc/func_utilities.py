@@ -32,8 +32,8 @@ def setup_colored_logging(level=logging.INFO):
         
     root_logger.addHandler(stream_handler)
 
-# init logger
-setup_colored_logging(level=logging.INFO)
+# The agents' mains call setup_colored_logging; importing this module has no
+# side effects on logging.
 logger = logging.getLogger(__name__)
 
 def log_info(msg):
@@ -15,15 +15,18 @@
 """A credentials provider."""
 
 from collections.abc import Sequence
+import logging
 
 from absl import app
 from roles.credentials_provider_agent.agent_executor import CredentialsProviderExecutor
 from common import server
+from inc import func_utilities
 
 AGENT_PORT = 7002
 
 
 def main(argv: Sequence[str]) -> None:
+  func_utilities.setup_colored_logging(level=logging.INFO)
   agent_card = server.load_local_agent_card(__file__)
   server.run_agent_blocking(
       port=AGENT_PORT,
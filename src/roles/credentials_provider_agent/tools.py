@@ -90,9 +90,9 @@ async def handle_search_payment_methods(
   if not method_data:
     raise ValueError("method_data is required for search_payment_methods")
 
-  merchant_method_data_list = [
-      PaymentMethodData.model_validate(data) for data in method_data
-  ]
+  merchant_method_data_list = message_utils.validate_all(
+      PaymentMethodData, method_data
+  )
   eligible_aliases = _get_eligible_payment_method_aliases(
       user_email, merchant_method_data_list
   )
@@ -12,36 +12,161 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+
 """In-memory storage for CartMandates.
 
 A CartMandate may be updated multiple times during the course of a shopping
 journey. This storage system is used to persist CartMandates between
 interactions between the shopper and merchant agents.
+
+Every entry expires: a CartMandate with its cart_expiry, and the risk data of
+a context with the carts offered in it. The expiry is parsed once, when the
+entry is stored, and pushed onto a heap ordered by expiry. Getters treat an
+expired entry as missing, at the cost of a single comparison, and a sweeper
+task, started with the first stored entry, periodically pops the expired
+entries off the heap and evicts them. Eviction thus takes O(log n) per expired
+entry and never scans the entries that are still valid.
 """
 
-from typing import Optional
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from typing import Any, Optional
 
 from ap2.types.mandate import CartMandate
+from common import expiry
+
+# How often the sweeper evicts expired entries.
+SWEEP_INTERVAL_SECONDS = 60.0
+
+_CART = "cart"
+_RISK_DATA = "risk_data"
 
 
 def get_cart_mandate(cart_id: str) -> Optional[CartMandate]:
-  """Get a cart mandate by cart ID."""
-  return _store.get(cart_id)
+  """Get a cart mandate by cart ID, or None if it is unknown or expired."""
+  return _get(_CART, cart_id)
 
 
 def set_cart_mandate(cart_id: str, cart_mandate: CartMandate) -> None:
-  """Set a cart mandate by cart ID."""
-  _store[cart_id] = cart_mandate
+  """Set a cart mandate by cart ID; it expires with its cart_expiry.
+
+  Raises:
+    ValueError: If the cart_expiry is not an ISO 8601 timestamp.
+  """
+  expires_at = expiry.parse_expiry(cart_mandate.contents.cart_expiry)
+  payment_details_id = cart_mandate.contents.payment_request.details.id
+  _set(_CART, cart_id, cart_mandate, expires_at)
+  _cart_ids_by_payment_details_id[payment_details_id] = cart_id
+
 
+def get_cart_mandate_by_payment_details_id(
+    payment_details_id: str,
+) -> Optional[CartMandate]:
+  """Get a cart mandate by the ID of its PaymentRequest details.
 
-def set_risk_data(context_id: str, risk_data: str) -> None:
-  """Set risk data by context ID."""
-  _store[context_id] = risk_data
+  This is the payment_details_id a PaymentMandate refers to its cart by.
+  """
+  cart_id = _cart_ids_by_payment_details_id.get(payment_details_id)
+  if cart_id is None:
+    return None
+  cart_mandate = get_cart_mandate(cart_id)
+  if (
+      cart_mandate is None
+      or cart_mandate.contents.payment_request.details.id
+      != payment_details_id
+  ):
+    return None
+  return cart_mandate
+
+
+def set_risk_data(context_id: str, risk_data: str, expires_at: float) -> None:
+  """Set risk data by context ID.
+
+  Args:
+    context_id: The ID of the context the risk data was collected in.
+    risk_data: The risk data.
+    expires_at: When the risk data expires, in seconds since the epoch;
+      usually along with the carts offered in the context.
+  """
+  _set(_RISK_DATA, context_id, risk_data, expires_at)
 
 
 def get_risk_data(context_id: str) -> Optional[str]:
-  """Get risk data by context ID."""
-  return _store.get(context_id)
+  """Get risk data by context ID, or None if it is unknown or expired."""
+  return _get(_RISK_DATA, context_id)
+
+
+def sweep(now: float | None = None) -> int:
+  """Evicts the expired entries.
+
+  Args:
+    now: The current time, in seconds since the epoch. Defaults to now.
+
+  Returns:
+    The number of entries evicted.
+  """
+  if now is None:
+    now = time.time()
+  evicted = 0
+  while _expiry_heap and _expiry_heap[0][0] <= now:
+    expires_at, _, kind, key = heapq.heappop(_expiry_heap)
+    entry = _store.get((kind, key))
+    # An entry stored again under the same key has a later heap entry of its
+    # own; the earlier one is stale and ignored.
+    if entry is None or entry[1] != expires_at:
+      continue
+    del _store[(kind, key)]
+    evicted += 1
+    if kind == _CART:
+      payment_details_id = entry[0].contents.payment_request.details.id
+      if _cart_ids_by_payment_details_id.get(payment_details_id) == key:
+        del _cart_ids_by_payment_details_id[payment_details_id]
+  return evicted
+
+
+def _get(kind: str, key: str) -> Any:
+  """Returns the value of an entry, or None if it is missing or expired."""
+  entry = _store.get((kind, key))
+  if entry is None or expiry.is_expired(entry[1]):
+    return None
+  return entry[0]
+
+
+def _set(kind: str, key: str, value: Any, expires_at: float) -> None:
+  """Stores an entry and indexes it by expiry."""
+  _store[(kind, key)] = (value, expires_at)
+  heapq.heappush(_expiry_heap, (expires_at, next(_sequence), kind, key))
+  _ensure_sweeper()
+
+
+def _ensure_sweeper() -> None:
+  """Starts the sweeper task, if not running and in an event loop."""
+  global _sweeper
+  if _sweeper is not None and not _sweeper.done():
+    return
+  try:
+    loop = asyncio.get_running_loop()
+  except RuntimeError:
+    return  # Not in an event loop; expired entries are still never returned.
+  _sweeper = loop.create_task(_sweep_periodically())
+
+
+async def _sweep_periodically() -> None:
+  """Evicts expired entries every SWEEP_INTERVAL_SECONDS until none remain."""
+  while _expiry_heap:
+    await asyncio.sleep(SWEEP_INTERVAL_SECONDS)
+    evicted = sweep()
+    if evicted:
+      logging.info("Evicted %d expired entries from storage.", evicted)
 
 
+# Maps (kind, key) to (value, expires_at).
 _store = {}
+# A min-heap of (expires_at, sequence, kind, key).
+_expiry_heap = []
+_sequence = itertools.count()
+_cart_ids_by_payment_details_id = {}
+_sweeper = None
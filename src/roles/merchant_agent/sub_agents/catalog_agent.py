@@ -15,10 +15,11 @@ from a2a.types import DataPart
 from a2a.types import Part
 from a2a.types import Task
 from a2a.types import TextPart
-from google import genai
 from pydantic import ValidationError
 
 from .. import storage
+from ap2.types import interned
+from ap2.types import wire
 from ap2.types.mandate import CART_MANDATE_DATA_KEY
 from ap2.types.mandate import CartContents
 from ap2.types.mandate import CartMandate
@@ -29,21 +30,48 @@ from ap2.types.payment_request import PaymentItem
 from ap2.types.payment_request import PaymentMethodData
 from ap2.types.payment_request import PaymentOptions
 from ap2.types.payment_request import PaymentRequest
+from common import expiry
 from common import message_utils
 from common.system_utils import DEBUG_MODE_INSTRUCTIONS
 from inc import func_utilities
 
+# How long the carts offered to the user, and the risk data collected along
+# with them, remain valid.
+_CART_LIFETIME = timedelta(minutes=30)
+
+# Every cart offers the same payment methods and options, so a single frozen
+# instance of each is shared by all carts, and serialized only once.
+_PAYMENT_METHOD_DATA = interned.intern(
+    PaymentMethodData(
+        supported_methods="CARD",
+        data={
+            "network": ["mastercard", "paypal", "amex"],
+        },
+    )
+)
+_PAYMENT_OPTIONS = interned.intern(PaymentOptions(request_shipping=True))
+
 async def find_items_workflow(
     data_parts: list[dict[str, Any]],
     updater: TaskUpdater,
     current_task: Task | None,
 ) -> None:
   """Finds products that match the user's IntentMandate."""
-  llm_client = genai.Client()
-
   intent_mandate = message_utils.parse_canonical_object(
       INTENT_MANDATE_DATA_KEY, data_parts, IntentMandate
   )
+  if expiry.is_expired(expiry.parse_expiry(intent_mandate.intent_expiry)):
+    error_message = updater.new_agent_message(
+        parts=[Part(root=TextPart(text="The IntentMandate has expired."))]
+    )
+    await updater.failed(message=error_message)
+    return
+
+  # google.genai takes long to import, so it is only imported once needed.
+  from google import genai  # pylint: disable=g-import-not-at-top
+
+  llm_client = genai.Client()
+
   intent = intent_mandate.natural_language_description
   prompt = f"""
         Based on the user's request for '{intent}', your task is to generate 3
@@ -72,7 +100,9 @@ async def find_items_workflow(
       await _create_and_add_cart_mandate_artifact(
           item, item_count, current_time, updater
       )
-    risk_data = _collect_risk_data(updater)
+    risk_data = _collect_risk_data(
+        updater, (current_time + _CART_LIFETIME).timestamp()
+    )
     updater.add_artifact([
         Part(root=DataPart(data={"risk_data": risk_data})),
     ])
@@ -93,14 +123,7 @@ async def _create_and_add_cart_mandate_artifact(
 ) -> None:
   """Creates a CartMandate and adds it as an artifact."""
   payment_request = PaymentRequest(
-      method_data=[
-          PaymentMethodData(
-              supported_methods="CARD",
-              data={
-                  "network": ["mastercard", "paypal", "amex"],
-              },
-          )
-      ],
+      method_data=[_PAYMENT_METHOD_DATA],
       details=PaymentDetailsInit(
           id=f"order_{item_count}",
           display_items=[item],
@@ -109,14 +132,14 @@ async def _create_and_add_cart_mandate_artifact(
               amount=item.amount,
           ),
       ),
-      options=PaymentOptions(request_shipping=True),
+      options=_PAYMENT_OPTIONS,
   )
 
   cart_contents = CartContents(
       id=f"cart_{item_count}",
       user_cart_confirmation_required=True,
       payment_request=payment_request,
-      cart_expiry=(current_time + timedelta(minutes=30)).isoformat(),
+      cart_expiry=(current_time + _CART_LIFETIME).isoformat(),
       merchant_name="Generic Merchant",
   )
 
@@ -126,14 +149,14 @@ async def _create_and_add_cart_mandate_artifact(
   
   await updater.add_artifact([
       Part(
-          root=DataPart(data={CART_MANDATE_DATA_KEY: cart_mandate.model_dump()})
+          root=DataPart(data={CART_MANDATE_DATA_KEY: wire.to_wire(cart_mandate)})
       )
   ])
 
 
-def _collect_risk_data(updater: TaskUpdater) -> dict:
-  """Creates a risk_data in the tool_context."""
+def _collect_risk_data(updater: TaskUpdater, expires_at: float) -> dict:
+  """Creates a risk_data in the tool_context, valid until expires_at."""
   # This is a fake risk data for demonstration purposes.
   risk_data = "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...fake_risk_data"
-  storage.set_risk_data(updater.context_id, risk_data)
+  storage.set_risk_data(updater.context_id, risk_data, expires_at)
   return risk_data
@@ -17,19 +17,24 @@ from a2a.server.tasks.task_updater import TaskUpdater
 from a2a.types import DataPart
 from a2a.types import Part
 from a2a.types import Task
+from a2a.types import TaskState
 from a2a.types import TextPart
 
 from . import storage
+from ap2.types import money
+from ap2.types import wire
 from ap2.types.contact_picker import ContactAddress
 from ap2.types.mandate import CART_MANDATE_DATA_KEY
 from ap2.types.mandate import PAYMENT_MANDATE_DATA_KEY
 from ap2.types.mandate import PaymentMandate
 from ap2.types.payment_request import PaymentCurrencyAmount
 from ap2.types.payment_request import PaymentItem
+from common import a2a_client_registry
+from common import jws
+from common import mandate_signing
 from common import message_utils
 from common.a2a_extension_utils import EXTENSION_URI
 from common.a2a_message_builder import A2aMessageBuilder
-from common.payment_remote_a2a_client import PaymentRemoteA2aClient
 
 from inc import func_utilities
 
@@ -40,10 +45,6 @@ _PAYMENT_PROCESSORS_BY_PAYMENT_METHOD_TYPE = {
     "CARD": "http://localhost:7003/a2a/merchant_payment_processor_agent",
 }
 
-# A placeholder for a JSON Web Token (JWT) used for merchant authorization.
-_FAKE_JWT = "eyJhbGciOiJSUzI1NiIsImtpZIwMjQwOTA..."
-
-
 async def update_cart(
     data_parts: list[dict[str, Any]],
     updater: TaskUpdater,
@@ -72,7 +73,9 @@ async def update_cart(
 
   cart_mandate = storage.get_cart_mandate(cart_id)
   if not cart_mandate:
-    await _fail_task(updater, f"CartMandate not found for cart_id: {cart_id}")
+    await _fail_task(
+        updater, f"CartMandate not found or expired for cart_id: {cart_id}"
+    )
     return
 
   risk_data = storage.get_risk_data(updater.context_id)
@@ -108,19 +111,23 @@ async def update_cart(
     else:
       payment_request.details.display_items.extend(tax_and_shipping_costs)
 
-    # Recompute the total amount of the PaymentRequest:
-    payment_request.details.total.amount.value = sum(
-        item.amount.value for item in payment_request.details.display_items
-    )
+    # Recompute the total amount of the PaymentRequest, exactly. The amount
+    # is replaced rather than updated, as it may be shared with an item.
+    total = payment_request.details.total
+    total.amount = money.total(
+        payment_request.details.display_items, total.amount.currency
+    ).to_amount()
 
     # A base64url-encoded JSON Web Token (JWT) that digitally signs the cart
     # contents by the merchant's private key.
-    cart_mandate.merchant_authorization = _FAKE_JWT
+    cart_mandate.merchant_authorization = mandate_signing.sign_cart_mandate(
+        cart_mandate, jws.signing_key(mandate_signing.MERCHANT_SIGNER)
+    )
 
     await updater.add_artifact([
         Part(
             root=DataPart(
-                data={CART_MANDATE_DATA_KEY: cart_mandate.model_dump()}
+                data={CART_MANDATE_DATA_KEY: wire.to_wire(cart_mandate)}
             )
         ),
         Part(root=DataPart(data={"risk_data": risk_data})),
@@ -153,6 +160,17 @@ async def initiate_payment(
     await _fail_task(updater, "Missing payment_mandate.")
     return
 
+  payment_details_id = (
+      payment_mandate.payment_mandate_contents.payment_details_id
+  )
+  if storage.get_cart_mandate_by_payment_details_id(payment_details_id) is None:
+    await _fail_task(
+        updater,
+        "CartMandate not found or expired for payment_details_id:"
+        f" {payment_details_id}",
+    )
+    return
+
   risk_data = message_utils.find_data_part("risk_data", data_parts)
   if not risk_data:
     await _fail_task(updater, "Missing risk_data.")
@@ -171,7 +189,7 @@ async def initiate_payment(
     )
     return
 
-  payment_processor_agent = PaymentRemoteA2aClient(
+  payment_processor_agent = a2a_client_registry.get_client(
       name="payment_processor_agent",
       base_url=processor_url,
       required_extensions={
@@ -183,7 +201,7 @@ async def initiate_payment(
       A2aMessageBuilder()
       .set_context_id(updater.context_id)
       .add_text("initiate_payment")
-      .add_data(PAYMENT_MANDATE_DATA_KEY, payment_mandate.model_dump())
+      .add_data(PAYMENT_MANDATE_DATA_KEY, payment_mandate)
       .add_data("risk_data", risk_data)
       .add_data("debug_mode", debug_mode)
   )
@@ -198,11 +216,22 @@ async def initiate_payment(
   if payment_processor_task_id:
     message_builder.set_task_id(payment_processor_task_id)
 
-  task = await payment_processor_agent.send_a2a_message(message_builder.build())
-  await updater.update_status(
-      state=task.status.state,
-      message=task.status.message,
-  )
+  # Relay the processor's status as it changes, so challenges and intermediate
+  # status reach the shopping agent without waiting for the full round trip.
+  relayed_state = TaskState.submitted
+  async for event in payment_processor_agent.stream_a2a_message(
+      message_builder.build()
+  ):
+    if not isinstance(event, tuple):
+      continue
+    task = event[0]
+    if task.status.state == relayed_state:
+      continue
+    relayed_state = task.status.state
+    await updater.update_status(
+        state=task.status.state,
+        message=task.status.message,
+    )
 
 
 async def dpc_finish(
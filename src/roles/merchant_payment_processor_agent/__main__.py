@@ -15,15 +15,18 @@
 """An agent for processing payments on behalf of a merchant."""
 
 from collections.abc import Sequence
+import logging
 
 from absl import app
 
 from roles.merchant_payment_processor_agent.agent_executor import PaymentProcessorExecutor
 from common import server
+from inc import func_utilities
 
 AGENT_PAYMENT_PROCESSOR_PORT = 7003
 
 def main(argv: Sequence[str]) -> None:
+  func_utilities.setup_colored_logging(level=logging.INFO)
   agent_card = server.load_local_agent_card(__file__)
   server.run_agent_blocking(
       port=AGENT_PAYMENT_PROCESSOR_PORT,
@@ -31,11 +31,11 @@ from a2a.types import TextPart
 
 from ap2.types.mandate import PAYMENT_MANDATE_DATA_KEY
 from ap2.types.mandate import PaymentMandate
+from common import a2a_client_registry
 from common import artifact_utils
 from common import message_utils
 from common.a2a_extension_utils import EXTENSION_URI
 from common.a2a_message_builder import A2aMessageBuilder
-from common.payment_remote_a2a_client import PaymentRemoteA2aClient
 
 
 async def initiate_payment(
@@ -57,7 +57,9 @@ async def initiate_payment(
       message_utils.find_data_part("challenge_response", data_parts) or ""
   )
   await _handle_payment_mandate(
-      PaymentMandate.model_validate(payment_mandate),
+      message_utils.parse_canonical_object(
+          PAYMENT_MANDATE_DATA_KEY, data_parts, PaymentMandate
+      ),
       challenge_response,
       updater,
       current_task,
@@ -215,7 +217,7 @@ async def _request_payment_credential(
   )
   credentials_provider_url = token_object.get("url")
 
-  credentials_provider = PaymentRemoteA2aClient(
+  credentials_provider = a2a_client_registry.get_client(
       name="credentials_provider",
       base_url=credentials_provider_url,
       required_extensions={EXTENSION_URI},
@@ -225,7 +227,7 @@ async def _request_payment_credential(
       A2aMessageBuilder()
       .set_context_id(updater.context_id)
       .add_text("Give me the payment method credentials for the given token.")
-      .add_data(PAYMENT_MANDATE_DATA_KEY, payment_mandate.model_dump())
+      .add_data(PAYMENT_MANDATE_DATA_KEY, payment_mandate)
       .add_data("debug_mode", debug_mode)
   )
   task = await credentials_provider.send_a2a_message(message_builder.build())
@@ -9,11 +9,13 @@ This registry serves as the initial allowlist of remote agents that the shopping
 agent trusts.
 """
 
+from common import a2a_client_registry
+from common import watch_log
 from common.a2a_extension_utils import EXTENSION_URI
-from common.payment_remote_a2a_client import PaymentRemoteA2aClient
 
+watch_log.set_agent_name("shopping_agent")
 
-credentials_provider_client = PaymentRemoteA2aClient(
+credentials_provider_client = a2a_client_registry.get_client(
     name="credentials_provider",
     base_url="http://localhost:7002/a2a/credentials_provider",
     required_extensions={
@@ -22,7 +24,7 @@ credentials_provider_client = PaymentRemoteA2aClient(
 )
 
 
-merchant_agent_client = PaymentRemoteA2aClient(
+merchant_agent_client = a2a_client_registry.get_client(
     name="merchant_agent",
     base_url="http://localhost:7001/a2a/merchant_agent",
     required_extensions={
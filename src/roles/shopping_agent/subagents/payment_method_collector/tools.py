@@ -49,12 +49,9 @@ async def get_payment_methods(
       .add_data("user_email", user_email)
   )
   for method_data in cart_mandate.contents.payment_request.method_data:
-    message_builder.add_data(
-        PAYMENT_METHOD_DATA_DATA_KEY,
-        method_data.model_dump(),
-    )
+    message_builder.add_data(PAYMENT_METHOD_DATA_DATA_KEY, method_data)
   task = await credentials_provider_client.send_a2a_message(
-      message_builder.build()
+      message_builder.build(), idempotent=True
   )
   payment_methods = artifact_utils.get_first_data_part(task.artifacts)
   return payment_methods
@@ -18,7 +18,6 @@ Each agent uses individual tools to handle distinct tasks throughout the
 shopping and purchasing process.
 """
 
-from a2a.types import Artifact
 from google.adk.tools.tool_context import ToolContext
 
 from ap2.types.contact_picker import CONTACT_ADDRESS_DATA_KEY
@@ -48,13 +47,16 @@ async def get_shipping_address(
       .add_data("user_email", user_email)
       .build()
   )
-  task = await credentials_provider_client.send_a2a_message(message)
-  shipping_address = artifact_utils.only(_parse_addresses(task.artifacts))
+  task = await credentials_provider_client.send_a2a_message(
+      message, idempotent=True
+  )
+  artifacts = artifact_utils.ArtifactIndex(task.artifacts)
+  shipping_address = artifact_utils.only(_parse_addresses(artifacts))
   return shipping_address
 
 
-def _parse_addresses(artifacts: list[Artifact]) -> list[ContactAddress]:
-  """Parses a list of artifacts into a list of ContactAddress objects."""
-  return artifact_utils.find_canonical_objects(
-      artifacts, CONTACT_ADDRESS_DATA_KEY, ContactAddress
-  )
+def _parse_addresses(
+    artifacts: artifact_utils.ArtifactIndex,
+) -> list[ContactAddress]:
+  """Parses a Task's indexed artifacts into a list of ContactAddress objects."""
+  return artifacts.canonical_objects(CONTACT_ADDRESS_DATA_KEY, ContactAddress)
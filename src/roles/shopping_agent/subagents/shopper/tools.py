@@ -21,7 +21,6 @@ shopping and purchasing process.
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
-from a2a.types import Artifact
 from google.adk.tools.tool_context import ToolContext
 
 from ap2.types.mandate import CART_MANDATE_DATA_KEY
@@ -29,7 +28,7 @@ from ap2.types.mandate import CartMandate
 from ap2.types.mandate import INTENT_MANDATE_DATA_KEY
 from ap2.types.mandate import IntentMandate
 from common.a2a_message_builder import A2aMessageBuilder
-from common.artifact_utils import find_canonical_objects
+from common.artifact_utils import ArtifactIndex
 from roles.shopping_agent.remote_agents import merchant_agent_client
 from inc import func_utilities
 
@@ -92,7 +91,7 @@ async def find_products(
   message = (
       A2aMessageBuilder()
       .add_text("Find products that match the user's IntentMandate.")
-      .add_data(INTENT_MANDATE_DATA_KEY, intent_mandate.model_dump())
+      .add_data(INTENT_MANDATE_DATA_KEY, intent_mandate)
       .add_data("risk_data", risk_data)
       .add_data("debug_mode", debug_mode)
       .add_data("shopping_agent_id", "trusted_shopping_agent")
@@ -104,7 +103,7 @@ async def find_products(
     raise RuntimeError(f"Failed to find products: {task.status}")
 
   tool_context.state["shopping_context_id"] = task.context_id
-  cart_mandates = _parse_cart_mandates(task.artifacts)
+  cart_mandates = _parse_cart_mandates(ArtifactIndex(task.artifacts))
   tool_context.state["cart_mandates"] = cart_mandates
   return cart_mandates
 
@@ -127,9 +126,9 @@ def update_chosen_cart_mandate(cart_id: str, tool_context: ToolContext) -> str:
   return f"CartMandate with ID {cart_id} not found."
 
 
-def _parse_cart_mandates(artifacts: list[Artifact]) -> list[CartMandate]:
-  """Parses a list of artifacts into a list of CartMandate objects."""
-  return find_canonical_objects(artifacts, CART_MANDATE_DATA_KEY, CartMandate)
+def _parse_cart_mandates(artifacts: ArtifactIndex) -> list[CartMandate]:
+  """Parses a Task's indexed artifacts into a list of CartMandate objects."""
+  return artifacts.canonical_objects(CART_MANDATE_DATA_KEY, CartMandate)
 
 
 def _collect_risk_data(tool_context: ToolContext) -> dict:
@@ -10,11 +10,11 @@ from datetime import datetime
 from datetime import timezone
 import uuid
 
-from a2a.types import Artifact
 from google.adk.tools.tool_context import ToolContext
 
 from .remote_agents import credentials_provider_client
 from .remote_agents import merchant_agent_client
+from ap2.types import canonical
 from ap2.types.contact_picker import ContactAddress
 from ap2.types.mandate import CART_MANDATE_DATA_KEY
 from ap2.types.mandate import CartMandate
@@ -23,9 +23,10 @@ from ap2.types.mandate import PaymentMandate
 from ap2.types.mandate import PaymentMandateContents
 from ap2.types.payment_request import PaymentResponse
 from common import artifact_utils
+from common import jws
+from common import mandate_signing
 from common.a2a_message_builder import A2aMessageBuilder
 
-
 async def update_cart(
     shipping_address: ContactAddress,
     tool_context: ToolContext,
@@ -57,9 +58,11 @@ async def update_cart(
   )
   task = await merchant_agent_client.send_a2a_message(message)
 
-  updated_cart_mandate = artifact_utils.only(
-      _parse_cart_mandates(task.artifacts)
-  )
+  artifacts = artifact_utils.ArtifactIndex(task.artifacts)
+  updated_cart_mandate = artifact_utils.only(_parse_cart_mandates(artifacts))
+  # The merchant signs the cart once it has the shipping address; a cart
+  # without a valid merchant_authorization raises jws.InvalidTokenError.
+  mandate_signing.verify_cart_mandate(updated_cart_mandate)
 
   tool_context.state["cart_mandate"] = updated_cart_mandate
   tool_context.state["shipping_address"] = shipping_address
@@ -191,16 +194,15 @@ def sign_mandates_on_user_device(tool_context: ToolContext) -> str:
   secure hardware element on the user's device (e.g., Secure Enclave) to be
   cryptographically signed with the user's private key.
 
-  Note: This is a placeholder implementation. It does not perform any actual
-  cryptographic operations. It simulates the creation of a signature by
-  concatenating the mandate hashes.
+  Note: This is a simulation. The signature is made with a software key held
+  by the shopping agent on behalf of the user's device.
 
   Args:
       tool_context: The context object used for state management. It is expected
         to contain the `payment_mandate` and `cart_mandate`.
 
   Returns:
-      A string representing the simulated user authorization signature (JWT).
+      The user authorization signature (JWT).
   """
   payment_mandate: PaymentMandate = tool_context.state["payment_mandate"]
   cart_mandate: CartMandate = tool_context.state["cart_mandate"]
@@ -211,8 +213,9 @@ def sign_mandates_on_user_device(tool_context: ToolContext) -> str:
   # A JWT containing the user's digital signature to authorize the transaction.
   # The payload uses hashes to bind the signature to the specific cart and
   # payment details, and includes a nonce to prevent replay attacks.
-  payment_mandate.user_authorization = (
-      cart_mandate_hash + "_" + payment_mandate_hash
+  payment_mandate.user_authorization = mandate_signing.sign_user_authorization(
+      [cart_mandate_hash, payment_mandate_hash],
+      jws.signing_key(mandate_signing.USER_DEVICE_SIGNER),
   )
   tool_context.state["signed_payment_mandate"] = payment_mandate
   return payment_mandate.user_authorization
@@ -250,20 +253,17 @@ def _generate_cart_mandate_hash(cart_mandate: CartMandate) -> str:
   """Generates a cryptographic hash of the CartMandate.
 
   This hash serves as a tamper-proof reference to the specific merchant-signed
-  cart offer that the user has approved.
-
-  Note: This is a placeholder implementation for development. A real
-  implementation must use a secure hashing algorithm (e.g., SHA-256) on the
-  canonical representation of the CartMandate object.
+  cart offer that the user has approved. It is the SHA-256 digest of the
+  canonical JSON representation of the CartMandate object.
 
   Args:
       cart_mandate: The complete CartMandate object, including the merchant's
         authorization.
 
   Returns:
-      A string representing the hash of the cart mandate.
+      The base64url-encoded hash of the cart mandate.
   """
-  return "fake_cart_mandate_hash_" + cart_mandate.contents.id
+  return canonical.digest(cart_mandate)
 
 
 def _generate_payment_mandate_hash(
@@ -272,25 +272,20 @@ def _generate_payment_mandate_hash(
   """Generates a cryptographic hash of the PaymentMandateContents.
 
   This hash creates a tamper-proof reference to the specific payment details
-  the user is about to authorize.
-
-  Note: This is a placeholder implementation for development. A real
-  implementation must use a secure hashing algorithm (e.g., SHA-256) on the
-  canonical representation of the PaymentMandateContents object.
+  the user is about to authorize. It is the SHA-256 digest of the canonical
+  JSON representation of the PaymentMandateContents object.
 
   Args:
       payment_mandate_contents: The payment mandate contents to hash.
 
   Returns:
-      A string representing the hash of the payment mandate contents.
+      The base64url-encoded hash of the payment mandate contents.
   """
-  return (
-      "fake_payment_mandate_hash_" + payment_mandate_contents.payment_mandate_id
-  )
+  return canonical.digest(payment_mandate_contents)
 
 
-def _parse_cart_mandates(artifacts: list[Artifact]) -> list[CartMandate]:
-  """Parses a list of artifacts into a list of CartMandate objects."""
-  return artifact_utils.find_canonical_objects(
-      artifacts, CART_MANDATE_DATA_KEY, CartMandate
-  )
+def _parse_cart_mandates(
+    artifacts: artifact_utils.ArtifactIndex,
+) -> list[CartMandate]:
+  """Parses a Task's indexed artifacts into a list of CartMandate objects."""
+  return artifacts.canonical_objects(CART_MANDATE_DATA_KEY, CartMandate)
@@ -0,0 +1,72 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for canonical."""
+
+import pytest
+
+from ap2.types import canonical
+from benchmarks import payloads
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ({"b": 1, "a": [True, None]}, b'{"a":[true,null],"b":1}'),
+        (12.0, b"12"),
+        (1e-07, b"1e-7"),
+        (1e21, b"1e+21"),
+        (-0.5, b"-0.5"),
+        ("€", "\"€\"".encode("utf-8")),
+    ],
+)
+def test_canonical_json(value, expected):
+  assert canonical.canonical_json(value) == expected
+
+
+def test_canonical_json_rejects_nan():
+  with pytest.raises(ValueError):
+    canonical.canonical_json(float("nan"))
+
+
+def test_digest_matches_a_fresh_digest():
+  cart = payloads.cart_mandate(item_count=2)
+
+  assert canonical.digest(cart) == canonical.sha256_digest(
+      canonical.canonical_json(cart)
+  )
+  assert canonical.digest(cart) == canonical.digest(cart.model_copy(deep=True))
+
+
+def test_digest_changes_when_a_nested_field_is_mutated():
+  cart = payloads.cart_mandate(item_count=2)
+  before = canonical.digest(cart)
+
+  cart.contents.payment_request.details.display_items[1].amount.value += 1
+
+  assert canonical.digest(cart) != before
+  assert canonical.digest(cart) == canonical.sha256_digest(
+      canonical.canonical_json(cart)
+  )
+
+
+def test_digest_changes_when_a_nested_list_is_appended_to():
+  cart = payloads.cart_mandate(item_count=2)
+  before = canonical.digest(cart)
+
+  items = cart.contents.payment_request.details.display_items
+  items.append(items[0].model_copy())
+
+  assert canonical.digest(cart) != before
@@ -0,0 +1,76 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for interned."""
+
+import pydantic
+import pytest
+
+from ap2.types import canonical
+from ap2.types import interned
+from ap2.types import wire
+from ap2.types.payment_request import PaymentMethodData
+from ap2.types.payment_request import PaymentOptions
+from benchmarks import payloads
+
+
+def _method_data() -> PaymentMethodData:
+  return PaymentMethodData(
+      supported_methods="CARD",
+      data={"network": ["mastercard", "paypal", "amex"]},
+  )
+
+
+def test_intern_shares_one_instance_per_value():
+  shared = interned.intern(_method_data())
+
+  assert interned.intern(_method_data()) is shared
+  assert interned.intern(shared) is shared
+  assert interned.is_interned(shared)
+  assert isinstance(shared, PaymentMethodData)
+  assert shared.model_dump() == _method_data().model_dump()
+
+
+def test_intern_leaves_the_model_mutable():
+  model = PaymentOptions(request_payer_email=True)
+  shared = interned.intern(model)
+
+  model.request_shipping = False
+
+  assert shared.request_shipping is True
+  with pytest.raises(pydantic.ValidationError):
+    shared.request_shipping = False
+
+
+def test_interned_cart_serializes_like_a_fresh_one():
+  fresh = payloads.cart_mandate()
+  shared = fresh.model_copy(deep=True)
+  payment_request = shared.contents.payment_request
+  payment_request.method_data = [interned.intern(_method_data())]
+  payment_request.options = interned.intern(payment_request.options)
+
+  assert wire.to_wire(shared) == wire.to_wire(fresh)
+  assert canonical.canonical_json(shared) == canonical.canonical_json(fresh)
+
+
+def test_dumps_of_an_interned_instance_are_independent():
+  shared = interned.intern(_method_data())
+  dump = shared.model_dump(mode="json")
+
+  dump["data"]["network"].append("visa")
+
+  assert shared.model_dump(mode="json") == _method_data().model_dump(
+      mode="json"
+  )
@@ -0,0 +1,71 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for money."""
+
+import pytest
+
+from ap2.types import money
+from ap2.types.payment_request import PaymentCurrencyAmount
+from ap2.types.payment_request import PaymentItem
+
+
+def _item(
+    value: float, currency: str = "USD", label: str = "Item"
+) -> PaymentItem:
+  return PaymentItem(
+      label=label,
+      amount=PaymentCurrencyAmount(currency=currency, value=value),
+  )
+
+
+def test_total_is_exact_where_the_float_sum_drifts():
+  items = [_item(0.1) for _ in range(10)]
+
+  assert sum(item.amount.value for item in items) != 1.0
+  assert money.total(items, "USD") == money.Money("USD", 100)
+
+
+def test_total_rounds_extra_decimals_half_to_even():
+  items = [_item(0.125), _item(0.135)]
+
+  assert money.total(items, "USD") == money.Money("USD", 12 + 14)
+
+
+def test_total_uses_the_currency_exponent():
+  assert money.total([_item(1500, "JPY")], "JPY") == money.Money("JPY", 1500)
+  assert money.total([_item(1.5, "KWD")], "KWD") == money.Money("KWD", 1500)
+
+
+def test_total_of_no_items_is_zero():
+  assert money.total([], "USD") == money.Money("USD", 0)
+
+
+def test_total_rejects_another_currency():
+  with pytest.raises(ValueError, match="EUR"):
+    money.total([_item(1.0), _item(1.0, "EUR")], "USD")
+
+
+def test_group_totals_sums_each_group():
+  items = [_item(0.1, label="a"), _item(0.2, label="b"), _item(0.2, label="a")]
+
+  totals = money.group_totals(items, "USD", lambda item: item.label)
+
+  assert totals == {"a": money.Money("USD", 30), "b": money.Money("USD", 20)}
+
+
+def test_group_totals_rejects_another_currency():
+  with pytest.raises(ValueError, match="EUR"):
+    money.group_totals([_item(1.0, "EUR")], "USD", lambda item: item.label)
@@ -0,0 +1,181 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for msgspec_codec, fuzzing it against the pydantic models.
+
+Random instances of every ap2.types model, with optional fields left at their
+defaults, set to None or to random values, must encode to the pydantic wire
+form and survive every conversion between the two implementations.
+"""
+
+import json
+import random
+import types
+import typing
+from typing import Any
+
+from pydantic import BaseModel
+import pytest
+
+from ap2.types import wire
+
+msgspec_codec = pytest.importorskip("ap2.types.msgspec_codec")
+
+_FUZZ_ITERATIONS = 300
+
+_MAX_DEPTH = 3
+_CHARACTERS = "abcXYZ019 _-.,:/\\\"'\n\té€中\U0001f600"
+
+
+def _random_string(rng: random.Random) -> str:
+  return "".join(rng.choice(_CHARACTERS) for _ in range(rng.randint(0, 12)))
+
+
+def _random_float(rng: random.Random) -> float:
+  return rng.choice([
+      0.0,
+      float(rng.randint(-1000, 1000)),
+      round(rng.uniform(0, 10000), 2),
+      rng.uniform(-1e12, 1e12),
+      rng.uniform(-1e-6, 1e-6),
+  ])
+
+
+def _random_json(rng: random.Random, depth: int) -> Any:
+  """Returns a random JSON-compatible value, as held by dict[str, Any]."""
+  kinds = ["null", "bool", "int", "float", "str"]
+  if depth < _MAX_DEPTH:
+    kinds += ["list", "dict"]
+  kind = rng.choice(kinds)
+  if kind == "null":
+    return None
+  if kind == "bool":
+    return rng.random() < 0.5
+  if kind == "int":
+    return rng.randint(-(2**53), 2**53)
+  if kind == "float":
+    return _random_float(rng)
+  if kind == "str":
+    return _random_string(rng)
+  if kind == "list":
+    return [_random_json(rng, depth + 1) for _ in range(rng.randint(0, 3))]
+  return {
+      _random_string(rng): _random_json(rng, depth + 1)
+      for _ in range(rng.randint(0, 3))
+  }
+
+
+def _random_value(annotation: Any, rng: random.Random, depth: int) -> Any:
+  """Returns a random value of the annotated type."""
+  origin = typing.get_origin(annotation)
+  args = typing.get_args(annotation)
+  if origin in (typing.Union, types.UnionType):
+    if type(None) in args and rng.random() < 0.3:
+      return None
+    return _random_value(
+        next(arg for arg in args if arg is not type(None)), rng, depth
+    )
+  if origin is list:
+    return [
+        _random_value(args[0], rng, depth + 1)
+        for _ in range(rng.randint(0, 3))
+    ]
+  if origin is dict:
+    return {
+        _random_string(rng): _random_json(rng, depth + 1)
+        for _ in range(rng.randint(0, 3))
+    }
+  if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+    return _random_model(annotation, rng, depth + 1)
+  if annotation is str:
+    return _random_string(rng)
+  if annotation is float:
+    return _random_float(rng)
+  if annotation is int:
+    return rng.randint(-1000, 1000)
+  if annotation is bool:
+    return rng.random() < 0.5
+  raise TypeError(f"No generator for {annotation}.")
+
+
+def _random_model(
+    model: type[BaseModel], rng: random.Random, depth: int = 0
+) -> BaseModel:
+  """Returns a random instance of the model."""
+  kwargs = {}
+  for name, field in model.model_fields.items():
+    if not field.is_required() and rng.random() < 0.4:
+      continue
+    kwargs[name] = _random_value(field.annotation, rng, depth)
+  return model(**kwargs)
+
+
+def _check_parity(model: BaseModel) -> None:
+  """Fails the test if the two implementations disagree on model."""
+  struct_type = msgspec_codec.STRUCTS_BY_MODEL[type(model)]
+  struct = msgspec_codec.from_pydantic(model)
+  encoded = msgspec_codec.encode(struct)
+  checks = {
+      "encoding matches the wire form": (
+          json.loads(encoded) == wire.to_wire(model)
+      ),
+      "round trip through the Struct": (
+          msgspec_codec.to_pydantic(struct) == model
+      ),
+      "decoding pydantic's JSON": (
+          msgspec_codec.to_pydantic(
+              msgspec_codec.decode(model.model_dump_json(), struct_type)
+          )
+          == model
+      ),
+      "decoding its own encoding": (
+          msgspec_codec.decode(encoded, struct_type) == struct
+      ),
+  }
+  failed = [name for name, passed in checks.items() if not passed]
+  if failed:
+    pytest.fail(
+        f"{type(model).__name__} parity failed ({', '.join(failed)}):\n"
+        f"{model!r}"
+    )
+
+
+
+@pytest.mark.parametrize(
+    "model",
+    list(msgspec_codec.STRUCTS_BY_MODEL),
+    ids=lambda model: model.__name__,
+)
+def test_parity_with_pydantic(model):
+  rng = random.Random(model.__name__)
+  for _ in range(_FUZZ_ITERATIONS):
+    _check_parity(_random_model(model, rng))
+
+
+def test_kw_only_struct_accepts_required_field_after_optional_ones():
+  total = msgspec_codec.PaymentItem(
+      label="Total",
+      amount=msgspec_codec.PaymentCurrencyAmount(currency="USD", value=1.0),
+  )
+
+  details = msgspec_codec.PaymentDetailsInit(
+      id="order_1", display_items=[], total=total
+  )
+
+  assert json.loads(msgspec_codec.encode(details)) == {
+      "id": "order_1",
+      "display_items": [],
+      "total": {"label": "Total", "amount": {"currency": "USD", "value": 1.0}},
+  }
@@ -0,0 +1,88 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the compact wire form of the AP2 types."""
+
+import json
+
+from pydantic import BaseModel
+import pytest
+
+from ap2.types import wire
+from ap2.types.payment_request import PaymentCurrencyAmount
+from ap2.types.payment_request import PaymentShippingOption
+from benchmarks import payloads
+
+
+def _cart_with_overrides() -> BaseModel:
+  cart = payloads.cart_mandate(item_count=3)
+  options = cart.contents.payment_request.options
+  options.request_shipping = None
+  options.request_payer_email = True
+  cart.contents.payment_request.method_data[0].data = {}
+  cart.contents.payment_request.details.shipping_options = [
+      PaymentShippingOption(
+          id="standard",
+          label="Standard",
+          amount=PaymentCurrencyAmount(currency="USD", value=0.0),
+          selected=None,
+      )
+  ]
+  cart.contents.payment_request.details.display_items[0].pending = False
+  cart.contents.payment_request.details.display_items[1].refund_period = 0
+  return cart
+
+
+def _intent_with_overrides() -> BaseModel:
+  intent = payloads.intent_mandate()
+  intent.merchants = ["Generic Merchant"]
+  intent.requires_refundability = None
+  return intent
+
+
+def _unsigned_payment_mandate() -> BaseModel:
+  mandate = payloads.payment_mandate()
+  mandate.user_authorization = None
+  return mandate
+
+
+@pytest.mark.parametrize(
+    "make_model",
+    [
+        payloads.cart_mandate,
+        _cart_with_overrides,
+        payloads.intent_mandate,
+        _intent_with_overrides,
+        payloads.payment_mandate,
+        _unsigned_payment_mandate,
+        payloads.shipping_address,
+    ],
+)
+def test_round_trip_is_lossless(make_model):
+  model = make_model()
+
+  encoded = json.loads(json.dumps(wire.to_wire(model)))
+
+  assert wire.from_wire(type(model), encoded) == model
+
+
+def test_to_wire_omits_default_fields():
+  cart = payloads.cart_mandate()
+
+  encoded = wire.to_wire(cart)
+
+  options = encoded["contents"]["payment_request"]["options"]
+  assert options == {}
+  assert len(json.dumps(encoded)) < len(json.dumps(cart.model_dump()))
@@ -0,0 +1,44 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for startup_time."""
+
+from benchmarks import startup_time
+
+# The output of `python -X importtime -c "import pkg.main"`, abridged.
+_STDERR = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 | encodings
+import time:        10 |         10 | pkg
+import time:         5 |          5 |     json.decoder
+import time:        20 |         25 |   json
+import time:         1 |          1 |   logging
+import time:        50 |         50 |     pydantic.main
+import time:        30 |         80 |   pkg.server
+import time:         4 |        110 | pkg.main
+"""
+
+
+def test_reports_the_total_and_the_direct_imports_of_the_module():
+  total_us, imports = startup_time._parse_import_times(_STDERR, "pkg.main")
+
+  assert total_us == 220
+  assert imports == [("json", 25), ("logging", 1), ("pkg.server", 80)]
+
+
+def test_reports_no_direct_imports_of_a_module_not_imported():
+  _, imports = startup_time._parse_import_times(_STDERR, "other")
+
+  assert not imports
@@ -0,0 +1,70 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for a2a_client_registry."""
+
+import asyncio
+
+import pytest
+
+from common import a2a_client_registry
+
+
+@pytest.fixture(autouse=True)
+def _empty_registry(monkeypatch):
+  monkeypatch.setattr(a2a_client_registry, "MAX_CLIENTS", 2)
+  monkeypatch.setattr(a2a_client_registry, "_CLOSE_POLL_SECONDS", 0.01)
+  yield
+  asyncio.run(a2a_client_registry.close_all())
+
+
+def test_get_client_reuses_clients():
+  first = a2a_client_registry.get_client("agent", "http://agent")
+
+  assert a2a_client_registry.get_client("agent", "http://agent") is first
+
+
+def test_get_client_evicts_and_closes_least_recently_used_client():
+  async def run():
+    a = a2a_client_registry.get_client("a", "http://a")
+    b = a2a_client_registry.get_client("b", "http://b")
+    a2a_client_registry.get_client("a", "http://a")  # b is now the LRU.
+    a2a_client_registry.get_client("c", "http://c")
+    await asyncio.gather(*a2a_client_registry._closing)
+    return a, b
+
+  a, b = asyncio.run(run())
+
+  assert set(a2a_client_registry.pool_utilization()) == {
+      "http://a []",
+      "http://c []",
+  }
+  assert b._httpx_client.is_closed
+  assert not a._httpx_client.is_closed
+
+
+def test_evicted_client_is_closed_only_once_idle():
+  async def run():
+    busy = a2a_client_registry.get_client("a", "http://a")
+    busy._in_flight = 1
+    a2a_client_registry.get_client("b", "http://b")
+    a2a_client_registry.get_client("c", "http://c")
+    await asyncio.sleep(0.05)
+    closed_while_busy = busy._httpx_client.is_closed
+    busy._in_flight = 0
+    await asyncio.gather(*a2a_client_registry._closing)
+    return closed_while_busy, busy._httpx_client.is_closed
+
+  assert asyncio.run(run()) == (False, True)
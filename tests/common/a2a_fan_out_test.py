@@ -0,0 +1,71 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for a2a_fan_out."""
+
+import asyncio
+
+from common import a2a_fan_out
+
+
+class _FakeClient:
+  """Answers a message after a delay, or fails with an error."""
+
+  def __init__(
+      self, delay_seconds: float = 0.0, error: Exception | None = None
+  ):
+    self.delay_seconds = delay_seconds
+    self.error = error
+    self.completed = False
+
+  async def send_a2a_message(self, message, idempotent=False):
+    del idempotent  # Unused.
+    await asyncio.sleep(self.delay_seconds)
+    if self.error is not None:
+      raise self.error
+    self.completed = True
+    return message
+
+
+def test_gather_a2a_reports_each_outcome_in_call_order():
+  slow = _FakeClient(delay_seconds=1.0)
+  failing = _FakeClient(error=RuntimeError("down"))
+  fast = _FakeClient(delay_seconds=0.01)
+  calls = [
+      a2a_fan_out.A2aCall(slow, "slow", timeout_seconds=0.05),
+      a2a_fan_out.A2aCall(failing, "failing"),
+      a2a_fan_out.A2aCall(fast, "fast", timeout_seconds=1.0),
+  ]
+
+  results = asyncio.run(a2a_fan_out.gather_a2a(calls))
+
+  assert [result.call for result in results] == calls
+  assert isinstance(results[0].error, asyncio.TimeoutError)
+  assert not slow.completed
+  assert str(results[1].error) == "down"
+  assert results[2].ok and results[2].task == "fast"
+
+
+def test_gather_a2a_sends_concurrently():
+  clients = [_FakeClient(delay_seconds=0.1) for _ in range(4)]
+
+  async def run():
+    start = asyncio.get_running_loop().time()
+    await a2a_fan_out.gather_a2a(
+        [a2a_fan_out.A2aCall(client, str(i)) for i, client in enumerate(clients)]
+    )
+    return asyncio.get_running_loop().time() - start
+
+  assert asyncio.run(run()) < 0.3
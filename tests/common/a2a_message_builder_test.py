@@ -0,0 +1,92 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for A2aMessageBuilder."""
+
+import json
+
+import pytest
+
+from ap2.types import wire
+from ap2.types.mandate import CART_MANDATE_DATA_KEY
+from ap2.types.mandate import PAYMENT_MANDATE_DATA_KEY
+from ap2.types.mandate import PaymentMandate
+from benchmarks import payloads
+from common import binary_data_parts
+from common.a2a_message_builder import A2aMessageBuilder
+
+
+def _data(message, index=0):
+  return message.parts[index].root.data
+
+
+def test_keyed_model_is_added_in_its_wire_form():
+  mandate = payloads.payment_mandate()
+
+  message = (
+      A2aMessageBuilder().add_data(PAYMENT_MANDATE_DATA_KEY, mandate).build()
+  )
+
+  data = _data(message)
+  assert data == {PAYMENT_MANDATE_DATA_KEY: wire.to_wire(mandate)}
+  # Only plain JSON values reach the part, and they read back losslessly.
+  assert json.loads(json.dumps(data)) == data
+  assert wire.from_wire(PaymentMandate, data[PAYMENT_MANDATE_DATA_KEY]) == (
+      mandate
+  )
+
+
+def test_keyed_list_of_models_is_added_in_its_wire_form():
+  carts = [payloads.cart_mandate(1), payloads.cart_mandate(2)]
+
+  message = A2aMessageBuilder().add_data(CART_MANDATE_DATA_KEY, carts).build()
+
+  assert _data(message) == {
+      CART_MANDATE_DATA_KEY: [wire.to_wire(cart) for cart in carts]
+  }
+
+
+def test_unkeyed_dict_and_plain_values_are_added_as_is():
+  message = (
+      A2aMessageBuilder()
+      .add_data("", {"risk_data": "fake_risk_data"})
+      .add_data("debug_mode", True)
+      .add_data("skipped", None)
+      .build()
+  )
+
+  assert [part.root.data for part in message.parts] == [
+      {"risk_data": "fake_risk_data"},
+      {"debug_mode": True},
+  ]
+
+
+def test_binary_encoding_encodes_the_wire_form():
+  encodings = binary_data_parts.available_encodings()
+  if not encodings:
+    pytest.skip("No binary encoding is installed.")
+  mandate = payloads.payment_mandate()
+
+  message = (
+      A2aMessageBuilder(binary_encoding=encodings[0])
+      .add_data(PAYMENT_MANDATE_DATA_KEY, mandate)
+      .build()
+  )
+
+  data = _data(message)
+  assert binary_data_parts.is_encoded(data)
+  assert binary_data_parts.decode_data(data) == {
+      PAYMENT_MANDATE_DATA_KEY: wire.to_wire(mandate)
+  }
@@ -0,0 +1,111 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for agent_card_cache."""
+
+import asyncio
+import json
+import os
+
+from a2a import types as a2a_types
+
+from common import agent_card_cache
+
+_ROLES_DIR = os.path.join(os.path.dirname(__file__), "../../src/roles")
+
+
+def _card(role: str) -> a2a_types.AgentCard:
+  with open(
+      os.path.join(_ROLES_DIR, role, "agent.json"), "r", encoding="utf-8"
+  ) as f:
+    return a2a_types.AgentCard.model_validate(json.load(f))
+
+
+class _FakeResolver:
+  """Resolves a card once the test releases it."""
+
+  released: asyncio.Event
+  calls = 0
+
+  def __init__(self, httpx_client, base_url):
+    del httpx_client, base_url  # Unused.
+
+  async def get_agent_card(self):
+    _FakeResolver.calls += 1
+    await _FakeResolver.released.wait()
+    return "card"
+
+
+def test_cancelling_one_caller_does_not_cancel_the_shared_fetch(monkeypatch):
+  monkeypatch.setattr(agent_card_cache, "A2ACardResolver", _FakeResolver)
+  _FakeResolver.calls = 0
+
+  async def run():
+    _FakeResolver.released = asyncio.Event()
+    cache = agent_card_cache.AgentCardCache()
+    first = asyncio.ensure_future(cache.get("http://agent", None))
+    second = asyncio.ensure_future(cache.get("http://agent", None))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    _FakeResolver.released.set()
+    return first, await second
+
+  first, card = asyncio.run(run())
+
+  assert first.cancelled()
+  assert card == "card"
+  assert _FakeResolver.calls == 1
+
+
+def test_snapshot_skips_invalid_cards_one_by_one(tmp_path):
+  path = tmp_path / "cards.json"
+  card = _card("merchant_agent")
+  path.write_text(
+      json.dumps({
+          "http://valid": card.model_dump(mode="json", by_alias=True),
+          "http://invalid": {"name": "missing every other field"},
+      }),
+      encoding="utf-8",
+  )
+
+  cache = agent_card_cache.AgentCardCache(snapshot_path=str(path))
+
+  assert cache._entries["http://valid"].card == card
+  assert "http://invalid" not in cache._entries
+
+
+def test_snapshot_ignores_a_snapshot_that_is_not_a_map(tmp_path):
+  path = tmp_path / "cards.json"
+  path.write_text("[]", encoding="utf-8")
+
+  cache = agent_card_cache.AgentCardCache(snapshot_path=str(path))
+
+  assert not cache._entries
+
+
+def test_agents_sharing_a_snapshot_merge_their_cards(tmp_path):
+  path = str(tmp_path / "cards.json")
+  merchant = agent_card_cache.AgentCardCache(snapshot_path=path)
+  shopper = agent_card_cache.AgentCardCache(snapshot_path=path)
+
+  merchant.put("http://processor", _card("merchant_payment_processor_agent"))
+  shopper.put("http://merchant", _card("merchant_agent"))
+  shopper.put("http://credentials", _card("credentials_provider_agent"))
+  shopper.invalidate("http://credentials")
+
+  restarted = agent_card_cache.AgentCardCache(snapshot_path=path)
+  assert sorted(restarted._entries) == ["http://merchant", "http://processor"]
+  assert os.listdir(tmp_path) == ["cards.json"]
@@ -0,0 +1,73 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for artifact_utils."""
+
+from a2a import types as a2a_types
+
+from ap2.types import wire
+from ap2.types.mandate import CART_MANDATE_DATA_KEY
+from ap2.types.mandate import CartMandate
+from benchmarks import payloads
+from common import artifact_utils
+from common import binary_data_parts
+
+
+def _artifact(*parts: a2a_types.Part) -> a2a_types.Artifact:
+  return a2a_types.Artifact(artifact_id="artifact", parts=list(parts))
+
+
+def _data_part(data: dict) -> a2a_types.Part:
+  return a2a_types.Part(root=a2a_types.DataPart(data=data))
+
+
+def test_get_first_data_part_decodes_only_the_first(monkeypatch):
+  decoded = []
+  decode_data = binary_data_parts.decode_data
+
+  def _recording_decode_data(data):
+    decoded.append(data)
+    return decode_data(data)
+
+  monkeypatch.setattr(binary_data_parts, "decode_data", _recording_decode_data)
+  artifacts = [
+      _artifact(a2a_types.Part(root=a2a_types.TextPart(text="Hello"))),
+      _artifact(_data_part({"first": 1}), _data_part({"second": 2})),
+      _artifact(_data_part({"third": 3})),
+  ]
+
+  assert artifact_utils.get_first_data_part(artifacts) == {"first": 1}
+  assert decoded == [{"first": 1}]
+
+
+def test_get_first_data_part_without_data_parts_is_empty():
+  assert artifact_utils.get_first_data_part([]) == {}
+
+
+def test_index_validates_canonical_objects_once():
+  cart = wire.to_wire(payloads.cart_mandate(2))
+  index = artifact_utils.ArtifactIndex([
+      _artifact(_data_part({CART_MANDATE_DATA_KEY: cart})),
+      _artifact(_data_part({"risk_data": "fake_risk_data"})),
+  ])
+
+  carts = index.canonical_objects(CART_MANDATE_DATA_KEY, CartMandate)
+
+  assert [c.model_dump() for c in carts] == [
+      CartMandate.model_validate(cart).model_dump()
+  ]
+  assert index.canonical_objects(CART_MANDATE_DATA_KEY, CartMandate) is carts
+  assert index.values("risk_data") == ["fake_risk_data"]
+  assert index.values("missing") == []
@@ -0,0 +1,75 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for binary_data_parts."""
+
+from a2a import types as a2a_types
+import pytest
+
+from ap2.types import wire
+from ap2.types.mandate import CART_MANDATE_DATA_KEY
+from ap2.types.mandate import INTENT_MANDATE_DATA_KEY
+from ap2.types.mandate import PAYMENT_MANDATE_DATA_KEY
+from benchmarks import payloads
+from common import binary_data_parts
+
+
+def _cases():
+  return [
+      {CART_MANDATE_DATA_KEY: wire.to_wire(payloads.cart_mandate(3))},
+      {INTENT_MANDATE_DATA_KEY: wire.to_wire(payloads.intent_mandate())},
+      {PAYMENT_MANDATE_DATA_KEY: wire.to_wire(payloads.payment_mandate())},
+  ]
+
+
+@pytest.mark.parametrize("encoding", binary_data_parts.DEFAULT_ENCODINGS)
+def test_round_trip_through_a_data_part_is_lossless(encoding):
+  if encoding not in binary_data_parts.available_encodings():
+    pytest.skip(f"{encoding} is not installed.")
+  for data in _cases():
+    encoded = binary_data_parts.encode_data(data, encoding)
+    body = a2a_types.DataPart(data=encoded).model_dump_json()
+
+    decoded = binary_data_parts.decode_data(
+        a2a_types.DataPart.model_validate_json(body).data
+    )
+
+    assert binary_data_parts.is_encoded(encoded)
+    assert decoded == data
+
+
+def test_decode_data_returns_plain_data_unchanged():
+  data = {"risk_data": "fake_risk_data"}
+
+  assert binary_data_parts.decode_data(data) is data
+
+
+def test_decode_data_rejects_an_unknown_encoding():
+  data = {binary_data_parts.BINARY_DATA_KEY: {"encoding": "xml", "data": ""}}
+
+  with pytest.raises(ValueError, match="xml"):
+    binary_data_parts.decode_data(data)
+
+
+def test_decode_data_rejects_a_malformed_blob():
+  encoding = binary_data_parts.DEFAULT_ENCODINGS[0]
+  if encoding not in binary_data_parts.available_encodings():
+    pytest.skip(f"{encoding} is not installed.")
+  data = {
+      binary_data_parts.BINARY_DATA_KEY: {"encoding": encoding, "data": "!!"}
+  }
+
+  with pytest.raises(ValueError, match="Malformed"):
+    binary_data_parts.decode_data(data)
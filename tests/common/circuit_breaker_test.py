@@ -0,0 +1,190 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for circuit_breaker and its use by PaymentRemoteA2aClient."""
+
+import asyncio
+import collections
+
+from a2a import types as a2a_types
+from a2a.client.errors import A2AClientHTTPError
+from a2a.client.errors import A2AClientJSONRPCError
+import pytest
+
+from common import circuit_breaker
+from common import payment_remote_a2a_client
+from common import retry_policy
+
+
+def _open_breaker(breaker: circuit_breaker.CircuitBreaker) -> None:
+  for _ in range(circuit_breaker.DEFAULT_FAILURE_THRESHOLD):
+    breaker.before_call()
+    breaker.record_failure()
+
+
+def test_half_open_breaker_lets_one_probe_through():
+  breaker = circuit_breaker.CircuitBreaker("agent", reset_timeout_seconds=0)
+  _open_breaker(breaker)
+
+  breaker.before_call()
+
+  assert breaker.state == circuit_breaker.HALF_OPEN
+  with pytest.raises(circuit_breaker.CircuitOpenError):
+    breaker.before_call()
+
+
+def test_released_probe_lets_the_next_probe_through():
+  breaker = circuit_breaker.CircuitBreaker("agent", reset_timeout_seconds=0)
+  _open_breaker(breaker)
+  breaker.before_call()
+
+  breaker.release_probe()
+  breaker.before_call()
+
+  assert breaker.state == circuit_breaker.HALF_OPEN
+
+
+class _HangingA2aClient:
+  """An A2A client whose messages never get an answer."""
+
+  async def send_message(self, message, context=None):
+    del message, context  # Unused.
+    await asyncio.Event().wait()
+    yield  # Makes this an async generator.
+
+
+def test_cancelled_probe_does_not_wedge_the_breaker():
+  base_url = "http://cancelled-probe"
+  breaker = circuit_breaker.get_breaker(base_url)
+  breaker._reset_timeout_seconds = 0
+  _open_breaker(breaker)
+
+  async def run():
+    client = payment_remote_a2a_client.PaymentRemoteA2aClient(
+        "agent",
+        base_url,
+        retry_policy=retry_policy.RetryPolicy(max_attempts=1),
+    )
+
+    async def get_a2a_client():
+      return _HangingA2aClient()
+
+    client._get_a2a_client = get_a2a_client
+    message = a2a_types.Message(
+        message_id="1", parts=[], role=a2a_types.Role.agent
+    )
+    with pytest.raises(asyncio.TimeoutError):
+      await asyncio.wait_for(client.send_a2a_message(message), timeout=0.01)
+    await client.aclose()
+
+  asyncio.run(run())
+
+  breaker.before_call()  # Would raise CircuitOpenError if still probing.
+  assert breaker.state == circuit_breaker.HALF_OPEN
+
+
+class _FailingA2aClient:
+  """An A2A client whose messages fail with the given error."""
+
+  def __init__(self, error: Exception):
+    self._error = error
+
+  async def send_message(self, message, context=None):
+    del message, context  # Unused.
+    raise self._error
+    yield  # Makes this an async generator.
+
+
+def _jsonrpc_error(error: a2a_types.JSONRPCError) -> A2AClientJSONRPCError:
+  return A2AClientJSONRPCError(
+      a2a_types.JSONRPCErrorResponse(id="1", error=error)
+  )
+
+
+def _send_failing_message(base_url: str, error: Exception) -> None:
+  async def run():
+    client = payment_remote_a2a_client.PaymentRemoteA2aClient(
+        "agent",
+        base_url,
+        retry_policy=retry_policy.RetryPolicy(max_attempts=1),
+    )
+
+    async def get_a2a_client():
+      return _FailingA2aClient(error)
+
+    client._get_a2a_client = get_a2a_client
+    message = a2a_types.Message(
+        message_id="1", parts=[], role=a2a_types.Role.agent
+    )
+    with pytest.raises(type(error)):
+      await client.send_a2a_message(message)
+    await client.aclose()
+
+  asyncio.run(run())
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        A2AClientHTTPError(500, "Internal Server Error"),
+        _jsonrpc_error(a2a_types.InternalError()),
+        _jsonrpc_error(a2a_types.InvalidAgentResponseError()),
+    ],
+)
+def test_server_failures_count_against_the_breaker(error):
+  base_url = f"http://server-failure-{id(error)}"
+  breaker = circuit_breaker.get_breaker(base_url)
+
+  for _ in range(circuit_breaker.DEFAULT_FAILURE_THRESHOLD):
+    _send_failing_message(base_url, error)
+
+  assert breaker.state == circuit_breaker.OPEN
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        A2AClientHTTPError(400, "Bad Request"),
+        _jsonrpc_error(a2a_types.InvalidParamsError()),
+        _jsonrpc_error(a2a_types.TaskNotFoundError()),
+    ],
+)
+def test_caller_errors_are_neutral(error):
+  base_url = f"http://caller-error-{id(error)}"
+  breaker = circuit_breaker.get_breaker(base_url)
+  breaker._reset_timeout_seconds = 0
+  breaker.record_failure()
+  failures = breaker.metrics()["consecutive_failures"]
+
+  _send_failing_message(base_url, error)
+
+  assert breaker.metrics()["consecutive_failures"] == failures
+  # A half-open probe ending in a caller error is released, not kept.
+  _open_breaker(breaker)
+  _send_failing_message(base_url, error)
+  breaker.before_call()
+  assert breaker.state == circuit_breaker.HALF_OPEN
+
+
+def test_least_recently_used_breaker_is_evicted(monkeypatch):
+  monkeypatch.setattr(circuit_breaker, "MAX_BREAKERS", 2)
+  monkeypatch.setattr(circuit_breaker, "_breakers", collections.OrderedDict())
+  first = circuit_breaker.get_breaker("http://first")
+  circuit_breaker.get_breaker("http://second")
+
+  assert circuit_breaker.get_breaker("http://first") is first
+  circuit_breaker.get_breaker("http://third")
+
+  assert list(circuit_breaker.metrics()) == ["http://first", "http://third"]
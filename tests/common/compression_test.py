@@ -0,0 +1,180 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for compression and its use by PaymentRemoteA2aClient."""
+
+import asyncio
+import gzip
+import json
+import os
+
+from a2a import types as a2a_types
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from common import compression
+from common import payment_remote_a2a_client
+
+_ROLES_DIR = os.path.join(os.path.dirname(__file__), "../../src/roles")
+
+
+class _RecordingTransport(httpx.AsyncBaseTransport):
+  """Records the requests it passes on to the wrapped transport."""
+
+  def __init__(self, transport: httpx.AsyncBaseTransport):
+    self.requests = []
+    self._transport = transport
+
+  async def handle_async_request(self, request):
+    self.requests.append(request)
+    return await self._transport.handle_async_request(request)
+
+
+def _app() -> Starlette:
+  async def echo(request):
+    return JSONResponse({
+        "content_encoding": request.headers.get("content-encoding"),
+        "content_length": request.headers.get("content-length"),
+        "body": (await request.body()).decode(),
+    })
+
+  return Starlette(
+      routes=[Route("/echo", echo, methods=["POST"])],
+      middleware=[Middleware(compression.RequestDecompressionMiddleware)],
+  )
+
+
+def _post(body: bytes, enabled: bool = True, headers=None):
+  """Posts the body through a CompressingTransport to the echo app."""
+
+  async def run():
+    recorder = _RecordingTransport(httpx.ASGITransport(app=_app()))
+    transport = compression.CompressingTransport(recorder)
+    transport.enabled = enabled
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://agent"
+    ) as client:
+      response = await client.post("/echo", content=body, headers=headers)
+    return recorder.requests[0], response
+
+  return asyncio.run(run())
+
+
+def test_large_body_round_trips_compressed():
+  body = json.dumps({"items": ["item"] * 1000}).encode()
+
+  sent, response = _post(body)
+
+  assert sent.headers["content-encoding"] == "gzip"
+  assert len(sent.content) < len(body)
+  assert response.status_code == 200
+  assert response.json() == {
+      "content_encoding": None,
+      "content_length": str(len(body)),
+      "body": body.decode(),
+  }
+
+
+def test_body_below_the_threshold_is_sent_as_is():
+  body = b"x" * (compression.DEFAULT_MIN_SIZE - 1)
+
+  sent, response = _post(body)
+
+  assert "content-encoding" not in sent.headers
+  assert sent.content == body
+  assert response.json()["body"] == body.decode()
+
+
+def test_body_is_sent_as_is_until_compression_is_enabled():
+  body = b"x" * compression.DEFAULT_MIN_SIZE
+
+  sent, _ = _post(body, enabled=False)
+
+  assert "content-encoding" not in sent.headers
+
+
+def test_decompression_bomb_is_rejected(monkeypatch):
+  monkeypatch.setattr(compression, "MAX_DECOMPRESSED_SIZE", 64 * 1024)
+  # About 64 bytes on the wire, well over the limit once decompressed.
+  bomb = gzip.compress(b"\0" * (compression.MAX_DECOMPRESSED_SIZE + 1))
+
+  _, response = _post(bomb, headers={"Content-Encoding": "gzip"})
+
+  assert response.status_code == 413
+
+
+def test_oversized_body_is_rejected_before_decompression(monkeypatch):
+  monkeypatch.setattr(compression, "MAX_DECOMPRESSED_SIZE", 1024)
+  # Not even gzip: its size alone gets it rejected.
+  body = b"\0" * (2 * compression.MAX_DECOMPRESSED_SIZE)
+
+  _, response = _post(body, headers={"Content-Encoding": "gzip"})
+
+  assert response.status_code == 413
+
+
+@pytest.mark.parametrize(
+    "body",
+    [b"not gzip at all", gzip.compress(b'{"truncated": true}')[:-8]],
+)
+def test_malformed_gzip_is_rejected(body):
+  _, response = _post(body, headers={"Content-Encoding": "gzip"})
+
+  assert response.status_code == 400
+
+
+def test_unsupported_encoding_is_rejected():
+  _, response = _post(b"body", headers={"Content-Encoding": "br"})
+
+  assert response.status_code == 415
+
+
+def _card(role: str, compressing: bool) -> a2a_types.AgentCard:
+  with open(
+      os.path.join(_ROLES_DIR, role, "agent.json"), "r", encoding="utf-8"
+  ) as f:
+    card = a2a_types.AgentCard.model_validate(json.load(f))
+  if not compressing:
+    card.capabilities.extensions = [
+        extension
+        for extension in card.capabilities.extensions
+        if extension.uri != compression.COMPRESSION_EXTENSION_URI
+    ]
+  return card
+
+
+@pytest.mark.parametrize("compressing", [True, False])
+def test_client_compresses_only_if_the_agent_card_advertises_it(compressing):
+  card = _card("merchant_agent", compressing)
+
+  async def run():
+    client = payment_remote_a2a_client.PaymentRemoteA2aClient(
+        "agent", "http://compression-negotiation"
+    )
+
+    async def get_agent_card():
+      return card
+
+    client.get_agent_card = get_agent_card
+    await client._get_a2a_client()
+    await client.aclose()
+    return client._compressing_transport.enabled
+
+  assert compression.supports_compression(card) is compressing
+  assert asyncio.run(run()) is compressing
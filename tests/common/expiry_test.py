@@ -0,0 +1,45 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for expiry."""
+
+import pytest
+
+from common import expiry
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2025-09-01T12:00:00+00:00",
+        "2025-09-01T12:00:00Z",
+        "2025-09-01T12:00:00",
+        "2025-09-01T14:00:00+02:00",
+    ],
+)
+def test_parse_expiry_reads_utc_and_offset_timestamps(value):
+  assert expiry.parse_expiry(value) == 1756728000.0
+
+
+@pytest.mark.parametrize("value", ["tomorrow", "", None, 1756728000])
+def test_parse_expiry_rejects_anything_else(value):
+  with pytest.raises(ValueError):
+    expiry.parse_expiry(value)
+
+
+def test_an_expiry_has_passed_from_its_own_instant_on():
+  assert not expiry.is_expired(100.0, now=99.9)
+  assert expiry.is_expired(100.0, now=100.0)
+  assert expiry.is_expired(100.0, now=100.1)
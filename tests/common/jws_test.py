@@ -0,0 +1,117 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for jws."""
+
+import json
+import os
+
+import pytest
+
+from common import jws
+
+
+@pytest.fixture(autouse=True)
+def _keys_dir(tmp_path, monkeypatch):
+  monkeypatch.setenv(jws.KEYS_DIR_ENV_VAR, str(tmp_path))
+  monkeypatch.setattr(jws, "_signing_keys", {})
+  monkeypatch.setattr(jws, "_public_keys", {})
+  monkeypatch.setattr(jws, "_key_change_listeners", [])
+
+
+def _token_without_kid() -> str:
+  header = jws._b64encode(json.dumps({"alg": jws.ALGORITHM}).encode())
+  claims = jws._b64encode(json.dumps({"sub": "cart_1"}).encode())
+  return f"{header}.{claims}.{jws._b64encode(b'signature')}"
+
+
+def test_verify_returns_the_claims():
+  token = jws.sign({"sub": "cart_1"}, jws.signing_key("merchant_agent"))
+
+  assert jws.verify(token, "merchant_agent") == {"sub": "cart_1"}
+
+
+def test_verify_rejects_an_expired_token():
+  token = jws.sign({"exp": 100}, jws.signing_key("merchant_agent"))
+
+  with pytest.raises(jws.InvalidTokenError, match="expired"):
+    jws.verify(token, "merchant_agent", now=100)
+
+
+def test_verify_rejects_a_token_without_a_kid():
+  with pytest.raises(jws.InvalidTokenError, match="key ID"):
+    jws.verify(_token_without_kid(), "merchant_agent")
+
+
+def test_verify_rejects_a_tampered_token():
+  token = jws.sign({"sub": "cart_1"}, jws.signing_key("merchant_agent"))
+  other = jws.sign({"sub": "cart_2"}, jws.signing_key("merchant_agent"))
+  header, _, signature = token.split(".")
+  _, claims, _ = other.split(".")
+
+  with pytest.raises(jws.InvalidTokenError, match="signature"):
+    jws.verify(f"{header}.{claims}.{signature}", "merchant_agent")
+
+
+def test_verify_rejects_a_token_from_another_signer():
+  token = jws.sign({"sub": "cart_1"}, jws.signing_key("merchant_agent"))
+  jws.signing_key("user_device")
+
+  with pytest.raises(jws.InvalidTokenError, match="user_device"):
+    jws.verify(token, "user_device")
+
+
+def test_verify_rejects_a_revoked_key():
+  key = jws.signing_key("merchant_agent")
+  token = jws.sign({"sub": "cart_1"}, key)
+  jws.verify(token, "merchant_agent")
+
+  jws.revoke_key(key.kid)
+
+  with pytest.raises(jws.InvalidTokenError, match="revoked"):
+    jws.verify(token, "merchant_agent")
+
+
+def test_verify_rejects_a_key_revoked_by_another_process():
+  key = jws.signing_key("merchant_agent")
+  token = jws.sign({"sub": "cart_1"}, key)
+  jws.verify(token, "merchant_agent")
+
+  # Another agent revokes the key by removing its published public key.
+  os.remove(jws._public_key_path("merchant_agent", key.kid))
+
+  with pytest.raises(jws.InvalidTokenError, match="revoked"):
+    jws.verify(token, "merchant_agent")
+
+
+def test_rotated_key_still_verifies_until_revoked():
+  old_key = jws.signing_key("merchant_agent")
+  token = jws.sign({"sub": "cart_1"}, old_key)
+
+  new_key = jws.rotate_signing_key("merchant_agent")
+
+  assert new_key.kid != old_key.kid
+  assert jws.verify(token, "merchant_agent") == {"sub": "cart_1"}
+
+
+def test_verify_batch_reports_each_failure_in_place():
+  token = jws.sign({"sub": "cart_1"}, jws.signing_key("merchant_agent"))
+
+  results = jws.verify_batch(
+      [token, "not a token", token], "merchant_agent"
+  )
+
+  assert results[0] == results[2] == {"sub": "cart_1"}
+  assert isinstance(results[1], jws.InvalidTokenError)
@@ -0,0 +1,105 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for mandate_signing."""
+
+import pytest
+
+from ap2.types import canonical
+from benchmarks import payloads
+from common import jws
+from common import mandate_signing
+from common import validation
+from common import verified_mandate_cache
+
+
+@pytest.fixture(autouse=True)
+def _keys_dir(tmp_path, monkeypatch):
+  monkeypatch.setenv(jws.KEYS_DIR_ENV_VAR, str(tmp_path))
+  monkeypatch.setattr(jws, "_signing_keys", {})
+  monkeypatch.setattr(jws, "_public_keys", {})
+  monkeypatch.setattr(jws, "_key_change_listeners", [])
+  monkeypatch.setattr(verified_mandate_cache, "_default_cache", None)
+
+
+def _signed_cart(owner: str = mandate_signing.MERCHANT_SIGNER):
+  cart = payloads.cart_mandate(item_count=2)
+  cart.merchant_authorization = mandate_signing.sign_cart_mandate(
+      cart, jws.signing_key(owner)
+  )
+  return cart
+
+
+def _signed_payment_mandate(owner: str = mandate_signing.USER_DEVICE_SIGNER):
+  payment_mandate = payloads.payment_mandate()
+  payment_mandate.user_authorization = mandate_signing.sign_user_authorization(
+      [canonical.digest(payment_mandate.payment_mandate_contents)],
+      jws.signing_key(owner),
+  )
+  return payment_mandate
+
+
+def test_verify_cart_mandate_accepts_the_merchant_signature():
+  cart = _signed_cart()
+
+  claims = mandate_signing.verify_cart_mandate(cart)
+
+  assert claims["cart_hash"] == canonical.digest(cart.contents)
+
+
+def test_verify_cart_mandate_rejects_a_tampered_cart():
+  cart = _signed_cart()
+
+  cart.contents.payment_request.details.total.amount.value = 0.01
+
+  with pytest.raises(jws.InvalidTokenError, match="do not match"):
+    mandate_signing.verify_cart_mandate(cart)
+
+
+def test_verify_cart_mandate_rejects_another_signer():
+  cart = _signed_cart(owner=mandate_signing.USER_DEVICE_SIGNER)
+
+  with pytest.raises(jws.InvalidTokenError, match="merchant_agent"):
+    mandate_signing.verify_cart_mandate(cart)
+
+
+def test_verify_cart_mandate_rejects_a_missing_authorization():
+  cart = payloads.cart_mandate()
+  cart.merchant_authorization = None
+
+  with pytest.raises(jws.InvalidTokenError, match="not found"):
+    mandate_signing.verify_cart_mandate(cart)
+
+
+def test_payment_mandate_signed_by_the_user_device_validates():
+  validation.validate_payment_mandate_signature(_signed_payment_mandate())
+
+
+def test_payment_mandate_signed_by_the_merchant_is_rejected():
+  payment_mandate = _signed_payment_mandate(
+      owner=mandate_signing.MERCHANT_SIGNER
+  )
+
+  with pytest.raises(ValueError, match="user_device"):
+    validation.validate_payment_mandate_signature(payment_mandate)
+
+
+def test_verify_payment_mandate_rejects_changed_contents():
+  payment_mandate = _signed_payment_mandate()
+
+  payment_mandate.payment_mandate_contents.merchant_agent = "Other Merchant"
+
+  with pytest.raises(jws.InvalidTokenError, match="do not match"):
+    mandate_signing.verify_payment_mandate(payment_mandate)
@@ -0,0 +1,82 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for message_utils."""
+
+from pydantic import ValidationError
+import pytest
+
+from ap2.types import wire
+from ap2.types.mandate import PAYMENT_MANDATE_DATA_KEY
+from ap2.types.mandate import PaymentMandate
+from benchmarks import payloads
+from common import message_utils
+
+
+def _data_parts():
+  return [
+      {PAYMENT_MANDATE_DATA_KEY: wire.to_wire(payloads.payment_mandate())},
+      {"risk_data": "fake_risk_data"},
+  ]
+
+
+def test_parse_canonical_object_validates_a_raw_value():
+  data_parts = _data_parts()
+
+  parsed = message_utils.parse_canonical_object(
+      PAYMENT_MANDATE_DATA_KEY, data_parts, PaymentMandate
+  )
+
+  assert isinstance(parsed, PaymentMandate)
+  assert wire.to_wire(parsed) == data_parts[0][PAYMENT_MANDATE_DATA_KEY]
+
+
+def test_parse_canonical_object_rejects_an_invalid_raw_value():
+  invalid = [{PAYMENT_MANDATE_DATA_KEY: {"payment_mandate_contents": {}}}]
+
+  with pytest.raises(ValidationError):
+    message_utils.parse_canonical_object(
+        PAYMENT_MANDATE_DATA_KEY, invalid, PaymentMandate
+    )
+
+
+def test_parse_canonical_object_reuses_a_replaced_model():
+  data_parts = _data_parts()
+  payment_mandate = PaymentMandate.model_validate(
+      message_utils.find_data_part(PAYMENT_MANDATE_DATA_KEY, data_parts)
+  )
+
+  replaced = message_utils.replace_data_part(
+      PAYMENT_MANDATE_DATA_KEY, data_parts, payment_mandate
+  )
+
+  assert (
+      message_utils.parse_canonical_object(
+          PAYMENT_MANDATE_DATA_KEY, replaced, PaymentMandate
+      )
+      is payment_mandate
+  )
+  assert isinstance(data_parts[0][PAYMENT_MANDATE_DATA_KEY], dict)
+
+
+def test_replace_data_part_without_the_key_returns_the_data_parts():
+  data_parts = [{"risk_data": "fake_risk_data"}]
+
+  assert (
+      message_utils.replace_data_part(
+          PAYMENT_MANDATE_DATA_KEY, data_parts, payloads.payment_mandate()
+      )
+      is data_parts
+  )
@@ -0,0 +1,145 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the request logging and metrics of server."""
+
+import json
+import logging
+
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.responses import StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+import pytest
+
+from common import circuit_breaker
+from common import server
+from common import watch_log
+
+_SECRET = "eyJhbGciOiJFZERTQSJ9.secret.signature"
+
+
+class _Records(logging.Handler):
+
+  def __init__(self):
+    super().__init__()
+    self.messages = []
+
+  def emit(self, record):
+    self.messages.append(record.getMessage())
+
+
+@pytest.fixture(name="records")
+def _records_fixture(monkeypatch):
+  monkeypatch.setattr(watch_log, "_policy", watch_log.SamplingPolicy())
+  logger = logging.getLogger("server_test")
+  logger.setLevel(logging.INFO)
+  records = _Records()
+  logger.addHandler(records)
+  yield records
+  logger.removeHandler(records)
+
+
+def _client() -> TestClient:
+  async def echo(request):
+    return JSONResponse(await request.json())
+
+  async def stream(request):
+    del request  # Unused.
+
+    async def events():
+      yield f"data: {json.dumps({'token': _SECRET})}\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+  app = Starlette(
+      routes=[
+          Route("/echo", echo, methods=["POST"]),
+          Route("/stream", stream, methods=["POST"]),
+      ]
+  )
+  app.add_middleware(
+      server._LoggingMiddleware, logger=logging.getLogger("server_test")
+  )
+  return TestClient(app)
+
+
+def test_request_and_response_bodies_are_redacted(records):
+  body = {"payment_mandate": {"user_authorization": _SECRET}}
+
+  response = _client().post("/echo", json=body)
+
+  assert response.json() == body
+  log = "\n".join(records.messages)
+  assert "[Request Body]" in log
+  assert "[Response Body]" in log
+  assert _SECRET not in log
+  assert '"user_authorization": "<redacted>"' in log
+
+
+def test_stream_events_are_redacted(records):
+  response = _client().post("/stream")
+
+  assert _SECRET in response.text
+  log = "\n".join(records.messages)
+  assert "[Response Stream]" in log
+  assert _SECRET not in log
+
+
+def test_bodies_follow_the_sampling_policy(records, monkeypatch):
+  monkeypatch.setattr(
+      watch_log,
+      "_policy",
+      watch_log.SamplingPolicy(
+          sample_rates={watch_log.RESPONSE_BODY_KEY: 1.0},
+          default_sample_rate=0.0,
+          max_value_chars=20,
+      ),
+  )
+
+  _client().post("/echo", json={"risk_data": "x" * 100})
+
+  log = "\n".join(records.messages)
+  assert "[Request Body]" not in log
+  assert "[Response Body]" in log
+  assert "<truncated" in log
+  assert "x" * 100 not in log
+
+
+def test_format_body_summarizes_non_json():
+  policy = watch_log.SamplingPolicy()
+
+  assert policy.format_body(b"user_authorization=abc") == (
+      "<22 chars of non-JSON data>"
+  )
+  assert policy.format_body(b"") == "<empty>"
+
+
+def test_metrics_serves_a_snapshot_of_the_circuit_breakers():
+  circuit_breaker.get_breaker("http://metrics-test").record_failure()
+  client = TestClient(
+      Starlette(routes=[Route(server.METRICS_PATH, server._metrics)])
+  )
+
+  metrics = client.get(server.METRICS_PATH).json()
+
+  assert metrics["circuit_breakers"]["http://metrics-test"] == {
+      "state": circuit_breaker.CLOSED,
+      "consecutive_failures": 1,
+      "opened_total": 0,
+      "rejected_total": 0,
+  }
+  assert "connection_pools" in metrics
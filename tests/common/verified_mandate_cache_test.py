@@ -0,0 +1,121 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for verified_mandate_cache."""
+
+import os
+
+import pytest
+
+from ap2.types import canonical
+from ap2.types.mandate import PaymentMandate
+from benchmarks import payloads
+from common import jws
+from common import mandate_signing
+from common import verified_mandate_cache
+
+
+@pytest.fixture(autouse=True)
+def _keys_dir(tmp_path, monkeypatch):
+  monkeypatch.setenv(jws.KEYS_DIR_ENV_VAR, str(tmp_path))
+  monkeypatch.setattr(jws, "_signing_keys", {})
+  monkeypatch.setattr(jws, "_public_keys", {})
+  monkeypatch.setattr(jws, "_key_change_listeners", [])
+
+
+def _signed_payment_mandate(key: jws.SigningKey) -> PaymentMandate:
+  payment_mandate = payloads.payment_mandate()
+  payment_mandate.user_authorization = mandate_signing.sign_user_authorization(
+      [canonical.digest(payment_mandate.payment_mandate_contents)], key
+  )
+  return payment_mandate
+
+
+def test_verify_caches_a_verified_mandate():
+  cache = verified_mandate_cache.VerifiedMandateCache()
+  payment_mandate = _signed_payment_mandate(jws.signing_key("user_device"))
+
+  cache.verify(payment_mandate)
+  cache.verify(payment_mandate)
+
+  assert (cache.misses, cache.hits) == (1, 1)
+
+
+def test_verify_rejects_changed_contents():
+  cache = verified_mandate_cache.VerifiedMandateCache()
+  payment_mandate = _signed_payment_mandate(jws.signing_key("user_device"))
+  cache.verify(payment_mandate)
+
+  payment_mandate.payment_mandate_contents.merchant_agent = "Other Merchant"
+
+  with pytest.raises(jws.InvalidTokenError):
+    cache.verify(payment_mandate)
+
+
+def test_verify_forgets_mandates_of_a_revoked_key():
+  cache = verified_mandate_cache.VerifiedMandateCache()
+  key = jws.signing_key("user_device")
+  payment_mandate = _signed_payment_mandate(key)
+  cache.verify(payment_mandate)
+
+  jws.revoke_key(key.kid)
+
+  with pytest.raises(jws.InvalidTokenError, match="revoked"):
+    cache.verify(payment_mandate)
+
+
+def test_verify_notices_a_key_revoked_by_another_process():
+  cache = verified_mandate_cache.VerifiedMandateCache()
+  key = jws.signing_key("user_device")
+  payment_mandate = _signed_payment_mandate(key)
+  cache.verify(payment_mandate)
+
+  # Another agent revokes the key by removing its published public key.
+  os.remove(jws._public_key_path("user_device", key.kid))
+
+  with pytest.raises(jws.InvalidTokenError, match="revoked"):
+    cache.verify(payment_mandate)
+  assert cache.hits == 0
+
+
+def test_verify_reverifies_after_the_ttl():
+  cache = verified_mandate_cache.VerifiedMandateCache(max_ttl_seconds=0)
+  payment_mandate = _signed_payment_mandate(jws.signing_key("user_device"))
+
+  cache.verify(payment_mandate)
+  cache.verify(payment_mandate)
+
+  assert (cache.misses, cache.hits) == (2, 0)
+
+
+def test_verify_rejects_and_does_not_cache_a_forged_mandate():
+  cache = verified_mandate_cache.VerifiedMandateCache()
+  payment_mandate = _signed_payment_mandate(jws.signing_key("merchant_agent"))
+
+  for _ in range(2):
+    with pytest.raises(jws.InvalidTokenError, match="user_device"):
+      cache.verify(payment_mandate)
+
+  assert (cache.misses, cache.hits) == (2, 0)
+
+
+def test_verify_does_not_serve_a_mandate_verified_for_another_signer():
+  cache = verified_mandate_cache.VerifiedMandateCache()
+  payment_mandate = _signed_payment_mandate(jws.signing_key("other_device"))
+  cache.verify(payment_mandate, signer="other_device")
+
+  with pytest.raises(jws.InvalidTokenError, match="user_device"):
+    cache.verify(payment_mandate)
+  assert cache.hits == 0
@@ -0,0 +1,68 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for watch_log."""
+
+import pytest
+
+from common import watch_log
+
+
+def test_sampling_policy_from_env_defaults_to_logging_everything():
+  policy = watch_log.sampling_policy_from_env({})
+
+  assert policy.should_log("risk_data")
+  assert policy.format_value({"a": "x" * 5000}) == (
+      '{"a": "' + "x" * 5000 + '"}'
+  )
+
+
+def test_sampling_policy_from_env_reads_rates_and_size():
+  policy = watch_log.sampling_policy_from_env({
+      watch_log.SAMPLE_RATE_ENV_VAR: "0",
+      watch_log.SAMPLE_RATES_ENV_VAR: "ap2.mandates.CartMandate=1, risk_data=0",
+      watch_log.MAX_VALUE_CHARS_ENV_VAR: "10",
+  })
+
+  assert policy.should_log("ap2.mandates.CartMandate")
+  assert not policy.should_log("risk_data")
+  assert not policy.should_log("debug_mode")
+  assert policy.format_value("x" * 20) == '"xxxxxxxxx...<truncated 12 chars>'
+
+
+@pytest.mark.parametrize(
+    "environ",
+    [
+        {watch_log.SAMPLE_RATE_ENV_VAR: "1.5"},
+        {watch_log.SAMPLE_RATE_ENV_VAR: "often"},
+        {watch_log.SAMPLE_RATES_ENV_VAR: "risk_data"},
+        {watch_log.SAMPLE_RATES_ENV_VAR: "=0.5"},
+        {watch_log.MAX_VALUE_CHARS_ENV_VAR: "-1"},
+    ],
+)
+def test_sampling_policy_from_env_rejects_invalid_values(environ):
+  with pytest.raises(ValueError):
+    watch_log.sampling_policy_from_env(environ)
+
+
+def test_format_value_redacts_sensitive_fields_at_any_depth():
+  policy = watch_log.SamplingPolicy()
+
+  assert policy.format_value(
+      {"details": {"token": {"value": "secret"}}, "user_authorization": "jws"}
+  ) == (
+      '{"details": {"token": "<redacted>"}, "user_authorization":'
+      ' "<redacted>"}'
+  )
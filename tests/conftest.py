@@ -0,0 +1,31 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Shared test setup."""
+
+import logging
+
+import pytest
+
+from common import watch_log
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _no_watch_log_file():
+  """Keeps watch_log from opening .logs/watch.log in the working directory."""
+  handler = logging.NullHandler()
+  watch_log._logger.addHandler(handler)
+  yield
+  watch_log._logger.removeHandler(handler)
@@ -0,0 +1,120 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the merchant agent's storage."""
+
+import asyncio
+from datetime import datetime
+from datetime import timezone
+import time
+
+import pytest
+
+from benchmarks import payloads
+from roles.merchant_agent import storage
+
+
+@pytest.fixture(autouse=True)
+def _empty_storage(monkeypatch):
+  monkeypatch.setattr(storage, "_store", {})
+  monkeypatch.setattr(storage, "_expiry_heap", [])
+  monkeypatch.setattr(storage, "_cart_ids_by_payment_details_id", {})
+  monkeypatch.setattr(storage, "_sweeper", None)
+
+
+def _cart(expires_at: float):
+  cart = payloads.cart_mandate()
+  cart.contents.cart_expiry = datetime.fromtimestamp(
+      expires_at, timezone.utc
+  ).isoformat()
+  return cart
+
+
+def test_expired_entries_are_not_returned():
+  now = time.time()
+  storage.set_cart_mandate("cart_1", _cart(now - 1))
+  storage.set_risk_data("context_1", "fake_risk_data", now - 1)
+
+  assert storage.get_cart_mandate("cart_1") is None
+  assert storage.get_cart_mandate_by_payment_details_id("order_1") is None
+  assert storage.get_risk_data("context_1") is None
+
+
+def test_valid_entries_are_returned():
+  cart = _cart(time.time() + 60)
+  storage.set_cart_mandate("cart_1", cart)
+
+  assert storage.get_cart_mandate("cart_1") is cart
+  assert storage.get_cart_mandate_by_payment_details_id("order_1") is cart
+
+
+def test_sweep_evicts_expired_entries_in_expiry_order():
+  storage.set_risk_data("late", "c", 300.0)
+  storage.set_risk_data("early", "a", 100.0)
+  storage.set_risk_data("middle", "b", 200.0)
+
+  assert storage.sweep(now=150.0) == 1
+  assert sorted(key for _, key in storage._store) == ["late", "middle"]
+  assert storage.sweep(now=250.0) == 1
+  assert [key for _, key in storage._store] == ["late"]
+  assert storage.sweep(now=250.0) == 0
+  # Only the valid entry is left on the heap; it was never scanned.
+  assert [key for *_, key in storage._expiry_heap] == ["late"]
+
+
+def test_sweep_evicts_the_payment_details_index_with_the_cart():
+  storage.set_cart_mandate("cart_1", _cart(100.0))
+
+  assert storage.sweep(now=150.0) == 1
+  assert not storage._cart_ids_by_payment_details_id
+
+
+def test_storing_a_key_again_extends_its_expiry():
+  now = time.time()
+  storage.set_risk_data("context_1", "stale", now - 1)
+  storage.set_risk_data("context_1", "fresh", now + 60)
+
+  assert storage.get_risk_data("context_1") == "fresh"
+  # The first heap entry is now stale, so sweeping it keeps the entry.
+  assert storage.sweep(now=now) == 0
+  assert storage.get_risk_data("context_1") == "fresh"
+
+
+def test_storing_a_key_again_shortens_its_expiry():
+  now = time.time()
+  storage.set_risk_data("context_1", "long", now + 60)
+  storage.set_risk_data("context_1", "short", now - 1)
+
+  assert storage.get_risk_data("context_1") is None
+  assert storage.sweep(now=now) == 1
+  assert storage.sweep(now=now + 120) == 0
+
+
+def test_sweeper_starts_with_the_first_entry_and_stops_when_empty(
+    monkeypatch,
+):
+  monkeypatch.setattr(storage, "SWEEP_INTERVAL_SECONDS", 0)
+
+  async def run():
+    storage.set_risk_data("context_1", "fake_risk_data", time.time() - 1)
+    sweeper = storage._sweeper
+    await asyncio.wait_for(sweeper, timeout=1)
+    return sweeper
+
+  sweeper = asyncio.run(run())
+
+  assert sweeper.done()
+  assert not storage._store
+  assert not storage._expiry_heap
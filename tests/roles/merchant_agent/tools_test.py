@@ -0,0 +1,83 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the merchant agent's tools."""
+
+import asyncio
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+import pytest
+
+from ap2.types import wire
+from ap2.types.mandate import PAYMENT_MANDATE_DATA_KEY
+from benchmarks import payloads
+from roles.merchant_agent import storage
+from roles.merchant_agent import tools
+
+
+class _FakeUpdater:
+  """Records the message a task is failed with."""
+
+  context_id = "context_1"
+  failure = None
+
+  def new_agent_message(self, parts):
+    return parts
+
+  async def failed(self, message):
+    self.failure = message[0].root.text
+
+
+@pytest.fixture(autouse=True)
+def _empty_storage(monkeypatch):
+  monkeypatch.setattr(storage, "_store", {})
+  monkeypatch.setattr(storage, "_expiry_heap", [])
+  monkeypatch.setattr(storage, "_cart_ids_by_payment_details_id", {})
+  monkeypatch.setattr(storage, "_sweeper", None)
+
+
+def _initiate_payment() -> _FakeUpdater:
+  payment_mandate = payloads.payment_mandate()
+  updater = _FakeUpdater()
+  data_parts = [
+      {PAYMENT_MANDATE_DATA_KEY: wire.to_wire(payment_mandate)},
+      {"risk_data": "fake_risk_data"},
+  ]
+  asyncio.run(tools.initiate_payment(data_parts, updater, None))
+  return updater
+
+
+def test_initiate_payment_rejects_an_expired_cart():
+  cart = payloads.cart_mandate()
+  cart.contents.cart_expiry = (
+      datetime.now(timezone.utc) - timedelta(seconds=1)
+  ).isoformat()
+  storage.set_cart_mandate("cart_1", cart)
+  payment_details_id = cart.contents.payment_request.details.id
+
+  updater = _initiate_payment()
+
+  assert updater.failure == (
+      "CartMandate not found or expired for payment_details_id:"
+      f" {payment_details_id}"
+  )
+
+
+def test_initiate_payment_rejects_an_unknown_cart():
+  updater = _initiate_payment()
+
+  assert updater.failure.startswith("CartMandate not found or expired")